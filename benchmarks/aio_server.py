@@ -0,0 +1,157 @@
+"""Local server answering like Adafruit IO, for the benchmarks.
+
+Responses have the shape and size of real Adafruit IO responses for the
+scoreboard's feeds, so bytes and heap measured against it carry over. The
+server runs in its own process, so its allocations don't show up in the
+benchmark's heap measurements.
+"""
+
+import json
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.process import BaseProcess
+
+GROUP_KEY = "scores-group"
+FEED_NAMES = (
+    "left-team-score",
+    "right-team-score",
+    "left-team-name",
+    "right-team-name",
+    "first-point-gender",
+    "game-state",
+)
+
+
+def _data_point(feed_key: str, value: str) -> dict:
+    """Build a data point as Adafruit IO returns it."""
+    return {
+        "id": "0F9XYZ3T6Q1E0AB2CD3EF4GH5J",
+        "value": value,
+        "feed_id": 2911742,
+        "feed_key": feed_key,
+        "created_at": "2025-06-14T18:22:05Z",
+        "created_epoch": 1749925325,
+        "expiration": "2025-07-14T18:22:05Z",
+        "location": None,
+        "lat": None,
+        "lon": None,
+        "ele": None,
+    }
+
+
+def _feed(name: str, value: str) -> dict:
+    """Build a feed structure as Adafruit IO returns it in a group."""
+    group = {"id": 123456, "key": GROUP_KEY, "name": GROUP_KEY, "user_id": 812345}
+    return {
+        "username": "scoreboard",
+        "owner": {"id": 812345, "username": "scoreboard"},
+        "id": 2911742,
+        "name": name,
+        "description": f"The scoreboard's {name.replace('-', ' ')}",
+        "license": None,
+        "history": True,
+        "enabled": True,
+        "visibility": "private",
+        "unit_type": None,
+        "unit_symbol": None,
+        "last_value": value,
+        "created_at": "2025-03-02T15:04:11Z",
+        "updated_at": "2025-06-14T18:22:05Z",
+        "wipper_pin_info": None,
+        "wipper_semantic_description": None,
+        "key": f"{GROUP_KEY}.{name}",
+        "writable": True,
+        "group": group,
+        "groups": [group],
+        "feed_webhook_receivers": [],
+        "feed_status_changes": [],
+        "status_notify": False,
+        "status_timeout": 4320,
+        "status": "online",
+    }
+
+
+def feed_details(name: str, value: str) -> dict:
+    """Build a /feeds/{key}/details response."""
+    point = _data_point(f"{GROUP_KEY}.{name}", value)
+    return {
+        **_feed(name, value),
+        "details": {"shared_with": [], "data": {"first": point, "last": point, "count": 1834}},
+    }
+
+
+def group(values: dict[str, str]) -> dict:
+    """Build a /groups/{key} response with the given last value per feed name."""
+    return {
+        "id": 123456,
+        "name": GROUP_KEY,
+        "description": "Ultimate scoreboard",
+        "created_at": "2025-03-02T15:04:11Z",
+        "updated_at": "2025-06-14T18:22:05Z",
+        "key": GROUP_KEY,
+        "owner": {"id": 812345, "username": "scoreboard"},
+        "user_id": 812345,
+        "feeds": [_feed(name, values.get(name, "")) for name in FEED_NAMES],
+        "visibility": "private",
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves group, feed details and last-value responses, and accepts writes."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes, don't let Nagle delay the body
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+    def do_GET(self):
+        """Handle GET requests."""
+        values = {"left-team-score": "7", "right-team-score": "5"}
+        if self.path.endswith(f"/groups/{GROUP_KEY}"):
+            value = group(values)
+        elif self.path.endswith("/details"):
+            value = feed_details("left-team-score", values["left-team-score"])
+        else:
+            value = {"value": values["left-team-score"]}
+        self._send_json(value)
+
+    def do_POST(self):
+        """Handle data writes, answering with the created data points."""
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if "feeds" in payload:
+            points = [_data_point(feed["key"], str(feed["value"])) for feed in payload["feeds"]]
+            self._send_json(points)
+        else:
+            self._send_json(_data_point(GROUP_KEY, str(payload["value"])))
+
+    def _send_json(self, value) -> None:
+        """Send a JSON response."""
+        body = json.dumps(value).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_server() -> tuple[BaseProcess, str]:
+    """Start the server in a child process.
+
+    :return: Tuple of (server process, base URL to pass to AsyncIOClient)
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    process = multiprocessing.get_context("fork").Process(
+        target=server.serve_forever, daemon=True
+    )
+    process.start()
+    # The child process keeps serving on its copy of the listening socket
+    server.server_close()
+    return process, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def stop_server(process: BaseProcess) -> None:
+    """Stop a server started with start_server."""
+    process.terminate()
+    process.join()
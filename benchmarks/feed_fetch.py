@@ -0,0 +1,64 @@
+"""Benchmark bytes transferred and heap used per single-feed fetch.
+
+Fetches a feed's last value both through the detailed feed structure and
+through the lean last-value endpoint, reporting the average bytes on the wire
+and peak heap per fetch.
+
+Run with ``uv run python -m benchmarks.feed_fetch``. Heap is measured with
+tracemalloc, so this runs on CPython only.
+"""
+
+import asyncio
+import socket
+import tracemalloc
+
+from benchmarks.aio_server import GROUP_KEY, start_server, stop_server
+from src.adafruit_io_client import AsyncIOClient
+from src.async_http import AsyncHttpClient
+
+FEED_KEY = f"{GROUP_KEY}.left-team-score"
+FETCHES = 50
+
+
+async def _fetch_details(io_client: AsyncIOClient) -> str:
+    feed = await io_client.get_feed(FEED_KEY, detailed=True)
+    return feed["details"]["data"]["last"]["value"]
+
+
+async def _fetch_last_value(io_client: AsyncIOClient) -> str:
+    return await io_client.get_last_value(FEED_KEY)
+
+
+async def _measure(base_url: str, fetch) -> tuple[float, float]:
+    """Fetch FETCHES times over one kept-alive connection.
+
+    :return: Tuple of (bytes received per fetch, peak heap bytes per fetch)
+    """
+    http = AsyncHttpClient(socket)
+    io_client = AsyncIOClient(http, "scoreboard", "aio_key", base_url=base_url)
+    # Warm up the connection so connecting doesn't count against either path
+    await fetch(io_client)
+    received = http.bytes_received
+    peak_total = 0
+    for _ in range(FETCHES):
+        tracemalloc.start()
+        await fetch(io_client)
+        peak_total += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    http.close()
+    return (http.bytes_received - received) / FETCHES, peak_total / FETCHES
+
+
+def main() -> None:
+    """Run the benchmark and print one line per fetch path."""
+    server, base_url = start_server()
+    try:
+        for name, fetch in (("detailed", _fetch_details), ("last value", _fetch_last_value)):
+            received, peak = asyncio.run(_measure(base_url, fetch))
+            print(f"{name:>10}: {received:6.0f} bytes received, {peak:7.0f} bytes peak heap")
+    finally:
+        stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
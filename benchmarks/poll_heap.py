@@ -0,0 +1,62 @@
+"""Benchmark heap churn of group polls over a simulated day of play.
+
+Runs as many group polls as the scoreboard makes in eight hours at its fastest
+poll interval, once decoding the whole response and once decoding only the
+fields the scoreboard reads, and reports the heap each poll allocates. Heap a
+poll allocates and frees again is what gc.mem_free() sees as churn on the
+board, and what fragments its heap over a long day.
+
+Run with ``uv run python -m benchmarks.poll_heap``. Heap is measured with
+tracemalloc, so this runs on CPython only.
+"""
+
+import asyncio
+import socket
+import tracemalloc
+
+from benchmarks.aio_server import GROUP_KEY, start_server, stop_server
+from src.adafruit_io_client import AsyncIOClient
+from src.async_http import AsyncHttpClient
+from src.poll_scheduler import DEFAULT_MIN_POLL_INTERVAL
+from src.transports.adafruit_io import GROUP_FIELDS
+
+POLLS = int(8 * 60 * 60 / DEFAULT_MIN_POLL_INTERVAL)
+
+
+async def _measure(base_url: str, fields: tuple[str, ...] | None) -> tuple[float, int]:
+    """Poll the group POLLS times.
+
+    :return: Tuple of (mean peak heap per poll, largest peak heap of any poll)
+    """
+    http = AsyncHttpClient(socket)
+    io_client = AsyncIOClient(http, "scoreboard", "aio_key", base_url=base_url)
+    await io_client.get_group(GROUP_KEY, fields=fields)
+    tracemalloc.start()
+    total = 0
+    largest = 0
+    for _ in range(POLLS):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await io_client.get_group(GROUP_KEY, fields=fields)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        total += peak
+        largest = max(largest, peak)
+    tracemalloc.stop()
+    http.close()
+    return total / POLLS, largest
+
+
+def main() -> None:
+    """Run the benchmark and print one line per decoding mode."""
+    server, base_url = start_server()
+    print(f"{POLLS} group polls, {DEFAULT_MIN_POLL_INTERVAL:.0f}s apart for 8 hours")
+    try:
+        for name, fields in (("full json", None), ("fields only", GROUP_FIELDS)):
+            mean, largest = asyncio.run(_measure(base_url, fields))
+            print(f"{name:>11}: {mean:7.0f} bytes per poll on average, {largest:7d} at most")
+    finally:
+        stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark each transport side by side.
+
+Times a batched write of the scoreboard's feeds and a read of the whole scores
+group through every transport, on this machine:
+
+- aio: the Adafruit IO HTTP transport against the local Adafruit IO server
+- mqtt: the MQTT transport against the in-process fake broker, so only the
+  transport's own overhead is measured
+- lan: the LAN transport multicasting on loopback
+- memory and file: the local transports
+
+Run with ``uv run python -m benchmarks.transports``.
+"""
+
+import asyncio
+import contextlib
+import io
+import socket
+import tempfile
+import time
+
+from benchmarks.aio_server import start_server, stop_server
+from fakes import FakeMatrixPortal, FakeMQTTBroker, FakeMQTTClient
+from src.adafruit_io_client import AsyncIOClient
+from src.async_http import AsyncHttpClient
+from src.network_manager import NetworkManager
+from src.transports.adafruit_io import AdafruitIOTransport
+from src.transports.lan import LanTransport
+from src.transports.memory import FileTransport, MemoryTransport
+from src.transports.mqtt import MqttTransport
+
+ROUNDS = 200
+WRITE = {
+    NetworkManager.SCORES_LEFT_TEAM_FEED: 7,
+    NetworkManager.SCORES_RIGHT_TEAM_FEED: 5,
+    NetworkManager.FIRST_POINT_GENDER_FEED: "MMP",
+}
+
+
+async def _measure(transport) -> tuple[float, float]:
+    """Write and read ROUNDS times.
+
+    :return: Tuple of (milliseconds per write, milliseconds per read)
+    """
+    # Warm up connections so connecting doesn't count
+    await transport.write_many(WRITE)
+    await transport.read_many(NetworkManager.SCORES_GROUP_FEEDS)
+    write_time = 0.0
+    read_time = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        await transport.write_many(WRITE)
+        write_time += time.perf_counter() - start
+        start = time.perf_counter()
+        await transport.read_many(NetworkManager.SCORES_GROUP_FEEDS)
+        read_time += time.perf_counter() - start
+    return write_time * 1000 / ROUNDS, read_time * 1000 / ROUNDS
+
+
+def _transports(base_url: str, directory: str) -> list:
+    """Create one of each transport."""
+    http = AsyncHttpClient(socket)
+    io_client = AsyncIOClient(http, "scoreboard", "aio_key", base_url=base_url)
+    return [
+        AdafruitIOTransport(FakeMatrixPortal(), io_client),
+        MqttTransport(FakeMQTTClient(FakeMQTTBroker()), "scoreboard"),
+        LanTransport(socket, interface="127.0.0.1"),
+        MemoryTransport(),
+        FileTransport(f"{directory}/feeds.json"),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print one line per transport."""
+    server, base_url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for transport in _transports(base_url, directory):
+                try:
+                    # The transports log every update they receive
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        write_ms, read_ms = asyncio.run(_measure(transport))
+                except ConnectionError as e:
+                    print(f"{transport.name:>6}: unavailable ({e})")
+                    continue
+                print(
+                    f"{transport.name:>6}: {write_ms:7.3f} ms per write, "
+                    f"{read_ms:7.3f} ms per read"
+                )
+    finally:
+        stop_server(server)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ from src.game_controller import GameController
 from src.gender_manager import GenderManager
 from src.hardware_manager import BUTTON_DOWN, BUTTON_UP, HardwareManager
 from src.network_manager import NetworkManager
+from src.request_budget import RequestBudget
 from src.score_manager import ScoreManager
 
 # Mock CircuitPython-specific modules that don't exist in regular Python
@@ -69,9 +70,17 @@ def fake_matrix_portal():
 
 
 @pytest.fixture
-def network_manager(fake_matrix_portal, display_manager):
+def request_budget():
+    """Create a RequestBudget large enough that tests are never rate limited."""
+    return RequestBudget(rate_per_minute=60000)
+
+
+@pytest.fixture
+def network_manager(fake_matrix_portal, display_manager, request_budget):
     """Create NetworkManager instance with fake hardware."""
-    return NetworkManager(fake_matrix_portal, display_manager)
+    return NetworkManager(
+        fake_matrix_portal, display_manager, request_budget=request_budget
+    )
 
 
 @pytest.fixture
@@ -81,15 +90,21 @@ def display_manager(fake_matrix_portal):
 
 
 @pytest.fixture
-def score_manager(network_manager):
+def sync_clock():
+    """Clock of the sync managers, whose time only moves when the test sets it."""
+    return MagicMock(return_value=100.0)
+
+
+@pytest.fixture
+def score_manager(network_manager, sync_clock):
     """Create ScoreManager instance with network manager."""
-    return ScoreManager(network_manager)
+    return ScoreManager(network_manager, clock=sync_clock)
 
 
 @pytest.fixture
-def gender_manager(network_manager):
+def gender_manager(network_manager, sync_clock):
     """Create GenderManager instance with network manager."""
-    return GenderManager(network_manager)
+    return GenderManager(network_manager, clock=sync_clock)
 
 
 @pytest.fixture
@@ -4,7 +4,8 @@ from .fake_button import FakeButton
 from .fake_displayio import FakeGroup
 from .fake_keypad import FakeKeys
 from .fake_label import FakeLabel
-from .fake_matrixportal import FakeDisplay, FakeMatrixPortal
+from .fake_matrixportal import FakeDisplay, FakeIOClient, FakeMatrixPortal, FakeNetwork
+from .fake_mqtt import FakeMQTTBroker, FakeMQTTClient
 
 # Provide a fake FONT constant for terminalio.FONT
 FakeTerminalio = type("FakeTerminalio", (), {"FONT": object()})()
@@ -12,9 +13,13 @@ FakeTerminalio = type("FakeTerminalio", (), {"FONT": object()})()
 __all__ = [
     "FakeMatrixPortal",
     "FakeDisplay",
+    "FakeIOClient",
+    "FakeNetwork",
     "FakeGroup",
     "FakeLabel",
     "FakeTerminalio",
     "FakeButton",
     "FakeKeys",
+    "FakeMQTTBroker",
+    "FakeMQTTClient",
 ]
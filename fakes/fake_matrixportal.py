@@ -19,6 +19,40 @@ class FakeDisplay:
         self._root_group = value
 
 
+class FakeIOClient:
+    """Fake implementation of adafruit_io.IO_HTTP for testing."""
+
+    def __init__(self, matrixportal):
+        """Initialize a fake IO client backed by a fake matrix portal's feeds.
+
+        :param matrixportal: FakeMatrixPortal whose feed data is read and written
+        """
+        self._matrixportal = matrixportal
+        self.group_data_calls = []
+
+    def send_group_data(self, group_key, feeds_and_data, metadata=None):
+        """Send data to several feeds in a group in one request.
+
+        :param group_key: The group key to send to
+        :param feeds_and_data: List of dicts with feed "key" and "value" entries
+        :param metadata: Optional metadata (ignored in fake)
+        """
+        self.group_data_calls.append((group_key, feeds_and_data))
+        for feed in feeds_and_data:
+            self._matrixportal.push_to_io(f"{group_key}.{feed['key']}", feed["value"])
+
+
+class FakeNetwork:
+    """Fake implementation of adafruit_matrixportal.network.Network for testing."""
+
+    def __init__(self, matrixportal):
+        """Initialize a fake network with a fake IO client.
+
+        :param matrixportal: FakeMatrixPortal the IO client reads and writes
+        """
+        self.io_client = FakeIOClient(matrixportal)
+
+
 class FakeMatrixPortal:
     """Fake implementation of MatrixPortal for testing without hardware."""
 
@@ -29,7 +63,10 @@ class FakeMatrixPortal:
         but doesn't use them since this is a fake.
         """
         self._display = FakeDisplay()
+        self._network = FakeNetwork(self)
         self._feed_data = {}
+        self._feed_updated_at = {}
+        self._writes = 0
         self._pushed_data = {}
 
     @property
@@ -37,6 +74,11 @@ class FakeMatrixPortal:
         """Get the display object."""
         return self._display
 
+    @property
+    def network(self):
+        """Get the network object."""
+        return self._network
+
     def set_feed_value(self, feed_key, value):
         """Set a value for a feed key for testing.
 
@@ -44,6 +86,15 @@ class FakeMatrixPortal:
         :param value: The value to return for this feed
         """
         self._feed_data[feed_key] = value
+        self._touch(feed_key)
+
+    def _touch(self, feed_key):
+        """Bump a feed's updated_at timestamp, like Adafruit IO does on writes.
+
+        :param feed_key: The feed key written to
+        """
+        self._writes += 1
+        self._feed_updated_at[feed_key] = f"2025-01-01T00:00:00.{self._writes:06d}Z"
 
     def get_io_feed(self, feed_key, detailed=False):
         """Get an IO feed value.
@@ -74,6 +125,28 @@ class FakeMatrixPortal:
                 }
         return value
 
+    def get_io_group(self, group_key):
+        """Get an IO group with the last value of each feed in it.
+
+        Feeds belong to the group when their key starts with ``group_key.``.
+
+        :param group_key: The group key to retrieve
+        :return: Group data structure
+        """
+        prefix = f"{group_key}."
+        return {
+            "key": group_key,
+            "feeds": [
+                {
+                    "key": feed_key,
+                    "last_value": value,
+                    "updated_at": self._feed_updated_at[feed_key],
+                }
+                for feed_key, value in self._feed_data.items()
+                if feed_key.startswith(prefix)
+            ],
+        }
+
     def push_to_io(self, feed_key, data, metadata=None, precision=None):
         """Push a value to an IO feed.
 
@@ -84,6 +157,7 @@ class FakeMatrixPortal:
         """
         self._pushed_data[feed_key] = data
         self._feed_data[feed_key] = data
+        self._touch(feed_key)
 
     def get_pushed_value(self, feed_key):
         """Get the last pushed value for a feed key (for testing).
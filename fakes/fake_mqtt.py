@@ -0,0 +1,114 @@
+"""Fake MQTT broker and client for testing without a network."""
+
+
+class FakeMQTTBroker:
+    """Local stand-in for an MQTT broker such as io.adafruit.com.
+
+    Delivers published messages to every client subscribed to the topic and
+    retains the last message per topic. Publishing to ``<topic>/get`` re-sends the
+    retained message to the publisher, like Adafruit IO does.
+    """
+
+    def __init__(self):
+        """Initialize a broker with no clients or retained messages."""
+        self._subscriptions = {}
+        self._retained = {}
+        self.published = []
+
+    def subscribe(self, client, topic):
+        """Subscribe a client to a topic.
+
+        :param client: FakeMQTTClient to deliver messages to
+        :param topic: The topic to subscribe to
+        """
+        self._subscriptions.setdefault(topic, []).append(client)
+
+    def publish(self, topic, message, sender=None):
+        """Publish a message to every subscriber of a topic.
+
+        :param topic: The topic to publish to
+        :param message: The message payload
+        :param sender: Client that published the message, if any
+        """
+        self.published.append((topic, message))
+        if topic.endswith("/get"):
+            feed_topic = topic[: -len("/get")]
+            if sender is not None and feed_topic in self._retained:
+                sender.deliver(feed_topic, self._retained[feed_topic])
+            return
+        self._retained[topic] = message
+        for client in self._subscriptions.get(topic, []):
+            client.deliver(topic, message)
+
+
+class FakeMQTTClient:
+    """Fake implementation of adafruit_minimqtt.MQTT connected to a FakeMQTTBroker.
+
+    Messages are queued on delivery and passed to on_message during loop(), like
+    the real client.
+    """
+
+    def __init__(self, broker):
+        """Initialize a disconnected client.
+
+        :param broker: FakeMQTTBroker to connect to
+        """
+        self._broker = broker
+        self._connected = False
+        self._inbox = []
+        self.on_message = None
+        self.fail_connect = False
+
+    def connect(self):
+        """Connect to the broker.
+
+        :raises OSError: If fail_connect is set
+        """
+        if self.fail_connect:
+            raise OSError("Broker unreachable")
+        self._connected = True
+
+    def disconnect(self):
+        """Disconnect from the broker."""
+        self._connected = False
+
+    def is_connected(self):
+        """Check if the client is connected to the broker."""
+        return self._connected
+
+    def subscribe(self, topic, qos=0):
+        """Subscribe to a topic.
+
+        :param topic: The topic to subscribe to
+        :param qos: Quality of service level (ignored in fake)
+        """
+        self._broker.subscribe(self, topic)
+
+    def publish(self, topic, msg, retain=False, qos=0):
+        """Publish a message through the broker.
+
+        :param topic: The topic to publish to
+        :param msg: The message payload
+        :param retain: Whether to retain the message (ignored in fake)
+        :param qos: Quality of service level (ignored in fake)
+        """
+        self._broker.publish(topic, msg, sender=self)
+
+    def deliver(self, topic, message):
+        """Queue a message from the broker for the next loop() call.
+
+        :param topic: The topic the message was published to
+        :param message: The message payload
+        """
+        if self._connected:
+            self._inbox.append((topic, message))
+
+    def loop(self, timeout=1.0):
+        """Pass every queued message to on_message.
+
+        :param timeout: Maximum time to wait for messages (ignored in fake)
+        """
+        while self._inbox:
+            topic, message = self._inbox.pop(0)
+            if self.on_message is not None:
+                self.on_message(self, topic, message)
@@ -1,8 +1,12 @@
 import asyncio
+import os
 
 import board
 from adafruit_matrixportal.matrixportal import MatrixPortal
 
+from src.adafruit_io_client import AsyncIOClient
+from src.async_http import AsyncHttpClient
+from src.cycle_budget import DEFAULT_CYCLE_BUDGET, CycleBudget
 from src.display_manager import DisplayManager
 from src.game_controller import GameController
 from src.gender_manager import GenderManager
@@ -12,42 +16,105 @@ from src.hardware_manager import (
     HardwareManager,
     create_keys_from_board,
 )
-from src.network_manager import NetworkManager
+from src.lan_sync import DEFAULT_GROUP, DEFAULT_PORT, LanSync
+from src.mqtt_subscriber import MQTT_LOOP_TIMEOUT, MqttSubscriber
+from src.network_manager import READ_YOUR_WRITES_WINDOW, NetworkManager
 from src.network_patches import apply_network_patches
+from src.outbound_journal import OutboundJournal
+from src.poll_scheduler import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    PollScheduler,
+)
+from src.protocols import MatrixPortalLike, Transport
+from src.request_budget import DEFAULT_RATE_PER_MINUTE, RequestBudget
+from src.rtt_estimator import DEFAULT_MAX_TIMEOUT, DEFAULT_MIN_TIMEOUT, RttEstimator
 from src.score_manager import ScoreManager
-
-NETWORK_UPDATE_DELAY = 5.0
+from src.sync_manager import COALESCE_MAX_DELAY, COALESCE_WINDOW
+from src.sync_queue import PRIORITY_READ, SyncQueue
+from src.transports.adafruit_io import AdafruitIOTransport
+from src.transports.lan import LanTransport
+from src.transports.mqtt import MqttTransport
+from src.wifi_supervisor import BOOT_LINK_TIMEOUT, WifiSupervisor
 
 
 async def sync_and_fetch_updates(
-    score_manager: ScoreManager,
-    gender_manager: GenderManager,
+    sync_queue: SyncQueue,
     game_controller: GameController,
+    poll_scheduler: PollScheduler,
+    request_budget: RequestBudget,
+    mqtt_subscriber: MqttSubscriber | None = None,
+    lan_sync: LanSync | None = None,
+    cycle_budget: CycleBudget | None = None,
+    wifi_supervisor: WifiSupervisor | None = None,
 ):
-    """Periodically sync pending changes and fetch network updates.
+    """Sync pending changes and fetch network updates on an adaptive schedule.
+
+    The sync queue pushes the pending changes of every registered manager
+    together in one batched write as soon as they happen, scores first when the
+    request budget can't cover them all, then fetches updates from the network
+    whenever the poll scheduler says a poll is due. Activity shortens the poll
+    interval and quiet polls lengthen it, and the poll interval never drops below
+    what the request budget can sustain. While the MQTT subscription is live,
+    updates arrive as they happen, so the fetch only runs at the scheduler's
+    ceiling as a fallback. With LAN sync, local changes also go straight to peer
+    boards before the push.
 
-    First syncs any pending score and gender changes, then fetches updates
-    from the network.
+    Each pass through the loop gets a deadline from the cycle budget, so a slow
+    network holds up the next sync by at most the budget, and a poll that can't
+    start before it is dropped.
+
+    At boot, the loop first waits up to BOOT_LINK_TIMEOUT for the Wi-Fi
+    supervisor to bring the link up, so the first pushes and polls don't fail
+    while it connects. Changes made meanwhile are kept and pushed after.
     """
+    if cycle_budget is None:
+        cycle_budget = CycleBudget()
+    if wifi_supervisor is not None:
+        await wifi_supervisor.wait_for_link(BOOT_LINK_TIMEOUT)
+
+    async def poll() -> None:
+        state_before = sync_queue.get_local_feed_values()
+        await game_controller.update_from_network()
+        poll_scheduler.record_poll()
+        if sync_queue.get_local_feed_values() != state_before:
+            poll_scheduler.record_remote_activity()
+        elif not had_local_changes:
+            poll_scheduler.record_idle()
+
     while True:
-        if score_manager.has_pending_changes():
-            await score_manager.try_sync_scores()
-        await asyncio.sleep(0)
+        cycle_budget.start_cycle()
+        had_local_changes = sync_queue.has_pending_changes()
+        if had_local_changes:
+            if lan_sync is not None:
+                lan_sync.broadcast(sync_queue.get_local_feed_values())
+            poll_scheduler.record_local_activity()
 
-        if gender_manager.has_pending_changes():
-            await gender_manager.try_sync_gender()
-        await asyncio.sleep(0)
+        poll_scheduler.set_rate_floor(request_budget.recommended_poll_interval())
+        if mqtt_subscriber is not None and mqtt_subscriber.is_connected:
+            poll_scheduler.record_subscribed()
+        if poll_scheduler.is_poll_due():
+            sync_queue.submit(PRIORITY_READ, poll, timeout=cycle_budget.remaining())
 
-        await game_controller.update_from_network()
-        await asyncio.sleep(NETWORK_UPDATE_DELAY)
+        synced = await sync_queue.drain()
+        cycle_budget.end_cycle()
+
+        # Wake early once new local changes are due, but retry a failed sync on
+        # the schedule
+        await poll_scheduler.wait(wake_condition=sync_queue.is_sync_due if synced else None)
 
 
-async def initial_network_fetch(game_controller: GameController):
+async def initial_network_fetch(
+    game_controller: GameController, wifi_supervisor: WifiSupervisor | None = None
+):
     """One-time attempt to fetch initial values from network.
 
     Wraps network calls in try/except to handle network unavailability gracefully.
-    Runs once and exits, allowing the system to start with defaults.
+    Runs once and exits, allowing the system to start with defaults. Waits up to
+    BOOT_LINK_TIMEOUT for the Wi-Fi link first, while the buttons already work.
     """
+    if wifi_supervisor is not None:
+        await wifi_supervisor.wait_for_link(BOOT_LINK_TIMEOUT)
     try:
         await game_controller.update_from_network()
         await asyncio.sleep(0)
@@ -56,49 +123,304 @@ async def initial_network_fetch(game_controller: GameController):
         print(f"Initial network fetch failed: {e}")
 
 
+def create_rtt_estimator() -> RttEstimator:
+    """Create the estimator behind adaptive request timeouts.
+
+    The bounds come from SCOREBOARD_MIN_TIMEOUT and SCOREBOARD_MAX_TIMEOUT in
+    settings.toml, in seconds.
+
+    :return: RttEstimator
+    """
+    return RttEstimator(
+        min_timeout=float(os.getenv("SCOREBOARD_MIN_TIMEOUT") or DEFAULT_MIN_TIMEOUT),
+        max_timeout=float(os.getenv("SCOREBOARD_MAX_TIMEOUT") or DEFAULT_MAX_TIMEOUT),
+    )
+
+
+def aio_credentials() -> tuple[str, str]:
+    """Read the Adafruit IO username and key from settings.toml.
+
+    Missing credentials are reported here rather than at each use; requests
+    then fail to authenticate, and the board keeps working offline.
+
+    :return: Tuple of (username, key), empty strings for missing ones
+    """
+    username = os.getenv("ADAFRUIT_AIO_USERNAME") or ""
+    key = os.getenv("ADAFRUIT_AIO_KEY") or ""
+    if not username or not key:
+        print("ADAFRUIT_AIO_USERNAME and ADAFRUIT_AIO_KEY must be set in settings.toml")
+    return username, key
+
+
+def create_io_client(rtt_estimator: RttEstimator | None = None) -> AsyncIOClient:
+    """Create a non-blocking Adafruit IO client on the Wi-Fi radio's sockets.
+
+    :param rtt_estimator: Estimator providing adaptive request timeouts
+    :return: AsyncIOClient using credentials from settings.toml
+    """
+    import adafruit_connection_manager
+    import wifi
+
+    http = AsyncHttpClient(
+        adafruit_connection_manager.get_radio_socketpool(wifi.radio),
+        adafruit_connection_manager.get_radio_ssl_context(wifi.radio),
+        rtt_estimator=rtt_estimator,
+    )
+    return AsyncIOClient(http, *aio_credentials())
+
+
+def create_mqtt_client():
+    """Create a MiniMQTT client for Adafruit IO on the Wi-Fi radio's sockets.
+
+    :return: adafruit_minimqtt MQTT client using credentials from settings.toml
+    """
+    import adafruit_connection_manager
+    import adafruit_minimqtt.adafruit_minimqtt as MQTT
+    import wifi
+
+    username, key = aio_credentials()
+    return MQTT.MQTT(
+        broker="io.adafruit.com",
+        username=username,
+        password=key,
+        is_ssl=True,
+        socket_pool=adafruit_connection_manager.get_radio_socketpool(wifi.radio),
+        ssl_context=adafruit_connection_manager.get_radio_ssl_context(wifi.radio),
+        # Annotated as int, but any number of seconds works; loop() rejects a
+        # timeout shorter than this one
+        socket_timeout=MQTT_LOOP_TIMEOUT,  # pyrefly: ignore[bad-argument-type]
+    )
+
+
+def create_mqtt_subscriber(
+    game_controller: GameController, transport: Transport
+) -> MqttSubscriber | None:
+    """Create an MQTT subscriber for Adafruit IO if enabled in settings.toml.
+
+    Enabled by setting SCOREBOARD_USE_MQTT = 1. Not created with the MQTT
+    transport, which is subscribed to the same feeds already; a second session
+    would deliver every update twice.
+
+    :param game_controller: GameController that applies pushed feed updates
+    :param transport: Transport that carries the feed values
+    :return: MqttSubscriber, or None if MQTT is disabled
+    """
+    if os.getenv("SCOREBOARD_USE_MQTT") not in {"1", 1}:
+        return None
+    if isinstance(transport, MqttTransport):
+        print("SCOREBOARD_USE_MQTT is not needed with the mqtt transport, ignoring it")
+        return None
+    return MqttSubscriber(
+        create_mqtt_client(), aio_credentials()[0], game_controller.handle_feed_update
+    )
+
+
+def lan_settings() -> dict:
+    """Read the LAN multicast settings from settings.toml.
+
+    :return: Keyword arguments for LanSync and LanTransport
+    """
+    import adafruit_connection_manager
+    import wifi
+
+    return {
+        "socket_pool": adafruit_connection_manager.get_radio_socketpool(wifi.radio),
+        "group": os.getenv("SCOREBOARD_LAN_GROUP") or DEFAULT_GROUP,
+        "port": int(os.getenv("SCOREBOARD_LAN_PORT") or DEFAULT_PORT),
+        "interface": str(wifi.radio.ipv4_address),
+    }
+
+
+def create_transport(
+    matrixportal: MatrixPortalLike, rtt_estimator: RttEstimator | None = None
+) -> Transport:
+    """Create the transport selected in settings.toml.
+
+    Selected by SCOREBOARD_TRANSPORT: "aio" (the default) for the Adafruit IO
+    HTTP API, "mqtt" for Adafruit IO's MQTT broker, or "lan" for multicast
+    between the boards on the LAN only.
+
+    :param matrixportal: MatrixPortal used by the Adafruit IO transport
+    :param rtt_estimator: Estimator providing the Adafruit IO client's adaptive
+        request timeouts
+    :return: The transport
+    """
+    name = os.getenv("SCOREBOARD_TRANSPORT") or AdafruitIOTransport.name
+    if name == MqttTransport.name:
+        return MqttTransport(create_mqtt_client(), aio_credentials()[0])
+    if name == LanTransport.name:
+        return LanTransport(**lan_settings())
+    if name != AdafruitIOTransport.name:
+        print(f"Unknown transport {name}, using {AdafruitIOTransport.name}")
+    return AdafruitIOTransport(matrixportal, create_io_client(rtt_estimator))
+
+
+def create_wifi_supervisor(
+    matrixportal: MatrixPortalLike, network_manager: NetworkManager
+) -> WifiSupervisor:
+    """Create the supervisor that keeps the Wi-Fi link up.
+
+    Marks the link down until the supervisor reports it up.
+
+    :param matrixportal: MatrixPortal whose network connects to Wi-Fi
+    :param network_manager: NetworkManager told when the link goes up or down
+    :return: WifiSupervisor
+    """
+    import wifi
+
+    transport = network_manager.get_transport()
+    network_manager.set_link_up(False)
+    return WifiSupervisor(
+        matrixportal.network.connect,
+        lambda: wifi.radio.connected,
+        on_link_change=network_manager.set_link_up,
+        prewarm=transport.warm_up if isinstance(transport, AdafruitIOTransport) else None,
+    )
+
+
+def create_sync_managers(
+    network_manager: NetworkManager,
+) -> tuple[ScoreManager, GenderManager]:
+    """Create the score and gender managers, restoring changes lost in a reset.
+
+    Unsynced changes are journaled to microcontroller.nvm where the board has
+    it, and restored from it here. Bursts of changes are coalesced for
+    SCOREBOARD_COALESCE_WINDOW seconds, but never held back longer than
+    SCOREBOARD_COALESCE_MAX_DELAY. Scores are counted per board if
+    SCOREBOARD_REPLICA_ID is set, except with packed state, whose reads don't
+    include the counter feeds.
+
+    :param network_manager: NetworkManager used to push changes
+    :return: Tuple of (ScoreManager, GenderManager)
+    """
+    import microcontroller
+
+    journal = None
+    if microcontroller.nvm is not None:
+        journal = OutboundJournal(microcontroller.nvm)
+    coalesce_window = float(os.getenv("SCOREBOARD_COALESCE_WINDOW") or COALESCE_WINDOW)
+    coalesce_max_delay = float(os.getenv("SCOREBOARD_COALESCE_MAX_DELAY") or COALESCE_MAX_DELAY)
+    replica_id = os.getenv("SCOREBOARD_REPLICA_ID") or None
+    if replica_id is not None and os.getenv("SCOREBOARD_PACKED_STATE") in {"1", 1}:
+        print("Score counters don't work with packed state, not counting scores")
+        replica_id = None
+    score_manager = ScoreManager(
+        network_manager, journal, coalesce_window, coalesce_max_delay, replica_id=replica_id
+    )
+    gender_manager = GenderManager(network_manager, journal, coalesce_window, coalesce_max_delay)
+    score_manager.restore_from_journal()
+    gender_manager.restore_from_journal()
+    return score_manager, gender_manager
+
+
+def create_lan_sync(game_controller: GameController) -> LanSync | None:
+    """Create a LAN sync channel to peer boards if enabled in settings.toml.
+
+    Enabled by setting SCOREBOARD_LAN_SYNC = 1. Boards that should stay in sync
+    must use the same SCOREBOARD_LAN_GROUP and SCOREBOARD_LAN_PORT.
+
+    :param game_controller: GameController that applies updates from peers
+    :return: LanSync, or None if LAN sync is disabled
+    """
+    if os.getenv("SCOREBOARD_LAN_SYNC") not in {"1", 1}:
+        return None
+    return LanSync(on_feed_update=game_controller.handle_feed_update, **lan_settings())
+
+
 async def main():
     """Main application entry point with asyncio tasks."""
     # Initialize hardware
     matrixportal = MatrixPortal(status_neopixel=board.NEOPIXEL, debug=True)
 
-    # Apply network patches for faster failure behavior
-    apply_network_patches(matrixportal)
+    # Apply network patches for faster failure behavior. The blocking calls and
+    # the async client share one estimator, so both learn from every request.
+    transport = create_transport(
+        matrixportal, apply_network_patches(matrixportal, create_rtt_estimator())
+    )
 
     # Initialize managers
     display_manager = DisplayManager(matrixportal)
-    network_manager = NetworkManager(matrixportal, display_manager)
-    score_manager = ScoreManager(network_manager)
-    gender_manager = GenderManager(network_manager)
-    keys = create_keys_from_board(board)
-    hardware_manager = HardwareManager(keys=keys)
+    request_budget = RequestBudget(
+        rate_per_minute=float(
+            os.getenv("SCOREBOARD_AIO_RATE_LIMIT") or DEFAULT_RATE_PER_MINUTE
+        ),
+        boards_sharing=int(os.getenv("SCOREBOARD_BOARDS_PER_AIO_KEY") or 1),
+    )
+    network_manager = NetworkManager(
+        matrixportal,
+        display_manager,
+        request_budget=request_budget,
+        packed_state=os.getenv("SCOREBOARD_PACKED_STATE") in {"1", 1},
+        mirror_legacy_feeds=os.getenv("SCOREBOARD_MIRROR_LEGACY_FEEDS") not in {"0", 0},
+        transport=transport,
+        cycle_budget=CycleBudget(
+            budget=float(os.getenv("SCOREBOARD_CYCLE_BUDGET") or DEFAULT_CYCLE_BUDGET)
+        ),
+        read_your_writes_window=float(
+            os.getenv("SCOREBOARD_READ_YOUR_WRITES_WINDOW") or READ_YOUR_WRITES_WINDOW
+        ),
+    )
+
+    # Connect to Wi-Fi and pre-warm the Adafruit IO connection in the background
+    # while the rest of the board is set up
+    wifi_supervisor = create_wifi_supervisor(matrixportal, network_manager)
+    wifi_task = asyncio.create_task(wifi_supervisor.run())
+
+    score_manager, gender_manager = create_sync_managers(network_manager)
+    hardware_manager = HardwareManager(keys=create_keys_from_board(board))
     game_controller = GameController(
         score_manager, display_manager, network_manager, gender_manager
     )
+    transport.subscribe(game_controller.handle_feed_update)
 
-    # Initial setup
-    try:
-        await game_controller.update_team_names_and_gender()
-    except Exception as e:
-        # If network fails during initialization, set defaults manually
-        print(f"Network unavailable during initialization: {e}")
-        display_manager.set_text("left_team", NetworkManager.DEFAULT_LEFT_TEAM_NAME)
-        display_manager.set_text("right_team", NetworkManager.DEFAULT_RIGHT_TEAM_NAME)
+    # Initial setup: show the defaults right away, so the buttons work while
+    # Wi-Fi connects; the network's values are fetched once the link is up, see
+    # initial_network_fetch
+    display_manager.set_text("left_team", NetworkManager.DEFAULT_LEFT_TEAM_NAME)
+    display_manager.set_text("right_team", NetworkManager.DEFAULT_RIGHT_TEAM_NAME)
     # Always set scores and gender matchup
     display_manager.set_text("left_team_score", score_manager.left_score)
     display_manager.set_text("right_team_score", score_manager.right_score)
     game_controller._update_gender_matchup_display()
 
+    mqtt_subscriber = create_mqtt_subscriber(game_controller, transport)
+    lan_sync = create_lan_sync(game_controller)
+    poll_scheduler = PollScheduler(
+        min_interval=float(
+            os.getenv("SCOREBOARD_MIN_POLL_INTERVAL") or DEFAULT_MIN_POLL_INTERVAL
+        ),
+        max_interval=float(
+            os.getenv("SCOREBOARD_MAX_POLL_INTERVAL") or DEFAULT_MAX_POLL_INTERVAL
+        ),
+    )
+
     # Run all tasks concurrently
-    await asyncio.gather(
+    tasks = [
         hardware_manager.monitor_buttons(
             {
                 BUTTON_UP: game_controller.handle_toggle_gender_button,
                 BUTTON_DOWN: game_controller.handle_left_score_button,
             }
         ),
-        sync_and_fetch_updates(score_manager, gender_manager, game_controller),
-        initial_network_fetch(game_controller),
-    )
+        sync_and_fetch_updates(
+            network_manager.get_sync_queue(),
+            game_controller,
+            poll_scheduler,
+            request_budget,
+            mqtt_subscriber,
+            lan_sync,
+            network_manager.get_cycle_budget(),
+            wifi_supervisor,
+        ),
+        initial_network_fetch(game_controller, wifi_supervisor),
+    ]
+    if mqtt_subscriber is not None:
+        tasks.append(mqtt_subscriber.run())
+    if lan_sync is not None:
+        tasks.append(lan_sync.run())
+    if isinstance(transport, (MqttTransport, LanTransport)):
+        tasks.append(transport.run())
+    await asyncio.gather(wifi_task, *tasks)
 
 
 if __name__ == "__main__":
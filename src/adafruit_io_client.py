@@ -0,0 +1,188 @@
+"""Async Adafruit IO HTTP client built on the cooperative HTTP client.
+
+Mirrors the subset of adafruit_io.IO_HTTP that NetworkManager uses, but every
+call awaits instead of blocking the event loop.
+"""
+
+from src.async_http import AsyncHttpClient
+from src.compat import Any
+
+AIO_BASE_URL = "https://io.adafruit.com/api/v2"
+
+
+class AdafruitIORequestError(Exception):
+    """Raised when Adafruit IO responds with an error status."""
+
+    def __init__(self, status_code: int, message: str, retry_after: float | None = None):
+        """Initialize AdafruitIORequestError.
+
+        :param status_code: HTTP status code of the response
+        :param message: Error description
+        :param retry_after: Seconds the server asked us to wait before retrying,
+            from the Retry-After header, if any
+        """
+        super().__init__(f"Adafruit IO error {status_code}: {message}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+def is_throttle_error(error: Exception) -> bool:
+    """Check if an error is Adafruit IO's HTTP 429 throttling response.
+
+    Recognizes both AdafruitIORequestError and adafruit_io's own throttle error.
+    """
+    return (
+        getattr(error, "status_code", None) == 429
+        or type(error).__name__ == "AdafruitIO_ThrottleError"
+    )
+
+
+class AsyncIOClient:
+    """Adafruit IO HTTP API client whose requests yield to the event loop."""
+
+    def __init__(
+        self,
+        http: AsyncHttpClient,
+        username: str,
+        key: str,
+        base_url: str = AIO_BASE_URL,
+    ):
+        """Initialize AsyncIOClient with credentials.
+
+        :param http: AsyncHttpClient used to send requests
+        :param username: Adafruit IO username
+        :param key: Adafruit IO key
+        :param base_url: API base URL, overridable for testing
+        """
+        self._http = http
+        self._username = username
+        self._key = key
+        self._base_url = base_url
+
+    def _url(self, path: str) -> str:
+        """Compose the full URL for an API path."""
+        return f"{self._base_url}/{self._username}/{path}"
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        payload: Any | None = None,
+        fields: tuple[str, ...] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send an API request and return the parsed JSON response.
+
+        :param fields: Dotted paths of the only response fields to decode. None
+            decodes the whole response.
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            HTTP client's adaptive timeout is used.
+        :raises AdafruitIORequestError: If the response has an error status
+        """
+        response = await self._http.request(
+            method,
+            self._url(path),
+            headers={"X-AIO-KEY": self._key},
+            json_body=payload,
+            json_fields=fields,
+            timeout=timeout,
+        )
+        if response.status_code >= 400:
+            retry_after = response.headers.get("retry-after")
+            raise AdafruitIORequestError(
+                response.status_code,
+                response.body.decode(),
+                float(retry_after) if retry_after and retry_after.isdigit() else None,
+            )
+        return response.json()
+
+    async def warm_up(self) -> None:
+        """Open the connection to Adafruit IO ahead of the first request."""
+        await self._http.warm_up(self._base_url)
+
+    async def get_feed(
+        self,
+        feed_key: str,
+        detailed: bool = False,
+        fields: tuple[str, ...] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Get a feed.
+
+        :param feed_key: The feed key to retrieve
+        :param detailed: If True, returns the detailed structure
+        :param fields: Dotted paths of the only fields to decode, e.g.
+            ``("details.data.last.value",)``. None decodes the whole structure.
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            adaptive timeout is used.
+        :return: Feed data structure
+        """
+        path = f"feeds/{feed_key}/details" if detailed else f"feeds/{feed_key}"
+        return await self._request("GET", path, fields=fields, timeout=timeout)
+
+    async def get_last_value(self, feed_key: str, timeout: float | None = None) -> Any:
+        """Get only the most recent value of a feed.
+
+        Asks the server for the ``value`` field of the last data point alone, so
+        the response is a few dozen bytes instead of the whole feed structure.
+
+        :param feed_key: The feed key to retrieve
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            adaptive timeout is used.
+        :return: The last value, or None if the feed has no data
+        :raises KeyError: If the response has no value field
+        """
+        data = await self._request(
+            "GET",
+            f"feeds/{feed_key}/data/last?include=value",
+            fields=("value",),
+            timeout=timeout,
+        )
+        if data is None:
+            return None
+        return data["value"]
+
+    async def get_group(
+        self,
+        group_key: str,
+        fields: tuple[str, ...] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Get a group, including the last value of each of its feeds.
+
+        :param group_key: The group key to retrieve
+        :param fields: Dotted paths of the only fields to decode, e.g.
+            ``("feeds.key", "feeds.last_value")``. None decodes the whole structure.
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            adaptive timeout is used.
+        :return: Group data structure with a ``feeds`` list
+        """
+        return await self._request("GET", f"groups/{group_key}", fields=fields, timeout=timeout)
+
+    async def send_data(self, feed_key: str, value: Any, timeout: float | None = None) -> Any:
+        """Send a value to a feed.
+
+        :param feed_key: The feed key to send to
+        :param value: The value to send
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            adaptive timeout is used.
+        :return: The created data point
+        """
+        return await self._request(
+            "POST", f"feeds/{feed_key}/data", {"value": value}, timeout=timeout
+        )
+
+    async def send_group_data(
+        self, group_key: str, feeds_and_data: list, timeout: float | None = None
+    ) -> Any:
+        """Send values to several feeds in a group in one request.
+
+        :param group_key: The group key to send to
+        :param feeds_and_data: List of dicts with feed "key" and "value" entries
+        :param timeout: Time allowed for the request, in seconds. If None, the
+            adaptive timeout is used.
+        :return: The created data points
+        """
+        return await self._request(
+            "POST", f"groups/{group_key}/data", {"feeds": feeds_and_data}, timeout=timeout
+        )
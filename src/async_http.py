@@ -0,0 +1,425 @@
+"""Cooperative HTTP client that yields to the event loop while waiting on sockets.
+
+adafruit_requests blocks the whole event loop until a response arrives, so a
+slow fetch stalls button handling. This client puts the socket in non-blocking
+mode and awaits between attempts to send or receive, letting other tasks run.
+Connections are kept alive and reused across requests to the same host.
+
+Responses are received into a preallocated buffer that is reused across
+requests, and callers that only need a few JSON fields can have them decoded
+straight from that buffer, so a poll leaves little garbage on the heap.
+"""
+
+import asyncio
+import json
+import time
+
+from src.compat import Any
+from src.connection_pool import ConnectionPool
+from src.json_scan import project_json
+from src.rtt_estimator import RttEstimator
+
+# errno values meaning "try again later" on a non-blocking socket
+_EAGAIN = 11
+_EWOULDBLOCK = 11
+_EINPROGRESS = 115
+
+# Timeout for warming up a connection, which has no round-trip estimate to go by
+DEFAULT_TIMEOUT = 10.0
+# Initial size of each response buffer. Adafruit IO group responses fit, and a
+# larger response grows its buffer, which then stays grown for later requests.
+RESPONSE_BUFFER_SIZE = 8192
+
+_NOT_PARSED = object()
+
+
+class RequestTimeoutError(OSError):
+    """Raised when a request does not complete before its timeout."""
+
+
+class ConnectionClosedError(OSError):
+    """Raised when the server closes the connection before responding."""
+
+
+class HttpResponse:
+    """A fully-read HTTP response."""
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        json_value: Any = _NOT_PARSED,
+    ):
+        """Initialize HttpResponse.
+
+        :param status_code: HTTP status code
+        :param headers: Response headers, with lowercase names
+        :param body: Response body
+        :param json_value: The body already decoded as JSON, if it was decoded
+            while reading. The body itself is then not kept.
+        """
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self._json_value = json_value
+
+    def json(self) -> Any:
+        """Parse the body as JSON.
+
+        :return: Parsed JSON value
+        """
+        if self._json_value is not _NOT_PARSED:
+            return self._json_value
+        return json.loads(self.body)
+
+
+async def run_blocking(func, *args, **kwargs) -> Any:
+    """Run a blocking call without stalling the event loop where possible.
+
+    On CPython the call runs in a worker thread. CircuitPython has no threads, so
+    the call runs inline after yielding once.
+
+    :param func: The blocking function to call
+    :return: The function's return value
+    """
+    to_thread = getattr(asyncio, "to_thread", None)
+    if to_thread is None:
+        await asyncio.sleep(0)
+        return func(*args, **kwargs)
+    return await to_thread(func, *args, **kwargs)
+
+
+def would_block(error: OSError) -> bool:
+    """Check if a socket error means the operation should be retried later."""
+    if type(error).__name__ in {"BlockingIOError", "SSLWantReadError", "SSLWantWriteError"}:
+        return True
+    errno = error.args[0] if error.args else None
+    return errno in {_EAGAIN, _EWOULDBLOCK, _EINPROGRESS}
+
+
+def _split_url(url: str) -> tuple[str, str, int, str]:
+    """Split a URL into scheme, host, port and path.
+
+    :param url: An http:// or https:// URL
+    :return: Tuple of (scheme, host, port, path)
+    :raises ValueError: If the scheme is not supported
+    """
+    scheme, _, rest = url.partition("://")
+    if scheme not in {"http", "https"}:
+        raise ValueError(f"Unsupported URL scheme: {scheme}")
+    host, slash, path = rest.partition("/")
+    path = slash + path if slash else "/"
+    port = 443 if scheme == "https" else 80
+    if ":" in host:
+        host, port_text = host.split(":", 1)
+        port = int(port_text)
+    return scheme, host, port, path
+
+
+class AsyncHttpClient:
+    """Minimal HTTP/1.1 client on non-blocking sockets.
+
+    Connecting (including the TLS handshake) is bounded by the request timeout but
+    still blocks; sending and receiving yield to the event loop while waiting.
+    Sockets are kept alive between requests, so most requests skip connecting.
+    """
+
+    def __init__(
+        self,
+        socket_pool: Any,
+        ssl_context: Any | None = None,
+        connection_pool: ConnectionPool | None = None,
+        buffer_size: int = RESPONSE_BUFFER_SIZE,
+        rtt_estimator: RttEstimator | None = None,
+    ):
+        """Initialize AsyncHttpClient with a socket pool.
+
+        :param socket_pool: socketpool.SocketPool (or the CPython socket module)
+        :param ssl_context: SSL context used for https:// URLs
+        :param connection_pool: Pool of persistent connections. If None, one is
+            created from socket_pool and ssl_context.
+        :param buffer_size: Initial size of each response buffer, in bytes
+        :param rtt_estimator: Estimator that times requests out adaptively per
+            host. If None, one with the default bounds is created.
+        """
+        if connection_pool is None:
+            connection_pool = ConnectionPool(socket_pool, ssl_context)
+        self._connections = connection_pool
+        self._buffer_size = buffer_size
+        self.rtt_estimator = rtt_estimator or RttEstimator()
+        # Response buffers not in use by a request. One is enough unless
+        # requests overlap.
+        self._free_buffers: list[bytearray] = []
+        self.buffers_allocated = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def get_connection_stats(self) -> dict[str, int | float]:
+        """Get connect and reuse counters of the connection pool, and bytes transferred.
+
+        :return: Mapping of counter name to value
+        """
+        return {
+            **self._connections.get_stats(),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "buffers_allocated": self.buffers_allocated,
+        }
+
+    def close(self) -> None:
+        """Close every idle persistent connection."""
+        self._connections.close_all()
+
+    async def warm_up(self, url: str, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Connect to a URL's host ahead of the first request to it.
+
+        Resolves the host and completes the TLS handshake, keeping the
+        connection for the next request, and allocates a response buffer while
+        the heap is still unfragmented.
+
+        :param url: Any URL on the host
+        :param timeout: Time allowed for connecting, in seconds
+        """
+        scheme, host, port, _ = _split_url(url)
+        if not self._free_buffers:
+            self._free_buffers.append(self._take_buffer())
+        await asyncio.sleep(0)
+        sock, _ = self._connections.acquire(scheme, host, port, time.monotonic() + timeout)
+        self._connections.release(scheme, host, port, sock)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        json_body: Any | None = None,
+        timeout: float | None = None,
+        json_fields: tuple[str, ...] | None = None,
+    ) -> HttpResponse:
+        """Send a request and read the whole response.
+
+        A reused connection that the server has closed in the meantime is
+        replaced with a fresh one and the request is sent again.
+
+        :param method: HTTP method, e.g. "GET"
+        :param url: The URL to request
+        :param headers: Extra request headers
+        :param json_body: Value to send as a JSON body, if any
+        :param timeout: Total time allowed for the request, in seconds. If None,
+            the host's adaptive timeout from the RTT estimator is used.
+        :param json_fields: Dotted paths of the only JSON fields the caller needs
+            (see project_json). If given, a successful response's body is decoded
+            straight from the receive buffer and not kept as bytes.
+        :return: The response
+        :raises RequestTimeoutError: If the request does not complete in time
+        """
+        scheme, host, port, path = _split_url(url)
+        adaptive = timeout is None
+        if timeout is None:
+            timeout = self.rtt_estimator.timeout(host)
+        started = time.monotonic()
+        deadline = started + timeout
+        body = b"" if json_body is None else json.dumps(json_body).encode()
+
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {host}", "Connection: keep-alive"]
+        if json_body is not None:
+            lines.append("Content-Type: application/json")
+        if body or method in {"POST", "PUT"}:
+            lines.append(f"Content-Length: {len(body)}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+        buffer = self._take_buffer()
+        try:
+            response = await self._exchange(
+                scheme, host, port, request, buffer, deadline, json_fields
+            )
+        except RequestTimeoutError:
+            if adaptive:
+                self.rtt_estimator.record_timeout(host)
+            raise
+        finally:
+            self._free_buffers.append(buffer)
+        self.rtt_estimator.record_sample(host, time.monotonic() - started)
+        return response
+
+    async def _exchange(
+        self,
+        scheme: str,
+        host: str,
+        port: int,
+        request: bytes,
+        buffer: bytearray,
+        deadline: float,
+        json_fields: tuple[str, ...] | None,
+    ) -> HttpResponse:
+        """Send a request and read its response, replacing a stale reused connection.
+
+        :return: The response
+        :raises RequestTimeoutError: If the deadline passes first
+        """
+        while True:
+            sock, reused = self._connections.acquire(scheme, host, port, deadline)
+            keep_alive = False
+            stale = False
+            try:
+                await self._send_all(sock, request, deadline)
+                response, keep_alive = await self._read_response(
+                    sock, buffer, deadline, json_fields
+                )
+                return response
+            except OSError as error:
+                # A stale reused connection is replaced and the request retried
+                stale = reused and not isinstance(error, RequestTimeoutError)
+                if not stale:
+                    raise
+            finally:
+                if keep_alive:
+                    self._connections.release(scheme, host, port, sock)
+                else:
+                    self._connections.discard(sock, stale=stale)
+
+    def _take_buffer(self) -> bytearray:
+        """Get a free response buffer, allocating one only if none is free."""
+        if self._free_buffers:
+            return self._free_buffers.pop()
+        self.buffers_allocated += 1
+        return bytearray(self._buffer_size)
+
+    @staticmethod
+    async def _wait(deadline: float) -> None:
+        """Yield to the event loop, or raise if the deadline has passed."""
+        if time.monotonic() >= deadline:
+            raise RequestTimeoutError(110, "Request timed out")
+        await asyncio.sleep(0)
+
+    async def _send_all(self, sock: Any, data: bytes, deadline: float) -> None:
+        """Send all of data, yielding whenever the socket is not ready."""
+        view = memoryview(data)
+        sent = 0
+        while sent < len(data):
+            try:
+                count = sock.send(view[sent:])
+                sent += count
+                self.bytes_sent += count
+            except OSError as error:
+                if not would_block(error):
+                    raise
+                await self._wait(deadline)
+
+    async def _recv(self, sock: Any, buffer: bytearray, filled: int, deadline: float) -> int:
+        """Receive into the free end of buffer, growing it first if it is full.
+
+        Yields until data arrives or the peer closes.
+
+        :return: Number of bytes received, 0 if the peer closed the connection
+        """
+        if filled == len(buffer):
+            buffer.extend(bytes(len(buffer)))
+        while True:
+            try:
+                count = sock.recv_into(memoryview(buffer)[filled:])
+                self.bytes_received += count
+                return count
+            except OSError as error:
+                if not would_block(error):
+                    raise
+                await self._wait(deadline)
+
+    async def _read_head(
+        self, sock: Any, buffer: bytearray, deadline: float
+    ) -> tuple[int, dict[str, str], int, int]:
+        """Read and parse the status line and headers of a response into buffer.
+
+        :return: Tuple of (status code, headers, index where the body starts,
+            number of bytes received so far)
+        :raises ConnectionClosedError: If the server closes the connection before
+            sending response headers
+        """
+        filled = 0
+        header_end = -1
+        while header_end == -1:
+            count = await self._recv(sock, buffer, filled, deadline)
+            if count == 0:
+                raise ConnectionClosedError("Connection closed before response headers")
+            search_from = max(0, filled - 3)
+            filled += count
+            header_end = buffer.find(b"\r\n\r\n", search_from, filled)
+
+        head = str(memoryview(buffer)[:header_end], "utf-8").split("\r\n")
+        headers = {}
+        for line in head[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return int(head[0].split(" ")[1]), headers, header_end + 4, filled
+
+    async def _read_response(
+        self,
+        sock: Any,
+        buffer: bytearray,
+        deadline: float,
+        json_fields: tuple[str, ...] | None = None,
+    ) -> tuple[HttpResponse, bool]:
+        """Read and parse a whole HTTP response into buffer.
+
+        :param json_fields: JSON fields to decode from a successful response's
+            body, instead of copying the body out of the buffer
+        :return: Tuple of (response, True if the connection can be reused)
+        :raises ConnectionClosedError: If the server closes the connection before
+            sending response headers
+        """
+        status_code, headers, body_start, filled = await self._read_head(
+            sock, buffer, deadline
+        )
+        content_length = headers.get("content-length")
+        body_end = None if content_length is None else body_start + int(content_length)
+        chunked = headers.get("transfer-encoding", "").lower() == "chunked"
+        closed = False
+        while not closed:
+            if body_end is not None and filled >= body_end:
+                break
+            if chunked and buffer.find(b"0\r\n\r\n", max(body_start, filled - 5), filled) != -1:
+                break
+            count = await self._recv(sock, buffer, filled, deadline)
+            closed = count == 0
+            filled += count
+
+        if chunked:
+            body_end = self._decode_chunked(buffer, body_start, filled)
+        elif body_end is None or body_end > filled:
+            # Without a length or chunking the body ends when the server closes
+            body_end = filled
+        reusable = (
+            not closed
+            and (chunked or content_length is not None)
+            and headers.get("connection", "").lower() != "close"
+        )
+        if json_fields is not None and status_code < 400:
+            value = project_json(buffer, json_fields, body_start, body_end)
+            return HttpResponse(status_code, headers, b"", value), reusable
+        body = bytes(memoryview(buffer)[body_start:body_end])
+        return HttpResponse(status_code, headers, body), reusable
+
+    @staticmethod
+    def _decode_chunked(buffer: bytearray, start: int, end: int) -> int:
+        """Decode a chunked transfer-encoded body in place.
+
+        :param buffer: Buffer holding the body
+        :param start: Index where the body starts
+        :param end: Index where the received data ends
+        :return: Index where the decoded body ends
+        """
+        view = memoryview(buffer)
+        position = start
+        decoded_end = start
+        while True:
+            line_end = buffer.index(b"\r\n", position, end)
+            size = int(bytes(view[position:line_end]).split(b";")[0], 16)
+            if size == 0:
+                return decoded_end
+            chunk_start = line_end + 2
+            view[decoded_end : decoded_end + size] = view[chunk_start : chunk_start + size]
+            decoded_end += size
+            position = chunk_start + size + 2
@@ -0,0 +1,137 @@
+"""Circuit breaker for a single network endpoint.
+
+After a failure the breaker opens and requests to the endpoint are skipped. Each
+consecutive failure doubles how long it stays open, up to a cap, with jitter so
+several boards don't retry in lockstep. Once the delay passes the breaker goes
+half-open and lets one probe request through: success closes it, failure opens
+it again for longer.
+"""
+
+import random
+import time
+
+from src.compat import Callable
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
+
+DEFAULT_BASE_DELAY = 2.0
+DEFAULT_MAX_DELAY = 60.0
+# Fraction of the delay that is randomized away
+DEFAULT_JITTER = 0.25
+
+
+class CircuitBreaker:
+    """Tracks failures of one endpoint and decides when requests may be sent.
+
+    Every request allowed through must be followed by record_success() or
+    record_failure().
+    """
+
+    def __init__(
+        self,
+        name: str,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        jitter: float = DEFAULT_JITTER,
+        clock: Callable | None = None,
+        random_source: Callable = random.random,
+    ):
+        """Initialize a closed CircuitBreaker.
+
+        :param name: Endpoint name, used in log messages
+        :param base_delay: Time to stay open after the first failure, in seconds
+        :param max_delay: Cap on the time to stay open, in seconds
+        :param jitter: Fraction of the delay to randomly remove, from 0 to 1
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        :param random_source: Function returning a float in [0, 1)
+        """
+        self.name = name
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._clock = clock
+        self._random = random_source
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+        self._probe_started_at: float | None = None
+        self.counters = {
+            "opened": 0,
+            "half_opened": 0,
+            "closed": 0,
+            "rejected": 0,
+        }
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    @property
+    def state(self) -> str:
+        """Get the breaker state: closed, open or half-open."""
+        return self._state
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Get the number of failures since the last success."""
+        return self._consecutive_failures
+
+    def allow_request(self) -> bool:
+        """Check if a request to the endpoint may be sent now.
+
+        Moves an open breaker to half-open once its delay has passed, letting a
+        single probe through. A probe that never reports back is given up on
+        after the maximum delay.
+
+        :return: True if the request should be sent
+        """
+        now = self._now()
+        if self._state == STATE_OPEN and now >= self._open_until:
+            self._state = STATE_HALF_OPEN
+            self._probe_started_at = None
+            self.counters["half_opened"] += 1
+        if self._state == STATE_HALF_OPEN and (
+            self._probe_started_at is None
+            or now - self._probe_started_at >= self._max_delay
+        ):
+            self._probe_started_at = now
+            return True
+        if self._state == STATE_CLOSED:
+            return True
+        self.counters["rejected"] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request, closing the breaker."""
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+        if self._state != STATE_CLOSED:
+            self._state = STATE_CLOSED
+            self.counters["closed"] += 1
+            print(f"Circuit breaker {self.name} closed")
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the breaker with a longer delay."""
+        self._consecutive_failures += 1
+        delay = min(
+            self._base_delay * 2 ** (self._consecutive_failures - 1), self._max_delay
+        )
+        delay *= 1 - self._jitter * self._random()
+        self._open_until = self._now() + delay
+        self._probe_started_at = None
+        self._state = STATE_OPEN
+        self.counters["opened"] += 1
+        print(f"Circuit breaker {self.name} opened for {delay:.1f}s")
+
+    def reset(self) -> None:
+        """Close the breaker immediately and forget past failures."""
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+        if self._state != STATE_CLOSED:
+            self._state = STATE_CLOSED
+            self.counters["closed"] += 1
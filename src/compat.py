@@ -4,6 +4,12 @@ This module provides a centralized location for handling imports that work in
 standard Python but are unavailable or have different locations in CircuitPython.
 """
 
+import asyncio
+
+# asyncio.wait_for raises the builtin TimeoutError in CPython, but CircuitPython's
+# asyncio raises its own asyncio.core.TimeoutError, which only subclasses Exception
+AsyncTimeoutError = getattr(asyncio, "TimeoutError", TimeoutError)
+
 try:
     from collections.abc import Callable as _Callable
     from typing import TYPE_CHECKING
@@ -64,4 +70,12 @@ if not TYPE_CHECKING:
             return func
 
 
-__all__ = ["Callable", "Any", "Protocol", "TYPE_CHECKING", "ABC", "abstractmethod"]
+__all__ = [
+    "Callable",
+    "Any",
+    "Protocol",
+    "TYPE_CHECKING",
+    "ABC",
+    "abstractmethod",
+    "AsyncTimeoutError",
+]
@@ -0,0 +1,163 @@
+"""Persistent sockets for the cooperative HTTP client.
+
+Opening a TLS connection to io.adafruit.com costs a full handshake, which
+dominates request time on the ESP32-S3 and fragments the heap. We keep one idle
+socket per host and reuse it for the next request, and resume the TLS session
+when a new connection is needed and the SSL stack supports it.
+"""
+
+import time
+
+from src.compat import Any, Callable
+
+# Idle sockets older than this are closed instead of reused, in seconds. Servers
+# drop idle keep-alive connections, and a socket they have closed only fails on use.
+DEFAULT_IDLE_TIMEOUT = 30.0
+
+
+class ConnectionPool:
+    """Hands out connected sockets, reusing one idle socket per host."""
+
+    def __init__(
+        self,
+        socket_pool: Any,
+        ssl_context: Any | None = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        clock: Callable | None = None,
+    ):
+        """Initialize an empty ConnectionPool.
+
+        :param socket_pool: socketpool.SocketPool (or the CPython socket module)
+        :param ssl_context: SSL context used for https connections, required to
+            connect to https hosts
+        :param idle_timeout: How long an idle socket may be kept for reuse, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        self._socket_pool = socket_pool
+        self._ssl_context = ssl_context
+        self._idle_timeout = idle_timeout
+        self._clock = clock
+        # (scheme, host, port) -> (socket, time it was released)
+        self._idle: dict[tuple[str, str, int], tuple[Any, float]] = {}
+        # host -> TLS session from the last connection, for resumption
+        self._tls_sessions: dict[str, Any] = {}
+        self.connects = 0
+        self.reuses = 0
+        self.stale_reconnects = 0
+        self.tls_resumptions = 0
+        self.connect_time_total = 0.0
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def acquire(
+        self, scheme: str, host: str, port: int, deadline: float
+    ) -> tuple[Any, bool]:
+        """Get a connected socket to the host.
+
+        :param scheme: "http" or "https"
+        :param host: Host name
+        :param port: Port number
+        :param deadline: time.monotonic() value by which connecting must finish
+        :return: Tuple of (socket, True if it is a reused idle socket)
+        """
+        idle = self._idle.pop((scheme, host, port), None)
+        if idle is not None:
+            sock, released_at = idle
+            if self._now() - released_at < self._idle_timeout:
+                self.reuses += 1
+                return sock, True
+            sock.close()
+        return self._connect(scheme, host, port, deadline), False
+
+    def release(self, scheme: str, host: str, port: int, sock: Any) -> None:
+        """Return a socket whose response was fully read, keeping it for reuse.
+
+        :param scheme: "http" or "https"
+        :param host: Host name
+        :param port: Port number
+        :param sock: The socket to keep
+        """
+        key = (scheme, host, port)
+        previous = self._idle.get(key)
+        if previous is not None:
+            previous[0].close()
+        self._idle[key] = (sock, self._now())
+
+    def discard(self, sock: Any, stale: bool = False) -> None:
+        """Close a socket that can't be reused.
+
+        :param sock: The socket to close
+        :param stale: True if a reused socket turned out to be closed by the server
+        """
+        if stale:
+            self.stale_reconnects += 1
+        sock.close()
+
+    def close_all(self) -> None:
+        """Close every idle socket."""
+        for sock, _ in self._idle.values():
+            sock.close()
+        self._idle.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get connection counters, to see how many handshakes reuse saves.
+
+        :return: Mapping of counter name to value
+        """
+        return {
+            "connects": self.connects,
+            "reuses": self.reuses,
+            "stale_reconnects": self.stale_reconnects,
+            "tls_resumptions": self.tls_resumptions,
+            "connect_time_total": self.connect_time_total,
+        }
+
+    def _wrap_tls(self, sock: Any, host: str) -> Any:
+        """Wrap a socket for TLS, resuming the host's last session if supported.
+
+        :raises ValueError: If the pool has no SSL context
+        """
+        ssl_context = self._ssl_context
+        if ssl_context is None:
+            raise ValueError(f"No SSL context to connect to https://{host}")
+        session = self._tls_sessions.get(host)
+        if session is not None:
+            try:
+                return ssl_context.wrap_socket(
+                    sock, server_hostname=host, session=session
+                )
+            except TypeError:
+                # CircuitPython's ssl module has no session resumption
+                self._tls_sessions.pop(host)
+        return ssl_context.wrap_socket(sock, server_hostname=host)
+
+    def _connect(self, scheme: str, host: str, port: int, deadline: float) -> Any:
+        """Open a socket to the host and switch it to non-blocking mode."""
+        started = time.monotonic()
+        pool = self._socket_pool
+        address = pool.getaddrinfo(host, port)[0][4]
+        sock = pool.socket(pool.AF_INET, pool.SOCK_STREAM)
+        try:
+            if scheme == "https":
+                sock = self._wrap_tls(sock, host)
+            sock.settimeout(max(deadline - time.monotonic(), 0.01))
+            sock.connect(address)
+            sock.settimeout(0)
+        except Exception:
+            sock.close()
+            raise
+
+        self.connects += 1
+        self.connect_time_total += time.monotonic() - started
+        if scheme == "https":
+            if getattr(sock, "session_reused", False):
+                self.tls_resumptions += 1
+            session = getattr(sock, "session", None)
+            if session is not None:
+                self._tls_sessions[host] = session
+        return sock
@@ -0,0 +1,100 @@
+"""Time budget for one pass of the sync and fetch loop.
+
+A pass can chain several network calls, each with its own timeout, so a bad
+network could hold up the loop, and the button presses waiting to be synced,
+for the sum of all of them. Instead each pass gets one deadline. Every call
+made during the pass may only use the time left until it, calls are skipped
+once it has passed, and reads of slow-changing feeds such as team names are
+skipped early, so they never hold up the next pass's sync.
+"""
+
+import time
+
+from src.compat import Callable
+
+# Time allowed for one pass of the loop, in seconds
+DEFAULT_CYCLE_BUDGET = 6.0
+# Low-priority reads only start with at least this much of the budget left, in seconds
+DEFAULT_LOW_PRIORITY_RESERVE = 2.0
+
+
+class CycleBudget:
+    """Hands each pass of the loop a deadline and counts the passes that overran it."""
+
+    def __init__(
+        self,
+        budget: float = DEFAULT_CYCLE_BUDGET,
+        low_priority_reserve: float = DEFAULT_LOW_PRIORITY_RESERVE,
+        clock: Callable | None = None,
+    ):
+        """Initialize CycleBudget with no pass running.
+
+        Outside of a pass there is no deadline, and every call may start.
+
+        :param budget: Time allowed for one pass, in seconds
+        :param low_priority_reserve: Time that must be left for a low-priority
+            read to start, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        self.budget = budget
+        self._low_priority_reserve = low_priority_reserve
+        self._clock = clock
+        self._deadline: float | None = None
+        self.counters = {"cycles": 0, "overruns": 0, "skipped": 0, "timed_out": 0}
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def start_cycle(self) -> None:
+        """Start a pass, setting its deadline."""
+        self._deadline = self._now() + self.budget
+        self.counters["cycles"] += 1
+
+    def end_cycle(self) -> None:
+        """End the current pass, counting an overrun if it went past its deadline."""
+        if self._deadline is None:
+            return
+        overrun = self._now() - self._deadline
+        if overrun > 0:
+            self.counters["overruns"] += 1
+            print(f"Sync cycle overran its {self.budget:.1f}s budget by {overrun:.1f}s")
+        self._deadline = None
+
+    def remaining(self) -> float | None:
+        """Get the time left until the current pass's deadline.
+
+        :return: Seconds left, never negative, or None outside of a pass
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - self._now())
+
+    def allow_call(self, low_priority: bool = False) -> bool:
+        """Check if a network call may start in the time left, counting it if not.
+
+        :param low_priority: True for reads that can wait for a later pass
+        :return: True if the call may start
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return True
+        needed = self._low_priority_reserve if low_priority else 0.0
+        if remaining <= needed:
+            self.counters["skipped"] += 1
+            return False
+        return True
+
+    def record_timeout(self) -> None:
+        """Record a call that was cut off at the deadline."""
+        self.counters["timed_out"] += 1
+
+    def get_stats(self) -> dict[str, float | int | None]:
+        """Get the pass counters and the time left in the current pass.
+
+        :return: Mapping of counter name to value
+        """
+        return {"remaining": self.remaining(), **self.counters}
@@ -0,0 +1,85 @@
+"""Time-to-live cache for slow-changing feed values.
+
+Team names and the first point gender change perhaps once per game, so we keep
+their last known values and only go back to the network once they are older
+than their feed's time-to-live. Feeds without a time-to-live are never cached.
+"""
+
+import time
+
+from src.compat import Callable
+
+
+class FeedCache:
+    """Last known values of feeds, each with its own time-to-live."""
+
+    def __init__(self, ttls: dict[str, float], clock: Callable | None = None):
+        """Initialize an empty FeedCache.
+
+        :param ttls: Mapping of feed key to how long its value stays fresh, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        self._ttls = ttls
+        self._clock = clock
+        self._entries: dict[str, tuple[str | None, float]] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def is_cacheable(self, feed_key: str) -> bool:
+        """Check if a feed has a time-to-live.
+
+        :param feed_key: Full feed key
+        :return: True if values of the feed are cached
+        """
+        return feed_key in self._ttls
+
+    def get(self, feed_key: str) -> tuple[str | None, bool] | None:
+        """Look up a feed's cached value.
+
+        :param feed_key: Full feed key
+        :return: Tuple of (value, is_fresh), or None if the feed is not cached
+        """
+        entry = self._entries.get(feed_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, stored_at = entry
+        if self._now() - stored_at < self._ttls[feed_key]:
+            self.hits += 1
+            return value, True
+        self.stale_hits += 1
+        return value, False
+
+    def put(self, feed_key: str, value: str | None) -> None:
+        """Store a feed's latest value. Feeds without a time-to-live are ignored.
+
+        :param feed_key: Full feed key
+        :param value: Latest value of the feed
+        """
+        if feed_key in self._ttls:
+            self._entries[feed_key] = (value, self._now())
+
+    def invalidate(self, feed_key: str | None = None) -> None:
+        """Drop a feed's cached value, or every cached value.
+
+        :param feed_key: Full feed key, or None to clear the whole cache
+        """
+        if feed_key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(feed_key, None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the cache's hit and miss counters.
+
+        :return: Mapping of counter name to count
+        """
+        return {"hits": self.hits, "stale_hits": self.stale_hits, "misses": self.misses}
@@ -3,6 +3,7 @@
 import asyncio
 
 from src.display_manager import DisplayManager
+from src.game_snapshot import GameSnapshot
 from src.gender_manager import GenderManager
 from src.network_manager import NetworkManager
 from src.score_manager import ScoreManager
@@ -32,6 +33,10 @@ class GameController:
         self._display_manager = display_manager
         self._network_manager = network_manager
         self._gender_manager = gender_manager
+        # Version of the last network snapshot applied, and whether it was seen
+        # on two reads in a row
+        self._applied_version: tuple | None = None
+        self._applied_version_settled = False
 
     def _calculate_gender_matchup(
         self, score_sum: int, starting_gender: str
@@ -117,47 +122,125 @@ class GameController:
 
         self._update_gender_matchup_display()
 
-    async def update_team_names_and_gender(self) -> None:
+    async def update_team_names_and_gender(
+        self, snapshot: GameSnapshot | None = None
+    ) -> None:
         """Update team names and gender matchup from network.
 
-        Fetches team names and gender feed from the network and updates the display.
-        """
-        team_left_team = NetworkManager.DEFAULT_LEFT_TEAM_NAME
-        team_right_team = NetworkManager.DEFAULT_RIGHT_TEAM_NAME
+        Uses the given group snapshot if provided. Otherwise gender is fetched
+        fresh, and team names come from the network manager's feed cache, which
+        that fetch has just refreshed. Updates the display.
 
+        :param snapshot: Already-fetched group snapshot, or None to fetch one
+        """
         await asyncio.sleep(0)
-        team_name = await self._network_manager.get_left_team_name()
-        if team_name is not None:
-            print(f"Team {team_left_team} is now Team {team_name}")
-            team_left_team = team_name
+        await self._gender_manager.update_gender_from_network(snapshot)
+        self._update_gender_matchup_display()
 
         await asyncio.sleep(0)
-        team_name = await self._network_manager.get_right_team_name()
-        if team_name is not None:
-            print(f"Team {team_right_team} is now Team {team_name}")
-            team_right_team = team_name
-
+        if snapshot is not None:
+            left_team_name = snapshot.left_team_name
+            right_team_name = snapshot.right_team_name
+        else:
+            left_team_name = await self._network_manager.get_cached_feed_value(
+                NetworkManager.TEAM_LEFT_TEAM_FEED
+            )
+            right_team_name = await self._network_manager.get_cached_feed_value(
+                NetworkManager.TEAM_RIGHT_TEAM_FEED
+            )
+
+        team_left_team = left_team_name or NetworkManager.DEFAULT_LEFT_TEAM_NAME
+        team_right_team = right_team_name or NetworkManager.DEFAULT_RIGHT_TEAM_NAME
+        print(f"Teams are now {team_left_team} vs {team_right_team}")
         self._display_manager.set_text("left_team", team_left_team)
         self._display_manager.set_text("right_team", team_right_team)
 
-        await asyncio.sleep(0)
-        await self._gender_manager.update_gender_from_network()
-        self._update_gender_matchup_display()
+    async def handle_feed_update(self, feed_key: str, value: str) -> None:
+        """Apply a single feed value pushed from the network and update the display.
+
+        :param feed_key: Full feed key the value was published to
+        :param value: The new feed value
+        """
+        if feed_key == NetworkManager.GAME_STATE_FEED:
+            snapshot = self._network_manager.decode_packed_state(value)
+            if snapshot is not None:
+                await self._apply_snapshot(snapshot)
+            return
+
+        self._network_manager.cache_feed_value(feed_key, value)
+        if feed_key == NetworkManager.TEAM_LEFT_TEAM_FEED:
+            self._display_manager.set_text(
+                "left_team", value or NetworkManager.DEFAULT_LEFT_TEAM_NAME
+            )
+            return
+        if feed_key == NetworkManager.TEAM_RIGHT_TEAM_FEED:
+            self._display_manager.set_text(
+                "right_team", value or NetworkManager.DEFAULT_RIGHT_TEAM_NAME
+            )
+            return
+
+        if self._score_manager.apply_feed_update(feed_key, value):
+            self._display_manager.set_text(
+                "left_team_score", self._score_manager.left_score
+            )
+            self._display_manager.set_text(
+                "right_team_score", self._score_manager.right_score
+            )
+            self._update_gender_matchup_display()
+        elif self._gender_manager.apply_feed_update(feed_key, value):
+            self._update_gender_matchup_display()
 
     async def update_from_network(self) -> bool:
         """Update scores and team information from network.
 
-        Fetches latest scores from Adafruit IO and updates display.
-        Also updates team names if scores have changed.
+        Fetches the whole scores group in one request and updates the display.
+        Also updates team names from the same snapshot if scores have changed.
+        Snapshots in which no feed has been written since the last one are not
+        applied again. A failed fetch is not retried until the next update.
 
         :return: True if update was successful, False otherwise
         """
         try:
-            score_changed = await self._score_manager.update_scores_from_network()
+            snapshot = await self._network_manager.get_group_snapshot()
+            if snapshot is None:
+                print("No game state from network")
+                return False
+            if self._is_unchanged_snapshot(snapshot):
+                return True
+            return await self._apply_snapshot(snapshot)
         except Exception as e:
             print(f"Network update failed: {e}")
             return False
 
+    def _is_unchanged_snapshot(self, snapshot: GameSnapshot | None) -> bool:
+        """Check if a snapshot's feeds were all applied before, and remember its version.
+
+        Feed timestamps only have one-second resolution, so a write in the same
+        second as the previous read can leave the version unchanged. A version is
+        therefore applied on the first two reads it is seen on, and only skipped
+        after that.
+
+        :param snapshot: Snapshot just read from the network
+        :return: True if applying the snapshot can be skipped
+        """
+        version = None if snapshot is None else snapshot.version
+        if version is None or version != self._applied_version:
+            self._applied_version = version
+            self._applied_version_settled = False
+            return False
+        if self._applied_version_settled:
+            return True
+        self._applied_version_settled = True
+        return False
+
+    async def _apply_snapshot(self, snapshot: GameSnapshot | None) -> bool:
+        """Apply a game state snapshot from the network and update the display.
+
+        :param snapshot: The snapshot, or None if it could not be fetched
+        :return: True once applied
+        """
+        score_changed = await self._score_manager.update_scores_from_network(snapshot)
+
         self._display_manager.set_text(
             "left_team_score", self._score_manager.left_score
         )
@@ -167,6 +250,6 @@ class GameController:
         self._update_gender_matchup_display()
 
         if score_changed:
-            await self.update_team_names_and_gender()
+            await self.update_team_names_and_gender(snapshot)
 
         return True
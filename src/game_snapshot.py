@@ -0,0 +1,46 @@
+"""Typed snapshot of the game state held in the scores group."""
+
+
+class GameSnapshot:
+    """Values of every feed in the scores group, read in a single request.
+
+    Scores are None when their feed has no value. Team names and gender are
+    already normalized, with defaults applied for missing or invalid values.
+    Score counters are the raw counter feed values, see pn_counter.
+    """
+
+    def __init__(
+        self,
+        left_score: int | None,
+        right_score: int | None,
+        left_team_name: str,
+        right_team_name: str,
+        first_point_gender: str,
+        version: tuple | None = None,
+        left_score_counter: str | None = None,
+        right_score_counter: str | None = None,
+    ):
+        """Initialize GameSnapshot with parsed feed values.
+
+        :param left_score: Left team score, or None if the feed has no value
+        :param right_score: Right team score, or None if the feed has no value
+        :param left_team_name: Left team name
+        :param right_team_name: Right team name
+        :param first_point_gender: Gender constant (GenderManager.GENDER_WMP or
+            GenderManager.GENDER_MMP)
+        :param version: Identifies the feed writes the snapshot was read from.
+            Two snapshots with the same version hold the same values. None if
+            the server gave no way to tell.
+        :param left_score_counter: Left team score counter, or None if the feed
+            has no value or wasn't read
+        :param right_score_counter: Right team score counter, or None if the feed
+            has no value or wasn't read
+        """
+        self.left_score = left_score
+        self.right_score = right_score
+        self.left_team_name = left_team_name
+        self.right_team_name = right_team_name
+        self.first_point_gender = first_point_gender
+        self.version = version
+        self.left_score_counter = left_score_counter
+        self.right_score_counter = right_score_counter
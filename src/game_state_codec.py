@@ -0,0 +1,91 @@
+"""Compact encoding of the whole game state in a single feed value.
+
+Reading or writing the game state as separate feeds costs one data operation per
+feed. Packing it into one string costs one. The format is
+
+    GS1;<version>;<left score>;<right score>;<gender>;<left name>;<right name>;<checksum>
+
+where missing scores are empty, ``;`` and ``%`` in team names are %-escaped, and
+the checksum is a Fletcher-16 of everything before it, as four hex digits. The
+version counter increases with every write, so readers can tell newer states
+from older ones.
+"""
+
+from src.game_snapshot import GameSnapshot
+
+FORMAT_TAG = "GS1"
+_SEPARATOR = ";"
+_FIELD_COUNT = 8
+
+
+class GameStateDecodeError(ValueError):
+    """Raised when a packed game state can't be decoded."""
+
+
+def _checksum(text: str) -> str:
+    """Compute the Fletcher-16 checksum of text as four hex digits."""
+    low = 0
+    high = 0
+    for byte in text.encode():
+        low = (low + byte) % 255
+        high = (high + low) % 255
+    return f"{(high << 8) | low:04x}"
+
+
+def _escape(name: str) -> str:
+    """Escape the separator in a team name."""
+    return name.replace("%", "%25").replace(_SEPARATOR, "%3B")
+
+
+def _unescape(name: str) -> str:
+    """Undo _escape."""
+    return name.replace("%3B", _SEPARATOR).replace("%25", "%")
+
+
+def encode_game_state(snapshot: GameSnapshot, version: int) -> str:
+    """Pack a game state into a feed value.
+
+    :param snapshot: The game state to pack
+    :param version: Version counter of this state
+    :return: Packed game state
+    """
+    fields = [
+        FORMAT_TAG,
+        str(version),
+        "" if snapshot.left_score is None else str(snapshot.left_score),
+        "" if snapshot.right_score is None else str(snapshot.right_score),
+        snapshot.first_point_gender,
+        _escape(snapshot.left_team_name),
+        _escape(snapshot.right_team_name),
+    ]
+    body = _SEPARATOR.join(fields)
+    return f"{body}{_SEPARATOR}{_checksum(body)}"
+
+
+def decode_game_state(text: str) -> tuple[GameSnapshot, int]:
+    """Unpack a game state from a feed value.
+
+    :param text: Packed game state
+    :return: Tuple of (game state, version counter)
+    :raises GameStateDecodeError: If the value is not a valid packed game state
+    """
+    body, _, checksum = text.rpartition(_SEPARATOR)
+    if _checksum(body) != checksum:
+        raise GameStateDecodeError("Game state checksum mismatch")
+    fields = body.split(_SEPARATOR)
+    if len(fields) != _FIELD_COUNT - 1 or fields[0] != FORMAT_TAG:
+        raise GameStateDecodeError(f"Unsupported game state format: {fields[0]}")
+    try:
+        version = int(fields[1])
+        left_score = int(fields[2]) if fields[2] else None
+        right_score = int(fields[3]) if fields[3] else None
+    except ValueError as e:
+        raise GameStateDecodeError(f"Invalid number in game state: {e}") from e
+    snapshot = GameSnapshot(
+        left_score=left_score,
+        right_score=right_score,
+        left_team_name=_unescape(fields[5]),
+        right_team_name=_unescape(fields[6]),
+        first_point_gender=fields[4],
+    )
+    return snapshot, version
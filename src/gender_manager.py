@@ -1,5 +1,15 @@
+from __future__ import annotations
+
+import random
+
+from src.compat import TYPE_CHECKING, Callable
+from src.game_snapshot import GameSnapshot
 from src.network_manager import NetworkManager
-from src.sync_manager import SyncManager
+from src.sync_manager import COALESCE_MAX_DELAY, SyncManager
+from src.sync_queue import PRIORITY_GENDER
+
+if TYPE_CHECKING:
+    from src.outbound_journal import OutboundJournal
 
 
 class GenderManager(SyncManager):
@@ -10,13 +20,30 @@ class GenderManager(SyncManager):
     GENDER_MMP = "MMP"
     DEFAULT_GENDER = GENDER_WMP
 
-    def __init__(self, network_manager: NetworkManager):
+    SYNC_PRIORITY = PRIORITY_GENDER
+
+    def __init__(
+        self,
+        network_manager: NetworkManager,
+        journal: OutboundJournal | None = None,
+        coalesce_window: float = 0.0,
+        coalesce_max_delay: float = COALESCE_MAX_DELAY,
+        clock: Callable | None = None,
+        random_source: Callable = random.random,
+    ):
         """Initialize GenderManager with NetworkManager.
 
         :param network_manager: NetworkManager instance for fetching data
+        :param journal: Journal keeping an unsynced gender across resets
+        :param coalesce_window: Quiet time after a change before it is pushed, in
+            seconds. 0 pushes changes right away.
+        :param coalesce_max_delay: Longest a change is held back, in seconds
+        :param clock: Function returning the current time in seconds
+        :param random_source: Function returning a float in [0, 1), for retry jitter
         """
-        super().__init__()
-        self._network_manager = network_manager
+        super().__init__(
+            network_manager, journal, coalesce_window, coalesce_max_delay, clock, random_source
+        )
         self._local_first_point_gender: str = self.DEFAULT_GENDER
         self._network_first_point_gender: str = self.DEFAULT_GENDER
 
@@ -35,16 +62,43 @@ class GenderManager(SyncManager):
             self._local_first_point_gender = self.GENDER_WMP
         self._mark_pending()
 
-    async def _perform_sync(self) -> None:
-        """Perform sync of gender to network.
+    def get_local_feed_values(self) -> dict[str, str | int]:
+        """Get the local gender.
+
+        :return: Mapping of gender feed key to local gender
+        """
+        return {NetworkManager.FIRST_POINT_GENDER_FEED: self._local_first_point_gender}
+
+    def _pending_feed_values(self) -> dict[str, str | int]:
+        """Get the gender if it has changed since the last sync.
 
-        Syncs gender if it has changed.
+        :return: Mapping of gender feed key to local gender
         """
         if self._local_first_point_gender != self._network_first_point_gender:
-            await self._network_manager.set_first_point_gender(
-                self._local_first_point_gender
+            return {NetworkManager.FIRST_POINT_GENDER_FEED: self._local_first_point_gender}
+        return {}
+
+    def _mark_feed_values_synced(self, values: dict[str, str | int]) -> None:
+        """Record a pushed gender as the network gender.
+
+        :param values: Mapping of feed key to pushed value
+        """
+        if NetworkManager.FIRST_POINT_GENDER_FEED in values:
+            self._network_first_point_gender = str(
+                values[NetworkManager.FIRST_POINT_GENDER_FEED]
             )
-            self._network_first_point_gender = self._local_first_point_gender
+
+    def _restore_feed_values(self, values: dict[str, str | int]) -> bool:
+        """Set the local gender from a journaled gender that was never synced.
+
+        :param values: Mapping of feed key to unsynced value
+        :return: True if the gender was restored
+        """
+        if NetworkManager.FIRST_POINT_GENDER_FEED not in values:
+            return False
+        self._local_first_point_gender = str(values[NetworkManager.FIRST_POINT_GENDER_FEED])
+        print(f"Restored unsynced first point gender {self._local_first_point_gender}")
+        return True
 
     async def try_sync_gender(self) -> bool:
         """Attempt to sync local gender to network.
@@ -53,20 +107,56 @@ class GenderManager(SyncManager):
         """
         return await self._try_sync_with_backoff()
 
-    async def update_gender_from_network(self) -> bool:
+    async def update_gender_from_network(
+        self, snapshot: GameSnapshot | None = None
+    ) -> bool:
         """Fetch latest gender from Adafruit IO and update internal state.
 
-        Will skip network fetch if there are pending local changes to sync.
+        Will skip network fetch if there are pending local changes to sync. A
+        snapshot passed in by the caller is discarded if local changes had to be
+        synced first, since it predates them.
 
+        :param snapshot: Already-fetched group snapshot, or None to fetch one
         :return: True if gender has changed, False otherwise
         """
         if self._has_pending_sync:
             if not await self.try_sync_gender():
                 print("Skipping network gender update - local changes pending")
                 return False
+            if snapshot is not None:
+                print("Skipping network gender update - snapshot predates local changes")
+                return False
+
+        if snapshot is None:
+            snapshot = await self._network_manager.get_group_snapshot()
+        if snapshot is None:
+            print("No gender from network")
+            return False
+        return self._apply_network_gender(snapshot.first_point_gender)
 
-        network_gender = await self._network_manager.get_first_point_gender()
+    def apply_feed_update(self, feed_key: str, value: str) -> bool:
+        """Apply a single feed value pushed from the network.
 
+        Ignores feeds other than the gender feed. Local changes take precedence
+        until they are synced, so updates are skipped while changes are pending.
+
+        :param feed_key: Full feed key the value was published to
+        :param value: The new feed value
+        :return: True if gender has changed, False otherwise
+        """
+        if feed_key != NetworkManager.FIRST_POINT_GENDER_FEED:
+            return False
+        if self._has_pending_sync:
+            print("Skipping pushed gender update - local changes pending")
+            return False
+        return self._apply_network_gender(NetworkManager._parse_gender(value))
+
+    def _apply_network_gender(self, network_gender: str) -> bool:
+        """Replace local gender with gender from the network.
+
+        :param network_gender: Gender constant from the network
+        :return: True if gender has changed, False otherwise
+        """
         previous_gender = self._local_first_point_gender
         self._local_first_point_gender = network_gender
         self._network_first_point_gender = network_gender
@@ -0,0 +1,208 @@
+"""Incremental JSON scanner that extracts selected fields from a buffer.
+
+Adafruit IO responses carry far more than the scoreboard reads: a group lists
+every feed with its full metadata, but we only need each feed's key and last
+value. json.loads builds all of it as objects on the heap. project_json walks
+the raw bytes in place instead, skipping members it was not asked for, and
+builds only the requested fields.
+
+Fields are dotted paths of object keys. Arrays are transparent: the path
+``feeds.key`` selects the ``key`` of every object in the ``feeds`` array. The
+result keeps the document's shape, e.g. ``{"feeds": [{"key": "left"}]}``.
+"""
+
+import json
+
+from src.compat import Any
+
+_QUOTE = 0x22
+_BACKSLASH = 0x5C
+_COLON = 0x3A
+_COMMA = 0x2C
+_OPEN_OBJECT = 0x7B
+_CLOSE_OBJECT = 0x7D
+_OPEN_ARRAY = 0x5B
+_CLOSE_ARRAY = 0x5D
+_OPENERS = {_OPEN_OBJECT, _OPEN_ARRAY}
+_CLOSERS = {_CLOSE_OBJECT, _CLOSE_ARRAY}
+_WHITESPACE = {0x20, 0x09, 0x0A, 0x0D}
+_DELIMITERS = {_COMMA, _CLOSE_OBJECT, _CLOSE_ARRAY, 0x20, 0x09, 0x0A, 0x0D}
+_LITERALS = {b"null": None, b"true": True, b"false": False}
+
+# Marks a field whose whole value is wanted
+_LEAF = None
+
+
+def _build_tree(fields: tuple[str, ...]) -> dict:
+    """Turn dotted field paths into a tree of wanted keys.
+
+    :return: Mapping of key bytes to (key string, subtree or _LEAF)
+    """
+    tree: dict = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for index, part in enumerate(parts):
+            key = part.encode()
+            if index == len(parts) - 1:
+                node[key] = (part, _LEAF)
+                break
+            entry = node.get(key)
+            if entry is None or entry[1] is _LEAF:
+                entry = (part, {})
+                node[key] = entry
+            node = entry[1]
+    return tree
+
+
+def _skip_whitespace(buf: bytearray, i: int, end: int) -> int:
+    """Get the index of the next non-whitespace byte."""
+    while i < end and buf[i] in _WHITESPACE:
+        i += 1
+    if i >= end:
+        raise ValueError("Unexpected end of JSON")
+    return i
+
+
+def _string_end(buf: bytearray, i: int, end: int) -> int:
+    """Get the index of the quote closing the string that starts at i."""
+    j = buf.find(b'"', i + 1, end)
+    while j != -1:
+        backslashes = 0
+        while buf[j - 1 - backslashes] == _BACKSLASH:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return j
+        j = buf.find(b'"', j + 1, end)
+    raise ValueError("Unterminated JSON string")
+
+
+def _token_end(buf: bytearray, i: int, end: int) -> int:
+    """Get the index just past a number or literal starting at i."""
+    while i < end and buf[i] not in _DELIMITERS:
+        i += 1
+    return i
+
+
+def _skip_value(buf: bytearray, i: int, end: int) -> int:
+    """Get the index just past the value starting at i, without decoding it."""
+    first = buf[i]
+    if first == _QUOTE:
+        return _string_end(buf, i, end) + 1
+    if first not in _OPENERS:
+        return _token_end(buf, i, end)
+    depth = 0
+    while i < end:
+        byte = buf[i]
+        if byte == _QUOTE:
+            i = _string_end(buf, i, end)
+        elif byte in _OPENERS:
+            depth += 1
+        elif byte in _CLOSERS:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError("Unexpected end of JSON")
+
+
+def _decode_scalar(buf: bytearray, i: int, end: int) -> tuple[Any, int]:
+    """Decode the string, number or literal starting at i.
+
+    :return: Tuple of (value, index just past it)
+    """
+    view = memoryview(buf)
+    if buf[i] == _QUOTE:
+        j = _string_end(buf, i, end)
+        if buf.find(b"\\", i, j) == -1:
+            return str(view[i + 1 : j], "utf-8"), j + 1
+        # Escapes are rare in feed values, let the json module handle them
+        return json.loads(bytes(view[i : j + 1])), j + 1
+    j = _token_end(buf, i, end)
+    token = bytes(view[i:j])
+    if token in _LITERALS:
+        return _LITERALS[token], j
+    if b"." in token or b"e" in token or b"E" in token:
+        return float(token), j
+    return int(token), j
+
+
+def _match_key(buf: bytearray, start: int, stop: int, tree: dict) -> tuple | None:
+    """Find the tree entry for the key stored in buf[start:stop], if wanted."""
+    for key, entry in tree.items():
+        if stop - start == len(key) and buf.find(key, start, stop) == start:
+            return entry
+    return None
+
+
+def _project(buf: bytearray, i: int, end: int, tree: dict | None) -> tuple[Any, int]:
+    """Decode the value starting at i, keeping only the fields in tree.
+
+    :return: Tuple of (projected value, index just past it)
+    """
+    i = _skip_whitespace(buf, i, end)
+    first = buf[i]
+    if first not in _OPENERS:
+        return _decode_scalar(buf, i, end)
+    # The whole value of a _LEAF field is wanted
+    if tree is None:
+        j = _skip_value(buf, i, end)
+        return json.loads(bytes(memoryview(buf)[i:j])), j
+    if first == _OPEN_OBJECT:
+        return _project_object(buf, i, end, tree)
+    return _project_array(buf, i, end, tree)
+
+
+def _project_object(buf: bytearray, i: int, end: int, tree: dict) -> tuple[dict, int]:
+    """Decode the wanted members of the object starting at i."""
+    result = {}
+    i = _skip_whitespace(buf, i + 1, end)
+    while buf[i] != _CLOSE_OBJECT:
+        if buf[i] == _COMMA:
+            i = _skip_whitespace(buf, i + 1, end)
+        if buf[i] != _QUOTE:
+            raise ValueError(f"Expected object key at offset {i}")
+        key_end = _string_end(buf, i, end)
+        entry = _match_key(buf, i + 1, key_end, tree)
+        i = _skip_whitespace(buf, key_end + 1, end)
+        if buf[i] != _COLON:
+            raise ValueError(f"Expected ':' at offset {i}")
+        i = _skip_whitespace(buf, i + 1, end)
+        if entry is None:
+            i = _skip_value(buf, i, end)
+        else:
+            result[entry[0]], i = _project(buf, i, end, entry[1])
+        i = _skip_whitespace(buf, i, end)
+    return result, i + 1
+
+
+def _project_array(buf: bytearray, i: int, end: int, tree: dict) -> tuple[list, int]:
+    """Decode the wanted fields of every element of the array starting at i."""
+    result = []
+    i = _skip_whitespace(buf, i + 1, end)
+    while buf[i] != _CLOSE_ARRAY:
+        if buf[i] == _COMMA:
+            i = _skip_whitespace(buf, i + 1, end)
+        value, i = _project(buf, i, end, tree)
+        result.append(value)
+        i = _skip_whitespace(buf, i, end)
+    return result, i + 1
+
+
+def project_json(
+    buf: bytearray, fields: tuple[str, ...], start: int = 0, end: int | None = None
+) -> Any:
+    """Decode only the selected fields of a JSON document.
+
+    :param buf: Buffer holding the JSON document
+    :param fields: Dotted paths of the fields to decode
+    :param start: Index where the document starts in buf
+    :param end: Index where the document ends in buf. Defaults to len(buf).
+    :return: The document with every other field left out. Scalars and null
+        are returned as they are.
+    :raises ValueError: If the document is not valid JSON
+    """
+    if end is None:
+        end = len(buf)
+    value, _ = _project(buf, start, end, _build_tree(fields))
+    return value
@@ -0,0 +1,217 @@
+"""Peer-to-peer game state sync between boards on the same LAN.
+
+When two scoreboards show the same game, a change made on one otherwise reaches
+the other through Adafruit IO on its next poll, seconds later. Each board also
+multicasts its scores and gender over UDP whenever they change locally, so peers
+on the subnet apply them within milliseconds. Adafruit IO stays the durable
+copy: the board where the change was made still pushes it, and peers treat what
+they receive as already synced.
+
+Messages are small JSON objects carrying the sender's board id, a sequence
+number and the feed values. Each is sent more than once since UDP may drop
+packets, and receivers drop duplicates and out-of-order messages by sequence
+number.
+"""
+
+import asyncio
+import json
+import random
+
+from src.async_http import would_block
+from src.compat import Any, Callable
+
+# Administratively scoped multicast group, only routed within the site
+DEFAULT_GROUP = "239.255.42.99"
+DEFAULT_PORT = 5999
+
+# Message format version, messages with any other version are ignored
+MESSAGE_VERSION = 1
+
+# Copies sent of each message
+SEND_REPEAT = 2
+
+# Delay between checks for incoming messages
+LAN_LOOP_DELAY = 0.02
+
+# Delay before retrying to open a socket that failed to open
+LAN_REOPEN_DELAY = 30.0
+
+RECV_BUFFER_SIZE = 512
+
+
+def _address_bytes(address: str) -> bytes:
+    """Pack a dotted IPv4 address, since CircuitPython has no inet_aton."""
+    return bytes(int(part) for part in address.split("."))
+
+
+class LanSync:
+    """Multicasts local state changes to peer boards and applies theirs."""
+
+    def __init__(
+        self,
+        socket_pool: Any,
+        on_feed_update: Callable,
+        board_id: str | None = None,
+        group: str = DEFAULT_GROUP,
+        port: int = DEFAULT_PORT,
+        interface: str = "0.0.0.0",
+    ):
+        """Initialize LanSync without opening its socket.
+
+        :param socket_pool: socketpool.SocketPool (or the CPython socket module)
+        :param on_feed_update: Async callback called with (feed_key, value) for
+            each value received from a peer
+        :param board_id: Identifies this board's messages. Defaults to a random
+            id, so a rebooted board's sequence numbers start over under a new id.
+        :param group: Multicast group address shared by the boards
+        :param port: UDP port shared by the boards
+        :param interface: Address of the network interface to multicast on
+        """
+        self._socket_pool = socket_pool
+        self._on_feed_update = on_feed_update
+        self.board_id = board_id or f"{random.getrandbits(32):08x}"
+        self._group = group
+        self._port = port
+        self._interface = interface
+        self._sock: Any = None
+        self._buffer = bytearray(RECV_BUFFER_SIZE)
+        self._sequence = 0
+        # Board id -> highest sequence number received from that board
+        self._last_sequence: dict[str, int] = {}
+        self.counters = {"sent": 0, "received": 0, "duplicates": 0, "invalid": 0}
+
+    @property
+    def is_open(self) -> bool:
+        """Check if the socket is open.
+
+        :return: True if messages can be sent and received
+        """
+        return self._sock is not None
+
+    def open(self) -> bool:
+        """Open the UDP socket and join the multicast group.
+
+        :return: True if opened, False otherwise
+        """
+        pool = self._socket_pool
+        sock = None
+        try:
+            sock = pool.socket(pool.AF_INET, pool.SOCK_DGRAM)
+            self._configure(sock)
+        except Exception as e:
+            print(f"LAN sync unavailable: {e}")
+            if sock is not None:
+                sock.close()
+            return False
+        self._sock = sock
+        return True
+
+    def _configure(self, sock: Any) -> None:
+        """Bind a new socket to the port and join the multicast group."""
+        pool = self._socket_pool
+        sock.setsockopt(pool.SOL_SOCKET, pool.SO_REUSEADDR, 1)
+        sock.bind(("0.0.0.0", self._port))
+        interface = _address_bytes(self._interface)
+        membership = _address_bytes(self._group) + interface
+        sock.setsockopt(pool.IPPROTO_IP, pool.IP_ADD_MEMBERSHIP, membership)
+        sock.setsockopt(pool.IPPROTO_IP, pool.IP_MULTICAST_IF, interface)
+        sock.setblocking(False)
+
+    def close(self) -> None:
+        """Close the socket."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def broadcast(self, values: dict[str, str | int]) -> bool:
+        """Send feed values to every peer.
+
+        :param values: Mapping of full feed key to value
+        :return: True if sent, False if the socket is closed or sending failed
+        """
+        if self._sock is None:
+            return False
+        self._sequence += 1
+        message = json.dumps(
+            {"v": MESSAGE_VERSION, "b": self.board_id, "s": self._sequence, "f": values}
+        ).encode()
+        try:
+            for _ in range(SEND_REPEAT):
+                self._sock.sendto(message, (self._group, self._port))
+        except OSError as e:
+            print(f"LAN sync send failed: {e}")
+            return False
+        self.counters["sent"] += 1
+        return True
+
+    def _accept(self, data: str) -> dict | None:
+        """Decode a message and check it is new.
+
+        :return: The message's feed values, or None if it should be ignored
+        """
+        try:
+            message = json.loads(data)
+            board_id = message["b"]
+            sequence = int(message["s"])
+            values = message["f"]
+        except (ValueError, KeyError, TypeError):
+            self.counters["invalid"] += 1
+            return None
+        if not isinstance(values, dict):
+            self.counters["invalid"] += 1
+            return None
+        if board_id == self.board_id or message.get("v") != MESSAGE_VERSION:
+            return None
+        if sequence <= self._last_sequence.get(board_id, 0):
+            self.counters["duplicates"] += 1
+            return None
+        self._last_sequence[board_id] = sequence
+        self.counters["received"] += 1
+        return values
+
+    def _receive(self) -> str | None:
+        """Receive one datagram without blocking.
+
+        :return: The datagram, or None if none is waiting
+        """
+        try:
+            count, _ = self._sock.recvfrom_into(self._buffer)
+        except OSError as error:
+            if would_block(error):
+                return None
+            raise
+        return str(memoryview(self._buffer)[:count], "utf-8")
+
+    async def process_messages(self) -> int:
+        """Receive waiting messages from peers and apply them.
+
+        :return: Number of messages applied
+        """
+        if self._sock is None:
+            return 0
+        applied = 0
+        while True:
+            try:
+                data = self._receive()
+            except OSError as e:
+                print(f"LAN sync receive failed: {e}")
+                self.close()
+                return applied
+            if data is None:
+                return applied
+            values = self._accept(data)
+            if values is None:
+                continue
+            print(f"LAN update: {values}")
+            for feed_key, value in values.items():
+                await self._on_feed_update(feed_key, str(value))
+            applied += 1
+
+    async def run(self) -> None:
+        """Keep the socket open and apply peer messages as they arrive."""
+        while True:
+            if not self.is_open and not self.open():
+                await asyncio.sleep(LAN_REOPEN_DELAY)
+                continue
+            await self.process_messages()
+            await asyncio.sleep(LAN_LOOP_DELAY)
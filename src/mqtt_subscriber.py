@@ -0,0 +1,114 @@
+"""Push-based feed updates from Adafruit IO over MQTT.
+
+Instead of polling every feed on a timer, we subscribe to the scores group's
+feeds and apply each value as soon as the broker delivers it. Polling is kept
+only as a slow fallback for when the subscription is down.
+"""
+
+import asyncio
+
+from src.compat import Callable
+from src.network_manager import NetworkManager
+from src.protocols import MQTTClientLike
+
+# Socket timeout for each client.loop() call, in seconds. Kept short since the
+# loop blocks the event loop while it waits for messages.
+MQTT_LOOP_TIMEOUT = 0.05
+
+# Delay between checks for incoming messages
+MQTT_LOOP_DELAY = 0.1
+
+# Delay before retrying a failed connection
+MQTT_RECONNECT_DELAY = 30.0
+
+SUBSCRIBED_FEEDS = NetworkManager.SCORES_GROUP_FEEDS
+
+
+class MqttSubscriber:
+    """Subscribes to the scores group feeds and hands each update to a callback."""
+
+    def __init__(
+        self,
+        mqtt_client: MQTTClientLike,
+        username: str,
+        on_feed_update: Callable,
+    ):
+        """Initialize MqttSubscriber with an MQTT client.
+
+        :param mqtt_client: MiniMQTT client (or MQTTClientLike implementation)
+        :param username: Adafruit IO username that owns the feeds
+        :param on_feed_update: Async callback called with (feed_key, value)
+        """
+        self._client = mqtt_client
+        self._topic_prefix = f"{username}/f/"
+        self._on_feed_update = on_feed_update
+        self._received = []
+        self._client.on_message = self._on_message
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the subscription is live.
+
+        :return: True if connected to the broker
+        """
+        try:
+            return self._client.is_connected()
+        except Exception:
+            return False
+
+    def connect(self) -> bool:
+        """Connect to the broker and subscribe to every scores group feed.
+
+        Also asks the broker to re-send the last value of each feed, so we start
+        in sync without an HTTP fetch.
+
+        :return: True if connected and subscribed, False otherwise
+        """
+        try:
+            self._client.connect()
+            for feed_key in SUBSCRIBED_FEEDS:
+                self._client.subscribe(self._topic_prefix + feed_key)
+            for feed_key in SUBSCRIBED_FEEDS:
+                self._client.publish(self._topic_prefix + feed_key + "/get", "\0")
+        except Exception as e:
+            print(f"MQTT connect failed: {e}")
+            return False
+        return True
+
+    def _on_message(self, client: MQTTClientLike, topic: str, message: str) -> None:
+        """Queue a received message to be applied from the event loop.
+
+        :param client: The MQTT client that received the message
+        :param topic: Topic the message was published to
+        :param message: The message payload
+        """
+        if topic.startswith(self._topic_prefix):
+            self._received.append((topic[len(self._topic_prefix) :], message))
+
+    async def process_messages(self) -> int:
+        """Receive pending messages and apply them.
+
+        :return: Number of feed updates applied
+        """
+        try:
+            self._client.loop(MQTT_LOOP_TIMEOUT)
+        except Exception as e:
+            print(f"MQTT loop failed: {e}")
+            return 0
+
+        applied = 0
+        while self._received:
+            feed_key, value = self._received.pop(0)
+            print(f"MQTT update: {feed_key} = {value}")
+            await self._on_feed_update(feed_key, value)
+            applied += 1
+        return applied
+
+    async def run(self) -> None:
+        """Keep the subscription connected and apply updates as they arrive."""
+        while True:
+            if not self.is_connected and not self.connect():
+                await asyncio.sleep(MQTT_RECONNECT_DELAY)
+                continue
+            await self.process_messages()
+            await asyncio.sleep(MQTT_LOOP_DELAY)
@@ -1,20 +1,45 @@
-"""Manages network interactions with Adafruit IO feeds."""
+"""Manages network interactions with the scoreboard feeds.
+
+The feeds live on Adafruit IO by default, but every read and write goes
+through a Transport, so the same logic runs over MQTT, the LAN or a local
+store as well.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import time
 
-from src.compat import TYPE_CHECKING
-from src.protocols import MatrixPortalLike
+from src.adafruit_io_client import is_throttle_error
+from src.circuit_breaker import CircuitBreaker
+from src.compat import TYPE_CHECKING, AsyncTimeoutError, Callable
+from src.cycle_budget import CycleBudget
+from src.feed_cache import FeedCache
+from src.game_snapshot import GameSnapshot
+from src.game_state_codec import GameStateDecodeError, decode_game_state, encode_game_state
+from src.protocols import MatrixPortalLike, Transport
+from src.request_budget import PRIORITY_POLL, PRIORITY_PUSH, RequestBudget
+from src.single_flight import SingleFlight
+from src.sync_queue import SyncQueue
+from src.transports.adafruit_io import AdafruitIOTransport
 
 if TYPE_CHECKING:
+    from src.adafruit_io_client import AsyncIOClient
     from src.display_manager import DisplayManager
     from src.gender_manager import GenderManager
 
+# How long after a write is acknowledged its values are taken as the group's
+# current state without reading them back, in seconds. Another scorekeeper's
+# write in that window is only seen once it has passed. The window runs from the
+# first write since the last read, so a board that keeps writing still reads.
+READ_YOUR_WRITES_WINDOW = 5.0
+
 
 class NetworkManager:
-    """Manages fetching data from Adafruit IO feeds."""
+    """Manages fetching data from the scoreboard feeds through a transport."""
+
+    # Group key containing all of the scoreboard feeds
+    SCORES_GROUP = "scores-group"
 
     # Feed key constants
     SCORES_LEFT_TEAM_FEED = "scores-group.left-team-score-feed"
@@ -22,100 +47,704 @@ class NetworkManager:
     TEAM_LEFT_TEAM_FEED = "scores-group.left-team-name"
     TEAM_RIGHT_TEAM_FEED = "scores-group.right-team-name"
     FIRST_POINT_GENDER_FEED = "scores-group.first-point-gender"
+    # Whole game state packed into one value, see game_state_codec
+    GAME_STATE_FEED = "scores-group.game-state"
+    # Per-replica score counters, see pn_counter
+    SCORES_LEFT_TEAM_COUNTER_FEED = "scores-group.left-team-score-counter"
+    SCORES_RIGHT_TEAM_COUNTER_FEED = "scores-group.right-team-score-counter"
+
+    # Every feed in the scores group, read together by a group read
+    SCORES_GROUP_FEEDS = (
+        SCORES_LEFT_TEAM_FEED,
+        SCORES_RIGHT_TEAM_FEED,
+        TEAM_LEFT_TEAM_FEED,
+        TEAM_RIGHT_TEAM_FEED,
+        FIRST_POINT_GENDER_FEED,
+        GAME_STATE_FEED,
+        SCORES_LEFT_TEAM_COUNTER_FEED,
+        SCORES_RIGHT_TEAM_COUNTER_FEED,
+    )
 
     DEFAULT_LEFT_TEAM_NAME = "AWAY"
     DEFAULT_RIGHT_TEAM_NAME = "HOME"
 
-    def __init__(self, matrixportal: MatrixPortalLike, display_manager: DisplayManager):
+    # How long cached values of slow-changing feeds stay fresh, in seconds
+    FEED_CACHE_TTLS = {
+        TEAM_LEFT_TEAM_FEED: 300.0,
+        TEAM_RIGHT_TEAM_FEED: 300.0,
+        FIRST_POINT_GENDER_FEED: 300.0,
+    }
+
+    def __init__(
+        self,
+        matrixportal: MatrixPortalLike,
+        display_manager: DisplayManager,
+        io_client: AsyncIOClient | None = None,
+        request_budget: RequestBudget | None = None,
+        packed_state: bool = False,
+        mirror_legacy_feeds: bool = True,
+        transport: Transport | None = None,
+        cycle_budget: CycleBudget | None = None,
+        read_your_writes_window: float = 0.0,
+        clock: Callable | None = None,
+    ):
         """Initialize NetworkManager with MatrixPortal.
 
         :param matrixportal: MatrixPortal-like instance for network operations
         :param display_manager: DisplayManager instance for showing connection status
+        :param io_client: Non-blocking Adafruit IO client. If None, the blocking
+            MatrixPortal calls are used instead, run off the event loop where the
+            platform allows it.
+        :param request_budget: Rate-limit budget shared by reads and writes. If
+            None, a budget for one board on the free plan is used.
+        :param packed_state: If True, read and write the whole game state through
+            the single packed game state feed
+        :param mirror_legacy_feeds: If True, packed writes also set the per-field
+            feeds, for boards that don't read the packed feed
+        :param transport: Transport that carries the feed values. If None, the
+            Adafruit IO HTTP API is used through io_client or matrixportal.
+        :param cycle_budget: Deadline of the current pass of the sync loop, which
+            every request must finish by. If None, requests only have their own
+            timeouts.
+        :param read_your_writes_window: How long after our first acknowledged
+            write since the last group read a read is answered from the written
+            values instead, in seconds, e.g. READ_YOUR_WRITES_WINDOW. 0 always
+            reads.
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
         """
-        self._matrixportal = matrixportal
         self.display_manager = display_manager
-        self._circuit_breaker_open_until: float | None = None
+        self._transport = transport or AdafruitIOTransport(matrixportal, io_client)
+        self._request_budget = request_budget or RequestBudget()
+        self._cycle_budget = cycle_budget or CycleBudget()
+        self._circuit_breakers: dict[str, CircuitBreaker] = {}
+        self._feed_cache = FeedCache(self.FEED_CACHE_TTLS)
+        self._revalidating: dict[str, asyncio.Task] = {}
+        self._single_flight = SingleFlight()
+        self._packed_state = packed_state
+        self._mirror_legacy_feeds = mirror_legacy_feeds
+        # Last game state read or written, the base for packed writes
+        self._game_state: GameSnapshot | None = None
+        self._game_state_version = 0
+        # Whether the network link is up, as last reported by the Wi-Fi supervisor
+        self._link_up = True
+        self._read_your_writes_window = read_your_writes_window
+        self._clock = clock
+        # Values of our writes the server acknowledged since the last group read,
+        # and when the first of them was acknowledged
+        self._acked_writes: dict[str, str | int] = {}
+        self._acked_at: float | None = None
+        self._reads_skipped = 0
+        self._sync_queue = SyncQueue(self, clock)
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Get the circuit breaker for an endpoint, creating it on first use.
+
+        :param endpoint: Adafruit IO API path, e.g. ``feeds/<key>``
+        :return: The endpoint's circuit breaker
+        """
+        breaker = self._circuit_breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(endpoint)
+            self._circuit_breakers[endpoint] = breaker
+        return breaker
+
+    def _allow_request(
+        self, endpoint: str, priority: str, cost: int = 1, low_priority: bool = False
+    ) -> CircuitBreaker | None:
+        """Check the cycle deadline, request budget and the endpoint's circuit breaker.
+
+        :param endpoint: Adafruit IO API path, e.g. ``feeds/<key>``
+        :param priority: PRIORITY_PUSH or PRIORITY_POLL
+        :param cost: Number of data operations the request counts as
+        :param low_priority: True for reads of slow-changing feeds, which are
+            skipped when little of the cycle budget is left
+        :return: The endpoint's circuit breaker if the request may be sent,
+            otherwise None
+        """
+        if not self._link_up:
+            return None
+        if not self._cycle_budget.allow_call(low_priority):
+            return None
+        if not self._request_budget.try_acquire(priority, cost):
+            return None
+        breaker = self._circuit_breaker(endpoint)
+        if not breaker.allow_request():
+            self._request_budget.refund(cost)
+            return None
+        return breaker
+
+    async def _within_cycle(self, call):
+        """Await a transport call, cutting it off at the cycle deadline.
+
+        :param call: Awaitable transport call
+        :return: The call's result
+        :raises AsyncTimeoutError: If the deadline passes first
+        """
+        remaining = self._cycle_budget.remaining()
+        if remaining is None:
+            return await call
+        try:
+            return await asyncio.wait_for(call, remaining)
+        except AsyncTimeoutError:
+            self._cycle_budget.record_timeout()
+            raise
+
+    def _record_request_error(self, breaker: CircuitBreaker, error: Exception) -> None:
+        """Record a failed request with the request budget or circuit breaker.
+
+        HTTP 429 means we are sending too much, not that the endpoint is down, so
+        it pauses every request instead of opening the breaker.
+        """
+        if is_throttle_error(error):
+            breaker.record_success()
+            self._request_budget.record_throttled(getattr(error, "retry_after", None))
+        else:
+            breaker.record_failure()
+
+    def set_link_up(self, up: bool) -> None:
+        """Record whether the network link is up, as reported by the Wi-Fi supervisor.
+
+        While the link is down every request is skipped before it starts. Failures
+        seen while the link was going down say nothing about the endpoints, so
+        the circuit breakers are reset when it comes back up.
 
-    def _is_circuit_breaker_open(self) -> bool:
-        """Check if the circuit breaker is currently open.
+        :param up: True if the link is up
+        """
+        if up and not self._link_up:
+            self.reset_circuit_breaker()
+        self._link_up = up
+
+    def get_request_budget(self) -> RequestBudget:
+        """Get the rate-limit budget, e.g. to pace polling by it.
+
+        :return: The request budget
+        """
+        return self._request_budget
+
+    def get_sync_queue(self) -> SyncQueue:
+        """Get the queue that synced managers register with and submit writes to.
 
-        :return: True if circuit breaker is open, False otherwise
+        :return: The sync queue
         """
-        if self._circuit_breaker_open_until is None:
-            return False
-        return time.monotonic() < self._circuit_breaker_open_until
+        return self._sync_queue
 
-    def _trigger_circuit_breaker(self) -> None:
-        """Trigger the circuit breaker to open for 60 seconds."""
-        self._circuit_breaker_open_until = time.monotonic() + 60
+    def get_cycle_budget(self) -> CycleBudget:
+        """Get the cycle budget, e.g. to start and end passes of the sync loop.
+
+        :return: The cycle budget
+        """
+        return self._cycle_budget
 
     def reset_circuit_breaker(self) -> None:
-        """Reset the circuit breaker to allow immediate network operations."""
-        self._circuit_breaker_open_until = None
+        """Reset every circuit breaker to allow immediate network operations."""
+        for breaker in self._circuit_breakers.values():
+            breaker.reset()
+
+    def get_circuit_breaker_stats(self) -> dict[str, dict[str, int | str]]:
+        """Get the state and transition counters of each endpoint's circuit breaker.
+
+        :return: Mapping of endpoint to its state and counters
+        """
+        return {
+            endpoint: {"state": breaker.state, **breaker.counters}
+            for endpoint, breaker in self._circuit_breakers.items()
+        }
 
-    async def _get_feed_value(self, feed_key: str) -> None | str:
-        """Fetch the last value from an Adafruit IO feed.
+    def get_transport(self) -> Transport:
+        """Get the transport that carries the feed values.
+
+        :return: The transport
+        """
+        return self._transport
+
+    async def _get_feed_value(self, feed_key: str, low_priority: bool = False) -> None | str:
+        """Fetch the last value of a feed.
+
+        Concurrent reads of the same feed share a single request.
 
         :param feed_key: The feed key to fetch from
+        :param low_priority: True if the read can wait for a later cycle
         :return: The last value from the feed, or None if not available
         """
-        if self._is_circuit_breaker_open():
+        return await self._single_flight.do(
+            f"feeds/{feed_key}", lambda: self._fetch_feed_value(feed_key, low_priority)
+        )
+
+    async def _fetch_feed_value(self, feed_key: str, low_priority: bool = False) -> None | str:
+        """Send the request for _get_feed_value."""
+        breaker = self._allow_request(
+            f"feeds/{feed_key}", PRIORITY_POLL, low_priority=low_priority
+        )
+        if breaker is None:
             return None
 
         await asyncio.sleep(0)
         self.display_manager.show_connecting(True)
         try:
-            feed = self._matrixportal.get_io_feed(feed_key, detailed=True)
-            value = feed["details"]["data"]["last"]
-            if value is not None:
-                return value["value"]
+            values = await self._within_cycle(self._transport.read_many((feed_key,)))
+            breaker.record_success()
+            return values.get(feed_key)
+        except (KeyError, TypeError):
+            # The endpoint answered, just not with the data we wanted
+            breaker.record_success()
             return None
+        except Exception as e:
+            self._record_request_error(breaker, e)
+            return None
+        finally:
+            self.display_manager.show_connecting(False)
+
+    async def _get_group_values(
+        self, group_key: str, low_priority: bool = False
+    ) -> dict[str, str | None] | None:
+        """Fetch the last value of every feed in a group.
+
+        Reads the whole group in a single request, shared by concurrent callers.
+
+        :param group_key: The group key to fetch from
+        :param low_priority: True if the read can wait for a later cycle
+        :return: Mapping of full feed key (``group.feed``) to last value, or None if
+            not available
+        """
+        return await self._single_flight.do(
+            f"groups/{group_key}", lambda: self._fetch_group_values(group_key, low_priority)
+        )
+
+    async def _fetch_group_values(
+        self, group_key: str, low_priority: bool = False
+    ) -> dict[str, str | None] | None:
+        """Send the request for _get_group_values."""
+        breaker = self._allow_request(
+            f"groups/{group_key}", PRIORITY_POLL, low_priority=low_priority
+        )
+        if breaker is None:
+            return None
+
+        await asyncio.sleep(0)
+        self.display_manager.show_connecting(True)
+        try:
+            values = await self._within_cycle(
+                self._transport.read_many(self._group_feed_keys(group_key))
+            )
+            breaker.record_success()
+            self._prime_feed_cache(group_key, values)
+            return values
         except (KeyError, TypeError):
+            # The endpoint answered, just not with the data we wanted
+            breaker.record_success()
             return None
-        except Exception:
-            self._trigger_circuit_breaker()
+        except Exception as e:
+            self._record_request_error(breaker, e)
             return None
         finally:
             self.display_manager.show_connecting(False)
 
+    def _group_feed_keys(self, group_key: str) -> tuple[str, ...]:
+        """Get the full keys of the feeds in a group."""
+        prefix = f"{group_key}."
+        return tuple(key for key in self.SCORES_GROUP_FEEDS if key.startswith(prefix))
+
+    def _prime_feed_cache(self, group_key: str, values: dict[str, str | None]) -> None:
+        """Cache the values of a group read, including feeds it had no value for."""
+        for feed_key in self.FEED_CACHE_TTLS:
+            if feed_key.startswith(f"{group_key}."):
+                self._feed_cache.put(feed_key, values.get(feed_key))
+
+    async def _refresh_feed_value(self, feed_key: str) -> str | None:
+        """Fetch a feed's value from the network, refreshing the cache.
+
+        Feeds in the scores group are refreshed by reading the whole group, which
+        costs the same one request and refreshes every cached feed at once. The
+        cached feeds change rarely, so the read is skipped when little of the
+        cycle budget is left.
+
+        :param feed_key: Full feed key
+        :return: The feed's value, or None if not available
+        """
+        if feed_key.startswith(f"{self.SCORES_GROUP}."):
+            values = await self._get_group_values(self.SCORES_GROUP, low_priority=True)
+            if values is None:
+                return None
+            return values.get(feed_key)
+        value = await self._get_feed_value(feed_key, low_priority=True)
+        if value is not None:
+            self._feed_cache.put(feed_key, value)
+        return value
+
+    async def _revalidate_feed_value(self, feed_key: str) -> None:
+        """Refresh a stale cached value in the background."""
+        try:
+            await self._refresh_feed_value(feed_key)
+        finally:
+            self._revalidating.pop(feed_key, None)
+
+    async def get_cached_feed_value(self, feed_key: str) -> str | None:
+        """Get a feed's value, from the cache where possible.
+
+        Fresh cached values are returned without a request. Stale values are
+        returned immediately while a background task fetches a new one. Feeds that
+        aren't cached yet, or have no time-to-live, are fetched from the network.
+
+        :param feed_key: Full feed key
+        :return: The feed's value, or None if not available
+        """
+        entry = self._feed_cache.get(feed_key)
+        if entry is None:
+            return await self._refresh_feed_value(feed_key)
+        value, is_fresh = entry
+        if not is_fresh and feed_key not in self._revalidating:
+            self._revalidating[feed_key] = asyncio.create_task(
+                self._revalidate_feed_value(feed_key)
+            )
+        return value
+
+    def cache_feed_value(self, feed_key: str, value: str | None) -> None:
+        """Store a feed value received from elsewhere, e.g. an MQTT push.
+
+        A value that differs from our own acknowledged write to the feed means
+        another board wrote it, so the next group read goes to the network.
+
+        :param feed_key: Full feed key
+        :param value: Latest value of the feed
+        """
+        self._feed_cache.put(feed_key, value)
+        if feed_key in self._acked_writes and str(self._acked_writes[feed_key]) != str(value):
+            self._forget_acked_writes()
+
+    def invalidate_feed_cache(self, feed_key: str | None = None) -> None:
+        """Drop a feed's cached value so the next read goes to the network.
+
+        :param feed_key: Full feed key, or None to clear the whole cache
+        """
+        self._feed_cache.invalidate(feed_key)
+
+    def get_feed_cache_stats(self) -> dict[str, int]:
+        """Get the feed cache's hit and miss counters.
+
+        :return: Mapping of counter name to count
+        """
+        return self._feed_cache.get_stats()
+
     async def _set_feed_value(self, feed_key: str, value: str | int) -> None:
-        """Set the value of an Adafruit IO feed.
+        """Set the value of a feed.
 
         :param feed_key: The feed key to set
         :param value: The value to set (string or int)
         """
-        if self._is_circuit_breaker_open():
+        breaker = self._allow_request(f"feeds/{feed_key}/data", PRIORITY_PUSH)
+        if breaker is None:
             return
 
         await asyncio.sleep(0)
         self.display_manager.show_connecting(True)
         try:
-            self._matrixportal.push_to_io(feed_key, value)
-        except Exception:
-            self._trigger_circuit_breaker()
+            await self._within_cycle(self._transport.write_many({feed_key: value}))
+            breaker.record_success()
+            self._record_written_values({feed_key: value}, None)
+            self._single_flight.forget(f"feeds/{feed_key}")
+        except Exception as e:
+            self._record_request_error(breaker, e)
             raise
         finally:
             self.display_manager.show_connecting(False)
 
-    async def get_left_team_score(self) -> int | None:
-        value = await self._get_feed_value(self.SCORES_LEFT_TEAM_FEED)
+    @staticmethod
+    def _parse_score(value: str | None) -> int | None:
+        """Convert a raw score feed value to an int.
+
+        :param value: Raw feed value
+        :return: The score, or None if the feed has no value
+        """
         if value is not None:
             return int(value)
         return None
 
+    @staticmethod
+    def _parse_gender(value: str | None) -> str:
+        """Normalize a raw gender feed value to a gender constant.
+
+        Accepts case-insensitive input from network (mmp/wmp/MMP/WMP).
+
+        :param value: Raw feed value
+        :return: Gender constant, or the default gender if the value is missing or invalid
+        """
+        from src.gender_manager import GenderManager
+
+        if value:
+            normalized = value.upper()
+            if normalized in {GenderManager.GENDER_MMP, GenderManager.GENDER_WMP}:
+                return normalized
+        return GenderManager.DEFAULT_GENDER
+
+    @staticmethod
+    def _validate_gender(value: str | int) -> None:
+        """Check that a value is a gender constant.
+
+        :param value: The gender value to check
+        :raises ValueError: If the value is not GenderManager.GENDER_WMP or
+            GenderManager.GENDER_MMP
+        """
+        from src.gender_manager import GenderManager
+
+        if value not in {GenderManager.GENDER_MMP, GenderManager.GENDER_WMP}:
+            raise ValueError(
+                f"Invalid gender value: {value}. "
+                f"Must be '{GenderManager.GENDER_WMP}' or '{GenderManager.GENDER_MMP}'"
+            )
+
+    def _snapshot_from_values(self, values: dict[str, str | None]) -> GameSnapshot:
+        """Build a snapshot from per-field feed values, applying defaults."""
+        return GameSnapshot(
+            left_score=self._parse_score(values.get(self.SCORES_LEFT_TEAM_FEED)),
+            right_score=self._parse_score(values.get(self.SCORES_RIGHT_TEAM_FEED)),
+            left_team_name=values.get(self.TEAM_LEFT_TEAM_FEED)
+            or self.DEFAULT_LEFT_TEAM_NAME,
+            right_team_name=values.get(self.TEAM_RIGHT_TEAM_FEED)
+            or self.DEFAULT_RIGHT_TEAM_NAME,
+            first_point_gender=self._parse_gender(
+                values.get(self.FIRST_POINT_GENDER_FEED)
+            ),
+            left_score_counter=values.get(self.SCORES_LEFT_TEAM_COUNTER_FEED),
+            right_score_counter=values.get(self.SCORES_RIGHT_TEAM_COUNTER_FEED),
+        )
+
+    def decode_packed_state(self, value: str | None) -> GameSnapshot | None:
+        """Decode a packed game state feed value and remember it.
+
+        States older than one already seen are ignored.
+
+        :param value: Raw value of the game state feed
+        :return: Snapshot of the game state, or None if the value is missing,
+            invalid or outdated
+        """
+        if not value:
+            return None
+        try:
+            snapshot, version = decode_game_state(value)
+        except GameStateDecodeError as e:
+            print(f"Ignoring packed game state: {e}")
+            return None
+        if version < self._game_state_version:
+            return None
+        snapshot.first_point_gender = self._parse_gender(snapshot.first_point_gender)
+        self._game_state = snapshot
+        self._game_state_version = version
+        self._feed_cache.put(self.TEAM_LEFT_TEAM_FEED, snapshot.left_team_name)
+        self._feed_cache.put(self.TEAM_RIGHT_TEAM_FEED, snapshot.right_team_name)
+        self._feed_cache.put(self.FIRST_POINT_GENDER_FEED, snapshot.first_point_gender)
+        return snapshot
+
+    async def get_group_snapshot(self) -> GameSnapshot | None:
+        """Fetch the whole game state with a single request.
+
+        With packed state enabled this reads just the packed game state feed,
+        falling back to the per-field feeds if it has no valid state yet.
+        Otherwise every feed in the scores group is read at once.
+
+        The snapshot's version tells callers whether any feed was written since
+        an earlier snapshot, so they can skip applying an unchanged one.
+
+        Right after our own write the snapshot is built from the written values
+        instead, see _snapshot_from_acked_writes.
+
+        :return: Snapshot of the game state, or None if it is not available
+        """
+        snapshot = self._snapshot_from_acked_writes()
+        if snapshot is not None:
+            self._reads_skipped += 1
+            return snapshot
+        self._forget_acked_writes()
+
+        if self._packed_state:
+            snapshot = self.decode_packed_state(
+                await self._get_feed_value(self.GAME_STATE_FEED)
+            )
+            if snapshot is not None:
+                snapshot.version = (self.GAME_STATE_FEED, self._game_state_version)
+                return snapshot
+
+        values = await self._get_group_values(self.SCORES_GROUP)
+        if values is None:
+            return None
+        snapshot = self._snapshot_from_values(values)
+        snapshot.version = self._transport.get_version(self._group_feed_keys(self.SCORES_GROUP))
+        self._game_state = snapshot
+        return snapshot
+
+    def _snapshot_from_acked_writes(self) -> GameSnapshot | None:
+        """Build the game state from the last read and our writes acknowledged since.
+
+        Reading the group right after our own write would only return the values
+        we just wrote, unless another board wrote in between. So within the
+        read-your-writes window of the first write acknowledged since the last
+        read, the last state read with our writes applied stands in for a read.
+        Later writes don't extend the window, so reads are never skipped for
+        longer than it.
+
+        :return: Snapshot without a version, or None if the group must be read
+        """
+        if self._acked_at is None or self._game_state is None:
+            return None
+        if self._now() - self._acked_at >= self._read_your_writes_window:
+            return None
+        base = self._game_state
+        values = self._acked_writes
+        left_score = values.get(self.SCORES_LEFT_TEAM_FEED, base.left_score)
+        right_score = values.get(self.SCORES_RIGHT_TEAM_FEED, base.right_score)
+        left_counter = values.get(self.SCORES_LEFT_TEAM_COUNTER_FEED, base.left_score_counter)
+        right_counter = values.get(self.SCORES_RIGHT_TEAM_COUNTER_FEED, base.right_score_counter)
+        return GameSnapshot(
+            left_score=None if left_score is None else int(left_score),
+            right_score=None if right_score is None else int(right_score),
+            left_team_name=str(values.get(self.TEAM_LEFT_TEAM_FEED, base.left_team_name)),
+            right_team_name=str(values.get(self.TEAM_RIGHT_TEAM_FEED, base.right_team_name)),
+            first_point_gender=str(
+                values.get(self.FIRST_POINT_GENDER_FEED, base.first_point_gender)
+            ),
+            left_score_counter=None if left_counter is None else str(left_counter),
+            right_score_counter=None if right_counter is None else str(right_counter),
+        )
+
+    def _forget_acked_writes(self) -> None:
+        """Make the next group read go to the network."""
+        self._acked_writes = {}
+        self._acked_at = None
+
+    def get_read_your_writes_stats(self) -> dict[str, int]:
+        """Get how many group reads were answered from our own writes.
+
+        :return: Mapping of counter name to count
+        """
+        return {"reads_skipped": self._reads_skipped, "acked_feeds": len(self._acked_writes)}
+
+    def _pack_feed_values(
+        self, values: dict[str, str | int]
+    ) -> tuple[GameSnapshot, dict[str, str | int]]:
+        """Merge changed feed values into the last game state and pack it.
+
+        :param values: Mapping of full feed key to the changed value
+        :return: Tuple of (merged game state, feed values to write)
+        """
+        base = self._game_state or self._snapshot_from_values({})
+        left_score = values.get(self.SCORES_LEFT_TEAM_FEED, base.left_score)
+        right_score = values.get(self.SCORES_RIGHT_TEAM_FEED, base.right_score)
+        state = GameSnapshot(
+            left_score=None if left_score is None else int(left_score),
+            right_score=None if right_score is None else int(right_score),
+            left_team_name=base.left_team_name,
+            right_team_name=base.right_team_name,
+            first_point_gender=str(
+                values.get(self.FIRST_POINT_GENDER_FEED, base.first_point_gender)
+            ),
+        )
+        packed: dict[str, str | int] = {
+            self.GAME_STATE_FEED: encode_game_state(state, self._game_state_version + 1)
+        }
+        if self._mirror_legacy_feeds:
+            packed.update(values)
+        return state, packed
+
+    def write_cost(self, values: dict[str, str | int]) -> int:
+        """Get the number of data operations set_feed_values charges for a write.
+
+        With packed state the write sets the packed feed, plus every per-field
+        feed if they are mirrored.
+
+        :param values: Mapping of full feed key to the value to set
+        :return: Number of feeds the write sets
+        """
+        if not self._packed_state:
+            return len(values)
+        return 1 + (len(values) if self._mirror_legacy_feeds else 0)
+
+    def _record_written_values(
+        self, values: dict[str, str | int], state: GameSnapshot | None
+    ) -> None:
+        """Update the cache and last game state after a successful write.
+
+        :param values: Mapping of full feed key to the value written
+        :param state: Packed game state that was written, if any
+        """
+        for feed_key, value in values.items():
+            self._feed_cache.put(feed_key, str(value))
+        if self._read_your_writes_window > 0:
+            self._acked_writes.update(values)
+            if self._acked_at is None:
+                self._acked_at = self._now()
+        if state is not None:
+            self._game_state = state
+            self._game_state_version += 1
+
+    async def set_feed_values(self, values: dict[str, str | int]) -> None:
+        """Set several feeds in the scores group with a single request.
+
+        All values are written together, so other boards never read a state where
+        only some of them have been applied. With packed state enabled the values
+        are merged into the last known game state and written as one packed value,
+        plus the per-field feeds if they are mirrored.
+
+        :param values: Mapping of full feed key to the value to set
+        :raises ValueError: If a feed is not in the scores group, or a gender value
+            is invalid
+        :raises ConnectionError: If the network link is down, the cycle deadline
+            has passed, the circuit breaker is open or the request budget is spent
+        """
+        prefix = f"{self.SCORES_GROUP}."
+        for feed_key, value in values.items():
+            if not feed_key.startswith(prefix):
+                raise ValueError(f"Feed {feed_key} is not in group {self.SCORES_GROUP}")
+            if feed_key == self.FIRST_POINT_GENDER_FEED:
+                self._validate_gender(value)
+
+        cost = self.write_cost(values)
+        state = None
+        if self._packed_state:
+            state, values = self._pack_feed_values(values)
+
+        breaker = self._allow_request(f"groups/{self.SCORES_GROUP}/data", PRIORITY_PUSH, cost)
+        if breaker is None:
+            raise ConnectionError(
+                "Link down, cycle deadline passed, circuit breaker open or request "
+                "budget spent, not sending feed values"
+            )
+
+        # Reads started before this write must not be shared with later callers
+        self._single_flight.forget(f"groups/{self.SCORES_GROUP}")
+        for feed_key in values:
+            self._single_flight.forget(f"feeds/{feed_key}")
+
+        await asyncio.sleep(0)
+        self.display_manager.show_connecting(True)
+        try:
+            await self._within_cycle(self._transport.write_many(values))
+            breaker.record_success()
+            self._record_written_values(values, state)
+        except Exception as e:
+            self._record_request_error(breaker, e)
+            raise
+        finally:
+            self.display_manager.show_connecting(False)
+
+    async def get_left_team_score(self) -> int | None:
+        return self._parse_score(await self._get_feed_value(self.SCORES_LEFT_TEAM_FEED))
+
     async def get_right_team_score(self) -> int | None:
-        value = await self._get_feed_value(self.SCORES_RIGHT_TEAM_FEED)
-        if value is not None:
-            return int(value)
-        return None
+        return self._parse_score(await self._get_feed_value(self.SCORES_RIGHT_TEAM_FEED))
 
     async def get_left_team_name(self) -> str:
-        if value := await self._get_feed_value(self.TEAM_LEFT_TEAM_FEED):
+        if value := await self.get_cached_feed_value(self.TEAM_LEFT_TEAM_FEED):
             return value
         return self.DEFAULT_LEFT_TEAM_NAME
 
     async def get_right_team_name(self) -> str:
-        if value := await self._get_feed_value(self.TEAM_RIGHT_TEAM_FEED):
+        if value := await self.get_cached_feed_value(self.TEAM_RIGHT_TEAM_FEED):
             return value
         return self.DEFAULT_RIGHT_TEAM_NAME
 
@@ -141,13 +770,9 @@ class NetworkManager:
 
         :return: Gender constant (GenderManager.GENDER_WMP or GenderManager.GENDER_MMP)
         """
-        from src.gender_manager import GenderManager
-
-        if value := await self._get_feed_value(self.FIRST_POINT_GENDER_FEED):
-            normalized = value.upper()
-            if normalized in {GenderManager.GENDER_MMP, GenderManager.GENDER_WMP}:
-                return normalized
-        return GenderManager.DEFAULT_GENDER
+        return self._parse_gender(
+            await self.get_cached_feed_value(self.FIRST_POINT_GENDER_FEED)
+        )
 
     async def set_first_point_gender(self, value: str) -> None:
         """Set the first point gender on Adafruit IO.
@@ -156,11 +781,5 @@ class NetworkManager:
 
         :param value: The gender value to set (GenderManager.GENDER_WMP or GenderManager.GENDER_MMP)
         """
-        from src.gender_manager import GenderManager
-
-        if value not in {GenderManager.GENDER_MMP, GenderManager.GENDER_WMP}:
-            raise ValueError(
-                f"Invalid gender value: {value}. "
-                f"Must be '{GenderManager.GENDER_WMP}' or '{GenderManager.GENDER_MMP}'"
-            )
+        self._validate_gender(value)
         await self._set_feed_value(self.FIRST_POINT_GENDER_FEED, value)
@@ -1,20 +1,60 @@
 """Network patches for faster failure behavior.
 
-This module provides monkey-patches to reduce network retries and timeouts
-for faster failure when network is unavailable.
+This module provides monkey-patches to reduce network retries, and to time
+blocking HTTP calls out adaptively, after what the host's measured round-trip
+times allow, instead of after the library's default 10 seconds.
 """
 
-from src.compat import TYPE_CHECKING, Any
+import time
 
-if TYPE_CHECKING:
-    from src.protocols import MatrixPortalLike
+from src.compat import Any
+from src.rtt_estimator import RttEstimator, host_of
+
+# errno of a timed-out socket operation
+_ETIMEDOUT = 110
 
 # Track which requests objects have been patched to avoid double-patching
 _patched_requests = set()
 
 
-def _patch_requests_get(requests_obj: Any) -> None:
-    """Patch requests.get with shorter timeout if not already patched."""
+def _is_timeout(error: OSError) -> bool:
+    """Check if an error from a blocking HTTP call means it timed out."""
+    if isinstance(error, TimeoutError):
+        return True
+    return bool(error.args) and error.args[0] == _ETIMEDOUT
+
+
+def _with_adaptive_timeout(call: Any, rtt_estimator: RttEstimator) -> Any:
+    """Wrap a blocking HTTP call taking a URL so it times out adaptively.
+
+    The host's adaptive timeout replaces any timeout the caller passes, such as
+    the 10 seconds PortalBase's fetch_data always passes, and the call's
+    duration or timeout is fed back into it.
+
+    :param call: Function called with the URL as its first argument
+    :param rtt_estimator: Estimator providing and learning the timeouts
+    :return: The wrapped function
+    """
+
+    def call_with_adaptive_timeout(url, *args, **kwargs):
+        """Wrapper that overrides the timeout with the host's adaptive one."""
+        host = host_of(url)
+        kwargs["timeout"] = rtt_estimator.timeout(host)
+        started = time.monotonic()
+        try:
+            result = call(url, *args, **kwargs)
+        except OSError as e:
+            if _is_timeout(e):
+                rtt_estimator.record_timeout(host)
+            raise
+        rtt_estimator.record_sample(host, time.monotonic() - started)
+        return result
+
+    return call_with_adaptive_timeout
+
+
+def _patch_requests_get(requests_obj: Any, rtt_estimator: RttEstimator) -> None:
+    """Patch requests.get with adaptive timeouts if not already patched."""
     if requests_obj is None:
         return
     
@@ -24,36 +64,33 @@ def _patch_requests_get(requests_obj: Any) -> None:
         return
     
     if hasattr(requests_obj, "get"):
-        original_requests_get = requests_obj.get
-
-        def requests_get_with_short_timeout(*args, **kwargs):
-            """Wrapper that forces timeout=2 for faster failure."""
-            kwargs["timeout"] = 2
-            return original_requests_get(*args, **kwargs)
-
-        requests_obj.get = requests_get_with_short_timeout
+        requests_obj.get = _with_adaptive_timeout(requests_obj.get, rtt_estimator)
         _patched_requests.add(requests_id)
 
 
-def apply_network_patches(matrixportal: Any) -> None:
+def apply_network_patches(
+    matrixportal: Any, rtt_estimator: RttEstimator | None = None
+) -> RttEstimator:
     """Apply all network patches to reduce retries and timeouts.
 
     Patches:
     - network.connect: Forces max_attempts=1 (no retries)
-    - network.fetch: Forces timeout=2 seconds (instead of 10)
-    - requests.get: Forces timeout=2 seconds for direct HTTP calls
+    - network.fetch: Adaptive per-host timeout instead of the caller's
+    - requests.get: Adaptive per-host timeout for direct HTTP calls instead of
+      the caller's
 
     :param matrixportal: MatrixPortal instance to patch
+    :param rtt_estimator: Estimator providing the timeouts, shared with the async
+        HTTP client so both learn from every request. If None, one with the
+        default bounds is created.
+    :return: The estimator used
     """
-    # Monkey-patch network.fetch to use shorter timeout (2 seconds instead of 10)
-    original_fetch = matrixportal.network.fetch
-
-    def fetch_with_short_timeout(*args, **kwargs):
-        """Wrapper that forces timeout=2 for faster failure."""
-        kwargs["timeout"] = 2
-        return original_fetch(*args, **kwargs)
+    if rtt_estimator is None:
+        rtt_estimator = RttEstimator()
 
-    matrixportal.network.fetch = fetch_with_short_timeout
+    matrixportal.network.fetch = _with_adaptive_timeout(
+        matrixportal.network.fetch, rtt_estimator
+    )
 
     # Monkey-patch network.connect to fail immediately (no retries)
     # Also patch requests.get lazily when connect is called
@@ -65,12 +102,13 @@ def apply_network_patches(matrixportal: Any) -> None:
         result = original_connect(*args, **kwargs)
         
         # Patch requests.get after connection is established (requests is now set)
-        _patch_requests_get(matrixportal.network._wifi.requests)
+        _patch_requests_get(matrixportal.network._wifi.requests, rtt_estimator)
         
         return result
 
     matrixportal.network.connect = connect_with_no_retries
 
     # Patch requests.get immediately if it already exists (e.g., from previous connection)
-    _patch_requests_get(matrixportal.network._wifi.requests)
+    _patch_requests_get(matrixportal.network._wifi.requests, rtt_estimator)
+    return rtt_estimator
 
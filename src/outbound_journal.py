@@ -0,0 +1,261 @@
+"""Journal of unsynced changes that survives a reset.
+
+Pending changes otherwise only live in RAM, so a brown-out or reset while
+offline, e.g. when the battery pack is swapped, loses every point that was not
+synced yet. The journal keeps them in non-volatile memory (microcontroller.nvm)
+instead, and they are restored and pushed after the next boot.
+
+Flash wears with every write, and on some boards each write erases a whole
+page, so recording a change only updates RAM. Changes are written out in one
+batch when a sync fails or while syncs are failing, at most once per
+MIN_FLUSH_INTERVAL; a flush asked for sooner is remembered and done by
+flush_deferred() once the interval has passed. A change that syncs right away
+never touches flash. Each record has a fixed size and holds a
+feed's latest value; replaying the records in order gives every feed's latest
+unsynced value. Once changes sync, the journal is compacted by starting a new
+generation that holds only what is still unsynced.
+"""
+
+import struct
+import time
+
+from src.compat import Any, Callable
+from src.gender_manager import GenderManager
+from src.network_manager import NetworkManager
+from src.score_manager import LEFT_COUNTER_EPOCH_KEY, RIGHT_COUNTER_EPOCH_KEY
+
+# Header: magic, generation, reserved
+_HEADER = "<4sHH"
+_HEADER_SIZE = struct.calcsize(_HEADER)
+_MAGIC = b"SBJ1"
+# Record: sequence number, feed id, check byte, value
+_RECORD = "<HBBi"
+RECORD_SIZE = struct.calcsize(_RECORD)
+# Set in a record's feed id when its value is an index into the symbols
+_SYMBOL_FLAG = 0x80
+
+# Feeds, and keys kept along with them, the journal records, by feed id. Only
+# ever append to these tuples, the ids and indexes are stored on the board.
+JOURNAL_FEEDS = (
+    NetworkManager.SCORES_LEFT_TEAM_FEED,
+    NetworkManager.SCORES_RIGHT_TEAM_FEED,
+    NetworkManager.FIRST_POINT_GENDER_FEED,
+    # This board's own increment total of each score counter
+    NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED,
+    NetworkManager.SCORES_RIGHT_TEAM_COUNTER_FEED,
+    # The epoch of each score counter those totals were counted in
+    LEFT_COUNTER_EPOCH_KEY,
+    RIGHT_COUNTER_EPOCH_KEY,
+)
+# String values the journal can record
+JOURNAL_SYMBOLS = (GenderManager.GENDER_WMP, GenderManager.GENDER_MMP)
+
+# Shortest time between two writes to flash, in seconds
+MIN_FLUSH_INTERVAL = 5.0
+
+
+def _check_byte(generation: int, seq: int, feed_id: int, value: int) -> int:
+    """Checksum tying a record to its generation, so old and torn records are ignored."""
+    data = struct.pack("<HHBi", generation, seq, feed_id, value)
+    return (sum(data) & 0xFF) ^ 0xA5
+
+
+class OutboundJournal:
+    """Append-only journal of unsynced feed values in non-volatile memory."""
+
+    def __init__(
+        self,
+        storage: Any,
+        feeds: tuple[str, ...] = JOURNAL_FEEDS,
+        symbols: tuple[str, ...] = JOURNAL_SYMBOLS,
+        min_flush_interval: float = MIN_FLUSH_INTERVAL,
+        clock: Callable | None = None,
+    ):
+        """Initialize OutboundJournal, replaying what storage holds.
+
+        Storage that doesn't hold a journal yet is formatted.
+
+        :param storage: Byte-addressable non-volatile memory supporting len()
+            and slice reads and writes, e.g. microcontroller.nvm
+        :param feeds: Feed keys that can be recorded, by feed id
+        :param symbols: String values that can be recorded
+        :param min_flush_interval: Shortest time between two writes to flash
+            that aren't forced, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        self._storage = storage
+        self._feeds = feeds
+        self._symbols = symbols
+        self._min_flush_interval = min_flush_interval
+        self._clock = clock
+        self.capacity = (len(storage) - _HEADER_SIZE) // RECORD_SIZE
+        self._generation = 0
+        # Number of records in the current generation
+        self._records = 0
+        # Latest unsynced value of each feed, feeds whose latest value is not
+        # on flash yet, and feeds with a record on flash
+        self._latest: dict[str, str | int] = {}
+        self._dirty: set[str] = set()
+        self._on_flash: set[str] = set()
+        self._flushed_at: float | None = None
+        # A flush was asked for too soon after the last one
+        self._flush_requested = False
+        self.counters = {"appends": 0, "flushes": 0, "compactions": 0, "replayed": 0}
+        self._replay()
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def _replay(self) -> None:
+        """Load the latest value of each feed from storage, formatting it if needed."""
+        magic, generation, _ = struct.unpack(_HEADER, bytes(self._storage[:_HEADER_SIZE]))
+        if magic != _MAGIC:
+            self._write_generation(0)
+            return
+        self._generation = generation
+        for seq in range(self.capacity):
+            start = _HEADER_SIZE + seq * RECORD_SIZE
+            record = bytes(self._storage[start : start + RECORD_SIZE])
+            record_seq, feed_id, check, value = struct.unpack(_RECORD, record)
+            valid = record_seq == seq and (feed_id & ~_SYMBOL_FLAG) < len(self._feeds)
+            if not valid or check != _check_byte(generation, seq, feed_id, value):
+                break
+            self._latest[self._feeds[feed_id & ~_SYMBOL_FLAG]] = self._decode(feed_id, value)
+            self._records += 1
+        self._on_flash = set(self._latest)
+        self.counters["replayed"] = self._records
+
+    def _decode(self, feed_id: int, value: int) -> str | int:
+        """Get a record's value."""
+        if feed_id & _SYMBOL_FLAG:
+            return self._symbols[value]
+        return value
+
+    def _encode(self, seq: int, feed_key: str, value: str | int) -> bytes:
+        """Pack a feed value into a record.
+
+        :raises ValueError: If the feed or string value can't be recorded
+        """
+        feed_id = self._feeds.index(feed_key)
+        if isinstance(value, str):
+            feed_id |= _SYMBOL_FLAG
+            value = self._symbols.index(value)
+        check = _check_byte(self._generation, seq, feed_id, value)
+        return struct.pack(_RECORD, seq, feed_id, check, value)
+
+    def _write_generation(self, generation: int) -> None:
+        """Start a new generation holding the latest value of each unsynced feed.
+
+        The header and records go out in one write.
+        """
+        self._generation = generation % 0x10000
+        data = struct.pack(_HEADER, _MAGIC, self._generation, 0)
+        feed_keys = list(self._latest)
+        for seq, feed_key in enumerate(feed_keys):
+            data += self._encode(seq, feed_key, self._latest[feed_key])
+        self._storage[: len(data)] = data
+        self._records = len(feed_keys)
+        self._on_flash = set(feed_keys)
+        self._dirty = set()
+
+    def pending_values(self) -> dict[str, str | int]:
+        """Get the latest unsynced value of each feed, e.g. to restore them at boot.
+
+        :return: Mapping of feed key to value
+        """
+        return dict(self._latest)
+
+    def append(self, values: dict[str, str | int]) -> None:
+        """Record unsynced feed values, in RAM until the next flush.
+
+        :param values: Mapping of feed key to its new unsynced value
+        :raises ValueError: If a feed or string value can't be recorded
+        """
+        for feed_key, value in values.items():
+            if feed_key not in self._feeds or (
+                isinstance(value, str) and value not in self._symbols
+            ):
+                raise ValueError(f"Can't journal {feed_key} = {value!r}")
+            self._latest[feed_key] = value
+            self._dirty.add(feed_key)
+        self.counters["appends"] += 1
+
+    def flush(self, force: bool = False) -> bool:
+        """Write the values recorded since the last flush to flash in one batch.
+
+        :param force: If True, write even if the last flush was too recent
+        :return: True if everything recorded is on flash
+        """
+        if not self._dirty:
+            self._flush_requested = False
+            return True
+        now = self._now()
+        if (
+            not force
+            and self._flushed_at is not None
+            and now - self._flushed_at < self._min_flush_interval
+        ):
+            self._flush_requested = True
+            return False
+        if self._records + len(self._dirty) > self.capacity:
+            self._write_generation(self._generation + 1)
+            self.counters["compactions"] += 1
+        else:
+            data = b""
+            for seq, feed_key in enumerate(sorted(self._dirty), self._records):
+                data += self._encode(seq, feed_key, self._latest[feed_key])
+            start = _HEADER_SIZE + self._records * RECORD_SIZE
+            self._storage[start : start + len(data)] = data
+            self._records += len(self._dirty)
+            self._on_flash |= self._dirty
+            self._dirty = set()
+        self._flushed_at = now
+        self._flush_requested = False
+        self.counters["flushes"] += 1
+        return True
+
+    def flush_deferred(self) -> bool:
+        """Do a flush that was put off by the rate limit, if its interval has passed.
+
+        :return: True if everything recorded is on flash or no flush is waiting
+        """
+        if not self._flush_requested:
+            return True
+        return self.flush()
+
+    def mark_synced(self, values: dict[str, str | int]) -> None:
+        """Drop feed values that have been pushed, compacting flash if it holds them.
+
+        Values changed again since they were pushed stay in the journal.
+
+        :param values: Mapping of feed key to the value that was pushed
+        """
+        synced = {
+            feed_key
+            for feed_key, value in values.items()
+            if feed_key in self._latest and self._latest[feed_key] == value
+        }
+        if not synced:
+            return
+        for feed_key in synced:
+            del self._latest[feed_key]
+        self._dirty -= synced
+        if synced & self._on_flash:
+            self._write_generation(self._generation + 1)
+            self.counters["compactions"] += 1
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the journal's counters and how much of it is in use.
+
+        :return: Mapping of counter name to value
+        """
+        return {
+            "records": self._records,
+            "capacity": self.capacity,
+            "pending": len(self._latest),
+            **self.counters,
+        }
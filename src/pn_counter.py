@@ -0,0 +1,183 @@
+"""Score counter that several boards can change at once without losing points.
+
+A plain score feed is last-writer-wins: when two scorekeepers press at the same
+time, both write the same new score and one point is lost. A PN-counter instead
+gives each writer (replica) its own increment and decrement totals, which only
+it ever raises. The score is the sum of the increments minus the sum of the
+decrements, and two counters merge by taking the larger total of each replica,
+so merges commute and repeat safely and every board converges once it has seen
+the others' counters, with no retries or reads before writes.
+
+Totals only ever grow, so a score can't be set back by lowering them: any board
+still holding the old totals would merge them back. Setting a score back, e.g.
+starting a new game, instead starts a new epoch of the counter. A counter of a
+later epoch replaces one of an earlier epoch outright on merge, and one of an
+earlier epoch is ignored, so the reset wins on every board, along with any
+change made on top of it. Changes made in the earlier epoch that no board had
+merged before the reset are dropped. The feed value is
+
+    PN1;<replica>:<increments>:<decrements>,<replica>:<increments>:<decrements>
+
+in epoch 0, or PN1@<epoch>;... in a later epoch, with the replicas sorted, so
+equal counters always encode to the same value.
+"""
+
+from __future__ import annotations
+
+FORMAT_TAG = "PN1"
+_EPOCH_SEPARATOR = "@"
+_SEPARATOR = ";"
+_ENTRY_SEPARATOR = ","
+_FIELD_SEPARATOR = ":"
+
+# Replica holding a score that was on the plain feed before any board counted
+LEGACY_REPLICA = "legacy"
+
+
+class PNCounterDecodeError(ValueError):
+    """Raised when a counter feed value can't be decoded."""
+
+
+def validate_replica_id(replica_id: str) -> None:
+    """Check that a replica id can be encoded.
+
+    :param replica_id: Name of the writer, unique per board
+    :raises ValueError: If the id is empty or contains a separator
+    """
+    if not replica_id or any(
+        separator in replica_id
+        for separator in (_SEPARATOR, _ENTRY_SEPARATOR, _FIELD_SEPARATOR)
+    ):
+        raise ValueError(f"Invalid replica id: {replica_id!r}")
+
+
+class PNCounter:
+    """Per-replica increment and decrement totals of one score."""
+
+    def __init__(
+        self,
+        increments: dict[str, int] | None = None,
+        decrements: dict[str, int] | None = None,
+        epoch: int = 0,
+    ):
+        """Initialize PNCounter.
+
+        :param increments: Mapping of replica id to its increment total
+        :param decrements: Mapping of replica id to its decrement total
+        :param epoch: Number of times the counter has been reset
+        """
+        self.increments = dict(increments or {})
+        self.decrements = dict(decrements or {})
+        self.epoch = epoch
+
+    def value(self) -> int:
+        """Get the score the counter adds up to."""
+        return sum(self.increments.values()) - sum(self.decrements.values())
+
+    def increment(self, replica_id: str, amount: int = 1) -> None:
+        """Add to a replica's increments.
+
+        :param replica_id: The replica making the change, i.e. this board
+        :param amount: How much to add
+        """
+        self.increments[replica_id] = self.increments.get(replica_id, 0) + amount
+
+    def decrement(self, replica_id: str, amount: int = 1) -> None:
+        """Add to a replica's decrements.
+
+        :param replica_id: The replica making the change, i.e. this board
+        :param amount: How much to subtract from the score
+        """
+        self.decrements[replica_id] = self.decrements.get(replica_id, 0) + amount
+
+    def reset(self, score: int = 0) -> None:
+        """Start a new epoch that adds up to a score, dropping every replica's totals.
+
+        :param score: Score the counter starts from, counted as the legacy replica's
+        """
+        self.increments = {LEGACY_REPLICA: score} if score else {}
+        self.decrements = {}
+        self.epoch += 1
+
+    def merge(self, other: PNCounter) -> bool:
+        """Merge another counter in, keeping the larger total of each replica.
+
+        A counter of another epoch is not merged: a later one replaces this
+        counter and an earlier one is ignored.
+
+        :param other: Counter to merge in, e.g. one read from the network
+        :return: True if this counter changed
+        """
+        if other.epoch != self.epoch:
+            if other.epoch < self.epoch:
+                return False
+            self.increments = dict(other.increments)
+            self.decrements = dict(other.decrements)
+            self.epoch = other.epoch
+            return True
+        changed = False
+        for mine, theirs in (
+            (self.increments, other.increments),
+            (self.decrements, other.decrements),
+        ):
+            for replica_id, total in theirs.items():
+                if total > mine.get(replica_id, 0):
+                    mine[replica_id] = total
+                    changed = True
+        return changed
+
+    def copy(self) -> PNCounter:
+        """Get an independent copy of the counter."""
+        return PNCounter(self.increments, self.decrements, self.epoch)
+
+    def encode(self) -> str:
+        """Encode the counter as a feed value, see the module docstring."""
+        replica_ids = sorted(set(self.increments) | set(self.decrements))
+        entries = [
+            _FIELD_SEPARATOR.join(
+                (
+                    replica_id,
+                    str(self.increments.get(replica_id, 0)),
+                    str(self.decrements.get(replica_id, 0)),
+                )
+            )
+            for replica_id in replica_ids
+        ]
+        tag = FORMAT_TAG
+        if self.epoch:
+            tag += _EPOCH_SEPARATOR + str(self.epoch)
+        return tag + _SEPARATOR + _ENTRY_SEPARATOR.join(entries)
+
+    @staticmethod
+    def decode(text: str) -> PNCounter:
+        """Decode a counter from a feed value.
+
+        :param text: Value written by encode()
+        :return: The counter
+        :raises PNCounterDecodeError: If the value is not a valid counter
+        """
+        tag, _, body = text.partition(_SEPARATOR)
+        tag, _, epoch = tag.partition(_EPOCH_SEPARATOR)
+        if tag != FORMAT_TAG:
+            raise PNCounterDecodeError(f"Unsupported counter format: {tag}")
+        counter = PNCounter()
+        if epoch:
+            try:
+                counter.epoch = int(epoch)
+            except ValueError as e:
+                raise PNCounterDecodeError(f"Invalid counter epoch: {e}") from e
+            if counter.epoch < 0:
+                raise PNCounterDecodeError(f"Negative counter epoch: {epoch}")
+        for entry in body.split(_ENTRY_SEPARATOR) if body else ():
+            fields = entry.split(_FIELD_SEPARATOR)
+            if len(fields) != 3 or not fields[0]:
+                raise PNCounterDecodeError(f"Invalid counter entry: {entry}")
+            try:
+                increments, decrements = int(fields[1]), int(fields[2])
+            except ValueError as e:
+                raise PNCounterDecodeError(f"Invalid number in counter: {e}") from e
+            if increments < 0 or decrements < 0:
+                raise PNCounterDecodeError(f"Negative total in counter entry: {entry}")
+            counter.increments[fields[0]] = increments
+            counter.decrements[fields[0]] = decrements
+        return counter
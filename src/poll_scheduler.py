@@ -0,0 +1,138 @@
+"""Adaptive scheduling of network polls based on game activity.
+
+A fixed poll interval is too slow during close play and wastes requests between
+games. We poll at the floor interval right after local or remote activity, and
+back off toward the ceiling while nothing changes. The floor rises when the
+request budget can't sustain it.
+"""
+
+import asyncio
+import time
+
+from src.compat import Callable
+
+DEFAULT_MIN_POLL_INTERVAL = 3.0
+DEFAULT_MAX_POLL_INTERVAL = 120.0
+DEFAULT_BACKOFF_FACTOR = 1.5
+
+# How often wait() checks its wake condition, in seconds
+WAKE_CHECK_INTERVAL = 0.1
+
+REASON_STARTUP = "startup"
+REASON_LOCAL_ACTIVITY = "local activity"
+REASON_REMOTE_ACTIVITY = "remote activity"
+REASON_IDLE = "idle backoff"
+REASON_SUBSCRIBED = "push subscription live"
+REASON_RATE_LIMIT = "request budget"
+
+
+class PollScheduler:
+    """Chooses how long to wait between network polls.
+
+    The current interval and the reason for it are exposed for logging.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_MIN_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        clock: Callable = time.monotonic,
+    ):
+        """Initialize PollScheduler at the floor interval.
+
+        :param min_interval: Floor for the poll interval, in seconds
+        :param max_interval: Ceiling for the poll interval, in seconds
+        :param backoff_factor: Multiplier applied to the interval after each idle poll
+        :param clock: Function returning the current time in seconds
+        :raises ValueError: If min_interval is greater than max_interval
+        """
+        if min_interval > max_interval:
+            raise ValueError("min_interval must not be greater than max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._clock = clock
+        self._interval = min_interval
+        self._reason = REASON_STARTUP
+        self._last_poll_time: float | None = None
+        self._rate_floor = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Get the current poll interval, in seconds."""
+        return self._interval
+
+    @property
+    def reason(self) -> str:
+        """Get the reason for the current poll interval."""
+        return self._reason
+
+    @property
+    def floor(self) -> float:
+        """Get the shortest interval currently allowed, in seconds."""
+        return min(max(self.min_interval, self._rate_floor), self.max_interval)
+
+    def set_rate_floor(self, interval: float) -> None:
+        """Raise the floor to the interval the request budget can sustain.
+
+        :param interval: Shortest sustainable poll interval, in seconds
+        """
+        self._rate_floor = interval
+        if self._interval < self.floor:
+            self._set_interval(self.floor, REASON_RATE_LIMIT)
+
+    def _set_interval(self, interval: float, reason: str) -> None:
+        """Update the interval and log when it changes."""
+        interval = max(self.floor, min(interval, self.max_interval))
+        if interval != self._interval or reason != self._reason:
+            print(f"Poll interval {self._interval:.1f}s -> {interval:.1f}s ({reason})")
+        self._interval = interval
+        self._reason = reason
+
+    def record_local_activity(self) -> None:
+        """Poll at the floor interval after a local change."""
+        self._set_interval(self.floor, REASON_LOCAL_ACTIVITY)
+
+    def record_remote_activity(self) -> None:
+        """Poll at the floor interval after a change from the network."""
+        self._set_interval(self.floor, REASON_REMOTE_ACTIVITY)
+
+    def record_idle(self) -> None:
+        """Back off after a poll that found nothing new."""
+        self._set_interval(self._interval * self._backoff_factor, REASON_IDLE)
+
+    def record_subscribed(self) -> None:
+        """Poll at the ceiling while updates are pushed to us."""
+        self._set_interval(self.max_interval, REASON_SUBSCRIBED)
+
+    def record_poll(self) -> None:
+        """Record that a poll has just been made."""
+        self._last_poll_time = self._clock()
+
+    def time_until_poll(self) -> float:
+        """Get the time left until the next poll is due.
+
+        :return: Seconds until the next poll, 0 if it is due now
+        """
+        if self._last_poll_time is None:
+            return 0.0
+        return max(0.0, self._last_poll_time + self._interval - self._clock())
+
+    def is_poll_due(self) -> bool:
+        """Check if the next poll is due.
+
+        :return: True if it is time to poll
+        """
+        return self.time_until_poll() <= 0
+
+    async def wait(self, wake_condition: Callable | None = None) -> None:
+        """Wait until the next poll is due, or until wake_condition returns True.
+
+        :param wake_condition: Optional function checked periodically; returning
+            True ends the wait early, e.g. when local changes need syncing
+        """
+        while not self.is_poll_due():
+            if wake_condition is not None and wake_condition():
+                return
+            await asyncio.sleep(min(WAKE_CHECK_INTERVAL, self.time_until_poll()))
@@ -8,6 +8,8 @@ from src.protocols.board import BoardLike
 from src.protocols.button import ButtonLike
 from src.protocols.keypad import EventLike, EventQueueLike, KeysLike
 from src.protocols.matrixportal import MatrixPortalLike
+from src.protocols.mqtt import MQTTClientLike
+from src.protocols.transport import Transport
 
 __all__ = [
     "BoardLike",
@@ -16,4 +18,6 @@ __all__ = [
     "EventQueueLike",
     "KeysLike",
     "MatrixPortalLike",
+    "MQTTClientLike",
+    "Transport",
 ]
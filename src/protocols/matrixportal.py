@@ -11,6 +11,14 @@ class MatrixPortalLike(Protocol):
         """Get the display object."""
         ...
 
+    @property
+    def network(self) -> Any:
+        """Get the network object.
+
+        Its ``io_client`` exposes the Adafruit IO HTTP client used for group writes.
+        """
+        ...
+
     def get_io_feed(self, feed_key: str, detailed: bool = False) -> Any:
         """Get an IO feed value.
 
@@ -20,6 +28,14 @@ class MatrixPortalLike(Protocol):
         """
         ...
 
+    def get_io_group(self, group_key: str) -> Any:
+        """Get an IO group, including the last value of each of its feeds.
+
+        :param group_key: The group key to retrieve
+        :return: Group data structure with a ``feeds`` list
+        """
+        ...
+
     def push_to_io(
         self,
         feed_key: str,
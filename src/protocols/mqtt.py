@@ -0,0 +1,56 @@
+"""Protocol definition for MQTT client interface."""
+
+from src.compat import Any, Protocol
+
+
+class MQTTClientLike(Protocol):
+    """Protocol defining the adafruit_minimqtt MQTT client interface used in this project."""
+
+    @property
+    def on_message(self) -> Any:
+        """Callback called with (client, topic, message) for each received message."""
+        ...
+
+    @on_message.setter
+    def on_message(self, method: Any) -> None:
+        """Set the callback called for each received message.
+
+        :param method: Function taking (client, topic, message)
+        """
+        ...
+
+    def connect(self) -> Any:
+        """Connect to the broker."""
+        ...
+
+    def is_connected(self) -> bool:
+        """Check if the client is connected to the broker.
+
+        :return: True if connected
+        """
+        ...
+
+    def subscribe(self, topic: str, qos: int = 0) -> Any:
+        """Subscribe to a topic.
+
+        :param topic: The topic to subscribe to
+        :param qos: Quality of service level
+        """
+        ...
+
+    def publish(self, topic: str, msg: str, retain: bool = False, qos: int = 0) -> None:
+        """Publish a message to a topic.
+
+        :param topic: The topic to publish to
+        :param msg: The message payload
+        :param retain: Whether the broker should retain the message
+        :param qos: Quality of service level
+        """
+        ...
+
+    def loop(self, timeout: float = 1.0) -> Any:
+        """Process incoming messages, calling on_message for each one.
+
+        :param timeout: Maximum time to wait for messages, in seconds
+        """
+        ...
@@ -0,0 +1,50 @@
+"""Protocol definition for the transports that carry feed values."""
+
+from src.compat import Callable, Protocol
+
+
+class Transport(Protocol):
+    """Protocol for moving feed values between this board and its peers.
+
+    Feeds are addressed by full feed key (``group.feed``). NetworkManager keeps
+    the request budget, circuit breakers and caching on top of a transport, so a
+    transport only reads, writes and, where it can, pushes updates.
+    """
+
+    name: str
+    """Short name of the transport, as used in settings.toml."""
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Read the latest value of several feeds, in as few requests as possible.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each requested feed key to its latest value, or None
+            if the feed has no value
+        :raises KeyError: If the response did not hold the requested data
+        :raises TypeError: If the response did not hold the requested data
+        """
+        ...
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Write several feed values together, in as few requests as possible.
+
+        :param values: Mapping of full feed key to the value to write
+        """
+        ...
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """Identify the writes behind the values last read for some feeds.
+
+        :param feed_keys: Full feed keys the version covers
+        :return: A value that changes whenever one of the feeds is written, or
+            None if the transport can't tell
+        """
+        ...
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Have values written elsewhere pushed to a callback as they arrive.
+
+        :param on_feed_update: Async callback called with (feed_key, value)
+        :return: True if the transport pushes updates, False if it must be polled
+        """
+        ...
@@ -0,0 +1,144 @@
+"""Token-bucket budget for Adafruit IO requests.
+
+Adafruit IO throttles an account to a fixed number of data operations per
+minute, shared by every board using the same key. Each board spends tokens from
+a bucket refilled at its share of that rate. Part of the bucket is reserved for
+pushes, so polling never uses up the tokens needed to save a score. When the
+server throttles us anyway, we stop until the time it asks us to wait.
+"""
+
+import time
+
+from src.compat import Callable
+
+# Adafruit IO free plan limit, in data operations per minute
+DEFAULT_RATE_PER_MINUTE = 30.0
+# Fraction of the bucket that only pushes may use
+DEFAULT_PUSH_RESERVE = 0.25
+# How long to back off after throttling when the server gives no hint, in seconds
+DEFAULT_THROTTLE_BACKOFF = 60.0
+
+PRIORITY_PUSH = "push"
+PRIORITY_POLL = "poll"
+
+
+class RequestBudget:
+    """Decides whether a request fits in the account's rate limit."""
+
+    def __init__(
+        self,
+        rate_per_minute: float = DEFAULT_RATE_PER_MINUTE,
+        boards_sharing: int = 1,
+        push_reserve: float = DEFAULT_PUSH_RESERVE,
+        clock: Callable | None = None,
+    ):
+        """Initialize a full RequestBudget.
+
+        :param rate_per_minute: Account-wide limit, in requests per minute
+        :param boards_sharing: Number of boards using the same Adafruit IO key.
+            Each board gets an equal share of the rate.
+        :param push_reserve: Fraction of the bucket that only pushes may use
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        per_minute = rate_per_minute / max(1, boards_sharing)
+        self._rate = per_minute / 60.0
+        # Allow a burst of up to 10 seconds' worth of requests, but at least two
+        self.capacity = max(2.0, per_minute / 6.0)
+        self._push_reserve = push_reserve
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = self._now()
+        self._throttled_until = 0.0
+        self.counters = {"granted": 0, "rejected": 0, "throttled": 0}
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    def _refill(self) -> float:
+        """Add the tokens earned since the last update.
+
+        :return: The current time
+        """
+        now = self._now()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+        return now
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of requests that could be made right now."""
+        self._refill()
+        return self._tokens
+
+    def is_throttled(self) -> bool:
+        """Check if we are backing off after the server throttled us.
+
+        :return: True while no requests may be made
+        """
+        return self._now() < self._throttled_until
+
+    def try_acquire(self, priority: str, cost: float = 1.0) -> bool:
+        """Spend tokens for a request if the budget allows it.
+
+        :param priority: PRIORITY_PUSH or PRIORITY_POLL. Polls may not use the
+            reserved part of the bucket.
+        :param cost: Number of data operations the request counts as
+        :return: True if the request may be sent
+        """
+        now = self._refill()
+        reserve = 0.0 if priority == PRIORITY_PUSH else self.capacity * self._push_reserve
+        if now < self._throttled_until or self._tokens - cost < reserve:
+            self.counters["rejected"] += 1
+            return False
+        self._tokens -= cost
+        self.counters["granted"] += 1
+        return True
+
+    def refund(self, cost: float = 1.0) -> None:
+        """Give back tokens for a request that was not sent after all.
+
+        :param cost: Number of tokens to give back
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + cost)
+
+    def record_throttled(self, retry_after: float | None = None) -> None:
+        """Stop all requests after the server responded with HTTP 429.
+
+        :param retry_after: Seconds the server asked us to wait, if it said
+        """
+        if retry_after is None:
+            retry_after = DEFAULT_THROTTLE_BACKOFF
+        self._refill()
+        self._tokens = 0.0
+        self._throttled_until = self._now() + retry_after
+        self.counters["throttled"] += 1
+        print(f"Adafruit IO throttled us, backing off for {retry_after:.0f}s")
+
+    def recommended_poll_interval(self) -> float:
+        """Get the shortest poll interval the budget can sustain right now.
+
+        Polls can use the unreserved share of the rate. The interval doubles once
+        the bucket is half empty, so polling slows down before the server has to
+        throttle us, and covers any remaining throttle backoff.
+
+        :return: Poll interval in seconds
+        """
+        now = self._refill()
+        interval = 1.0 / (self._rate * (1.0 - self._push_reserve))
+        if self._tokens < self.capacity / 2:
+            interval *= 2
+        return max(interval, self._throttled_until - now)
+
+    def get_stats(self) -> dict[str, float]:
+        """Get the budget's counters and remaining tokens.
+
+        :return: Mapping of counter name to value
+        """
+        return {"tokens": self.tokens, **self.counters}
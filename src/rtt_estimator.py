@@ -0,0 +1,151 @@
+"""Adaptive request timeouts from measured round-trip times.
+
+A fixed timeout is wrong in both directions: too long when the access point is
+gone, since each attempt stalls for the full timeout, and too short on a slow
+but working link, where it fails requests that would have succeeded and trips
+the circuit breakers. Like TCP's retransmission timer (RFC 6298), we keep a
+smoothed round-trip time and its variation per host, and time requests out
+after the smoothed time plus four times the variation, within configured
+bounds. Each timeout doubles the next one until a request succeeds again.
+"""
+
+from src.compat import Callable
+
+DEFAULT_MIN_TIMEOUT = 0.5
+DEFAULT_MAX_TIMEOUT = 10.0
+# Timeout for a host with no samples yet. Covers a TLS handshake on the ESP32.
+DEFAULT_INITIAL_TIMEOUT = 3.0
+
+# Gains from RFC 6298
+_SRTT_GAIN = 0.125
+_RTTVAR_GAIN = 0.25
+_RTTVAR_FACTOR = 4
+
+# Timeout changes smaller than this fraction are not logged
+_LOG_CHANGE = 0.25
+
+
+def host_of(url: str) -> str:
+    """Get the host (and port, if given) of a URL.
+
+    :param url: An absolute URL
+    :return: The host, e.g. ``io.adafruit.com``
+    """
+    return url.partition("://")[2].partition("/")[0]
+
+
+class _HostRtt:
+    """Round-trip time estimate for one host."""
+
+    def __init__(self, timeout: float):
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+        self.timeout = timeout
+        self.logged_timeout = timeout
+        self.samples = 0
+        self.timeouts = 0
+
+
+class RttEstimator:
+    """Estimates round-trip times per host and derives request timeouts from them."""
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_MIN_TIMEOUT,
+        max_timeout: float = DEFAULT_MAX_TIMEOUT,
+        initial_timeout: float = DEFAULT_INITIAL_TIMEOUT,
+        log: Callable = print,
+    ):
+        """Initialize RttEstimator with no samples.
+
+        :param min_timeout: Lower bound for timeouts, in seconds
+        :param max_timeout: Upper bound for timeouts, in seconds
+        :param initial_timeout: Timeout for a host until it has samples, in seconds
+        :param log: Function called with a message whenever a timeout fires or
+            a host's timeout changes noticeably
+        :raises ValueError: If min_timeout is greater than max_timeout
+        """
+        if min_timeout > max_timeout:
+            raise ValueError("min_timeout must not be greater than max_timeout")
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._initial_timeout = min(max(initial_timeout, min_timeout), max_timeout)
+        self._log = log
+        self._hosts: dict[str, _HostRtt] = {}
+
+    def _host(self, host: str) -> _HostRtt:
+        """Get a host's estimate, creating it on first use."""
+        estimate = self._hosts.get(host)
+        if estimate is None:
+            estimate = _HostRtt(self._initial_timeout)
+            self._hosts[host] = estimate
+        return estimate
+
+    def _clamp(self, timeout: float) -> float:
+        """Keep a timeout within the configured bounds."""
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
+    def timeout(self, host: str) -> float:
+        """Get the timeout for the next request to a host.
+
+        :param host: Host name, see host_of
+        :return: Timeout in seconds
+        """
+        return self._host(host).timeout
+
+    def record_sample(self, host: str, rtt: float) -> None:
+        """Update a host's estimate with the duration of a completed request.
+
+        Also undoes any timeout backoff, since the host answered.
+
+        :param host: Host name, see host_of
+        :param rtt: Time the request took, in seconds
+        """
+        estimate = self._host(host)
+        if estimate.srtt is None:
+            estimate.srtt = rtt
+            estimate.rttvar = rtt / 2
+        else:
+            estimate.rttvar += _RTTVAR_GAIN * (abs(estimate.srtt - rtt) - estimate.rttvar)
+            estimate.srtt += _SRTT_GAIN * (rtt - estimate.srtt)
+        estimate.samples += 1
+        estimate.timeout = self._clamp(estimate.srtt + _RTTVAR_FACTOR * estimate.rttvar)
+        change = abs(estimate.timeout - estimate.logged_timeout)
+        if change > _LOG_CHANGE * estimate.logged_timeout:
+            self._log(
+                f"Timeout for {host} now {estimate.timeout:.2f}s "
+                f"(srtt {estimate.srtt:.3f}s, rttvar {estimate.rttvar:.3f}s)"
+            )
+            estimate.logged_timeout = estimate.timeout
+
+    def record_timeout(self, host: str) -> None:
+        """Double a host's timeout after a request to it timed out.
+
+        :param host: Host name, see host_of
+        """
+        estimate = self._host(host)
+        expired = estimate.timeout
+        estimate.timeouts += 1
+        estimate.timeout = self._clamp(expired * 2)
+        estimate.logged_timeout = estimate.timeout
+        self._log(
+            f"Request to {host} timed out after {expired:.2f}s, "
+            f"next timeout {estimate.timeout:.2f}s"
+        )
+
+    def get_stats(self) -> dict[str, dict[str, float | int | None]]:
+        """Get each host's estimate and current timeout, for tuning the bounds.
+
+        :return: Mapping of host to its srtt, rttvar, timeout, sample count and
+            timeout count
+        """
+        return {
+            host: {
+                "srtt": estimate.srtt,
+                "rttvar": estimate.rttvar,
+                "timeout": estimate.timeout,
+                "samples": estimate.samples,
+                "timeouts": estimate.timeouts,
+            }
+            for host, estimate in self._hosts.items()
+        }
@@ -1,38 +1,214 @@
+from __future__ import annotations
+
 import asyncio
+import random
 
+from src.compat import TYPE_CHECKING, Callable
+from src.game_snapshot import GameSnapshot
 from src.network_manager import NetworkManager
-from src.sync_manager import SyncManager
+from src.pn_counter import LEGACY_REPLICA, PNCounter, PNCounterDecodeError, validate_replica_id
+from src.sync_manager import COALESCE_MAX_DELAY, SyncManager
+from src.sync_queue import PRIORITY_SCORES
+
+if TYPE_CHECKING:
+    from src.outbound_journal import OutboundJournal
+
+# Counter feed of each score feed
+_COUNTER_FEEDS = {
+    NetworkManager.SCORES_LEFT_TEAM_FEED: NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED,
+    NetworkManager.SCORES_RIGHT_TEAM_FEED: NetworkManager.SCORES_RIGHT_TEAM_COUNTER_FEED,
+}
+# Journal keys of each score counter's epoch, kept along with this board's
+# totals. Never pushed.
+LEFT_COUNTER_EPOCH_KEY = "scores-group.left-team-score-counter.epoch"
+RIGHT_COUNTER_EPOCH_KEY = "scores-group.right-team-score-counter.epoch"
+_COUNTER_EPOCH_KEYS = {
+    NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED: LEFT_COUNTER_EPOCH_KEY,
+    NetworkManager.SCORES_RIGHT_TEAM_COUNTER_FEED: RIGHT_COUNTER_EPOCH_KEY,
+}
 
 
 class ScoreManager(SyncManager):
-    """Manages score state with async network sync."""
+    """Manages score state with async network sync.
+
+    By default the score feeds are last-writer-wins, and local changes take
+    precedence until they are synced. With a replica id each score is a
+    PN-counter instead, see pn_counter: the counter feeds hold every board's
+    totals, network counters are always merged into ours, and the plain score
+    feeds are written alongside for readers that don't count. A board only
+    pushes its counters once it has merged the network's after boot, since
+    until then its own totals may be behind what it wrote before a reset; its
+    presses meanwhile are journaled right away. A plain score written over a
+    counter feed, e.g. 0 from the dashboard for a new game, starts a new epoch
+    of the counter from that score.
+    """
+
+    SYNC_PRIORITY = PRIORITY_SCORES
 
-    def __init__(self, network_manager: NetworkManager):
+    def __init__(
+        self,
+        network_manager: NetworkManager,
+        journal: OutboundJournal | None = None,
+        coalesce_window: float = 0.0,
+        coalesce_max_delay: float = COALESCE_MAX_DELAY,
+        clock: Callable | None = None,
+        random_source: Callable = random.random,
+        replica_id: str | None = None,
+    ):
         """Initialize ScoreManager with NetworkManager.
 
         :param network_manager: NetworkManager instance for fetching data
+        :param journal: Journal keeping unsynced scores across resets
+        :param coalesce_window: Quiet time after a change before it is pushed, in
+            seconds. 0 pushes changes right away.
+        :param coalesce_max_delay: Longest a change is held back, in seconds
+        :param clock: Function returning the current time in seconds
+        :param random_source: Function returning a float in [0, 1), for retry jitter
+        :param replica_id: Name of this board among the writers of the score
+            counters, unique per board. If None, scores are last-writer-wins.
+        :raises ValueError: If replica_id can't be encoded in a counter
         """
-        super().__init__()
-        self._network_manager = network_manager
+        super().__init__(
+            network_manager, journal, coalesce_window, coalesce_max_delay, clock, random_source
+        )
+        if replica_id is not None:
+            validate_replica_id(replica_id)
+        self._replica_id = replica_id
         self.left_score: int = 0
         self.right_score: int = 0
         self._last_synced_left = 0
         self._last_synced_right = 0
+        # Score counters by counter feed, the counters the network holds as
+        # last read or written, and whether the network's were merged since boot
+        self._counters = {feed_key: PNCounter() for feed_key in _COUNTER_FEEDS.values()}
+        self._synced_counters = {
+            feed_key: PNCounter().encode() for feed_key in _COUNTER_FEEDS.values()
+        }
+        self._counters_merged = False
 
-    async def _perform_sync(self) -> None:
-        """Perform sync of scores to network.
+    def get_local_feed_values(self) -> dict[str, str | int]:
+        """Get both local scores, and their counters if scores are counted.
 
-        Syncs left and right scores if they have changed.
+        :return: Mapping of score feed key to local score
         """
-        if self.left_score != self._last_synced_left:
-            await self._network_manager.set_left_team_score(self.left_score)
-            self._last_synced_left = self.left_score
+        values: dict[str, str | int] = {
+            NetworkManager.SCORES_LEFT_TEAM_FEED: self.left_score,
+            NetworkManager.SCORES_RIGHT_TEAM_FEED: self.right_score,
+        }
+        if self._replica_id is not None:
+            for feed_key, counter in self._counters.items():
+                values[feed_key] = counter.encode()
+        return values
 
-        await asyncio.sleep(0)
+    def _is_sync_held(self) -> bool:
+        """Check if counters are held back because the network's haven't been merged.
+
+        :return: True if scores are counted and not merged since boot
+        """
+        return self._replica_id is not None and not self._counters_merged
 
+    def _pending_feed_values(self) -> dict[str, str | int]:
+        """Get the scores that have changed since the last sync.
+
+        Counted scores go out with their counter.
+
+        :return: Mapping of score feed key to local score
+        """
+        if self._replica_id is not None:
+            return self._pending_counter_values()
+        values: dict[str, str | int] = {}
+        if self.left_score != self._last_synced_left:
+            values[NetworkManager.SCORES_LEFT_TEAM_FEED] = self.left_score
         if self.right_score != self._last_synced_right:
-            await self._network_manager.set_right_team_score(self.right_score)
-            self._last_synced_right = self.right_score
+            values[NetworkManager.SCORES_RIGHT_TEAM_FEED] = self.right_score
+        return values
+
+    def _mark_feed_values_synced(self, values: dict[str, str | int]) -> None:
+        """Record pushed scores as the last synced scores.
+
+        :param values: Mapping of feed key to pushed value
+        """
+        if NetworkManager.SCORES_LEFT_TEAM_FEED in values:
+            self._last_synced_left = int(values[NetworkManager.SCORES_LEFT_TEAM_FEED])
+        if NetworkManager.SCORES_RIGHT_TEAM_FEED in values:
+            self._last_synced_right = int(values[NetworkManager.SCORES_RIGHT_TEAM_FEED])
+        for feed_key in self._counters:
+            if feed_key in values:
+                self._synced_counters[feed_key] = str(values[feed_key])
+
+    def _pending_counter_values(self) -> dict[str, str | int]:
+        """Get the counters that differ from the network's, with their scores.
+
+        :return: Mapping of feed key to encoded counter or score
+        """
+        values: dict[str, str | int] = {}
+        for score_feed, counter_feed in _COUNTER_FEEDS.items():
+            encoded = self._counters[counter_feed].encode()
+            if encoded != self._synced_counters[counter_feed]:
+                values[counter_feed] = encoded
+                values[score_feed] = self._counters[counter_feed].value()
+        return values
+
+    def _journal_values(self, values: dict[str, str | int]) -> dict[str, str | int]:
+        """Keep only this board's increment total of each counter in the journal.
+
+        The other boards' totals are merged back from the network after a reset.
+        Each total is kept with the epoch it was counted in.
+
+        :param values: Mapping of feed key to a pending or pushed value
+        :return: Mapping of counter feed key to this board's increment total,
+            and of counter epoch key to the counter's epoch
+        """
+        if self._replica_id is None:
+            return values
+        journaled: dict[str, str | int] = {}
+        for feed_key, epoch_key in _COUNTER_EPOCH_KEYS.items():
+            if feed_key in values:
+                counter = PNCounter.decode(str(values[feed_key]))
+                journaled[feed_key] = counter.increments.get(self._replica_id, 0)
+                journaled[epoch_key] = counter.epoch
+        return journaled
+
+    def _restore_feed_values(self, values: dict[str, str | int]) -> bool:
+        """Set local scores from journaled scores that were never synced.
+
+        :param values: Mapping of feed key to unsynced value
+        :return: True if either score was restored
+        """
+        if self._replica_id is not None:
+            return self._restore_counter_values(values, self._replica_id)
+        restored = False
+        if NetworkManager.SCORES_LEFT_TEAM_FEED in values:
+            self.left_score = int(values[NetworkManager.SCORES_LEFT_TEAM_FEED])
+            restored = True
+        if NetworkManager.SCORES_RIGHT_TEAM_FEED in values:
+            self.right_score = int(values[NetworkManager.SCORES_RIGHT_TEAM_FEED])
+            restored = True
+        if restored:
+            print(f"Restored unsynced scores {self.left_score}-{self.right_score}")
+        return restored
+
+    def _restore_counter_values(self, values: dict[str, str | int], replica_id: str) -> bool:
+        """Restore this board's journaled increment totals into the counters.
+
+        :param values: Mapping of feed key to unsynced value
+        :param replica_id: This board's replica id
+        :return: True if either counter was restored
+        """
+        restored = False
+        for feed_key, epoch_key in _COUNTER_EPOCH_KEYS.items():
+            if feed_key in values:
+                self._counters[feed_key].merge(
+                    PNCounter(
+                        {replica_id: int(values[feed_key])},
+                        epoch=int(values.get(epoch_key, 0)),
+                    )
+                )
+                restored = True
+        if restored:
+            self._update_scores_from_counters()
+            print(f"Restored unsynced score counts {self.left_score}-{self.right_score}")
+        return restored
 
     async def try_sync_scores(self) -> bool:
         """Attempt to sync local scores to network.
@@ -41,26 +217,31 @@ class ScoreManager(SyncManager):
         """
         return await self._try_sync_with_backoff()
 
-    async def update_scores_from_network(self):
+    async def update_scores_from_network(self, snapshot: GameSnapshot | None = None):
         """Fetch latest scores from Adafruit IO and update internal state.
 
-        Will skip network fetch if there are pending local changes to sync.
+        Will skip network fetch if there are pending local changes to sync. A
+        snapshot passed in by the caller is discarded if local changes had to be
+        synced first, since it predates them. Counted scores are merged instead,
+        pending changes or not.
 
+        :param snapshot: Already-fetched group snapshot, or None to fetch one
         :return: True if either score has changed, False otherwise
         """
+        if self._replica_id is not None:
+            return await self._merge_network_scores(snapshot)
         if self._has_pending_sync:
             if not await self.try_sync_scores():
                 print("Skipping network update - local changes pending")
                 return False
+            if snapshot is not None:
+                print("Skipping network update - snapshot predates local changes")
+                return False
 
-        score_left = await self._network_manager.get_left_team_score()
-        if score_left is None:
-            print("No left score from network")
-            return False
-        await asyncio.sleep(0)
-        score_right = await self._network_manager.get_right_team_score()
-        if score_right is None:
-            print("No right score from network")
+        if snapshot is None:
+            snapshot = await self._network_manager.get_group_snapshot()
+        if snapshot is None or snapshot.left_score is None or snapshot.right_score is None:
+            print("No scores from network")
             return False
         await asyncio.sleep(0)
 
@@ -70,6 +251,46 @@ class ScoreManager(SyncManager):
             )
             return False
 
+        return self._apply_network_scores(snapshot.left_score, snapshot.right_score)
+
+    def apply_feed_update(self, feed_key: str, value: str) -> bool:
+        """Apply a single feed value pushed from the network.
+
+        Ignores feeds other than the score feeds. Local changes take precedence
+        until they are synced, so updates are skipped while changes are pending.
+        Counted scores only take updates of the counter feeds, which are merged.
+
+        :param feed_key: Full feed key the value was published to
+        :param value: The new feed value
+        :return: True if either score has changed, False otherwise
+        """
+        if self._replica_id is not None:
+            if feed_key not in self._counters:
+                return False
+            self._merge_network_counter(feed_key, value)
+            return self._apply_merged_counters()
+
+        score_left = self._last_synced_left
+        score_right = self._last_synced_right
+        if feed_key == NetworkManager.SCORES_LEFT_TEAM_FEED:
+            score_left = int(value)
+        elif feed_key == NetworkManager.SCORES_RIGHT_TEAM_FEED:
+            score_right = int(value)
+        else:
+            return False
+
+        if self._has_pending_sync:
+            print("Skipping pushed score update - local changes pending")
+            return False
+        return self._apply_network_scores(score_left, score_right)
+
+    def _apply_network_scores(self, score_left: int, score_right: int) -> bool:
+        """Replace local scores with scores from the network.
+
+        :param score_left: Left team score from the network
+        :param score_right: Right team score from the network
+        :return: True if either score has changed, False otherwise
+        """
         previous_left_score = self.left_score
         previous_right_score = self.right_score
         self.left_score = score_left
@@ -89,12 +310,118 @@ class ScoreManager(SyncManager):
             )
         return left_changed or right_changed
 
+    async def _merge_network_scores(self, snapshot: GameSnapshot | None) -> bool:
+        """Merge the network's score counters into ours.
+
+        :param snapshot: Already-fetched group snapshot, or None to fetch one
+        :return: True if either score has changed, False otherwise
+        """
+        if snapshot is None:
+            snapshot = await self._network_manager.get_group_snapshot()
+        if snapshot is None:
+            print("No scores from network")
+            return False
+        self._merge_network_counter(
+            NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED,
+            snapshot.left_score_counter,
+            snapshot.left_score,
+        )
+        self._merge_network_counter(
+            NetworkManager.SCORES_RIGHT_TEAM_COUNTER_FEED,
+            snapshot.right_score_counter,
+            snapshot.right_score,
+        )
+        self._counters_merged = True
+        return self._apply_merged_counters()
+
+    def _merge_network_counter(
+        self, feed_key: str, value: str | None, legacy_score: int | None = None
+    ) -> None:
+        """Merge a counter feed value into our counter.
+
+        A feed without a valid counter holds the plain score alone, which is
+        counted as the legacy replica's, so a game started before counting
+        keeps its score. A feed holding a plain score resets the counter.
+
+        :param feed_key: Counter feed key
+        :param value: Raw counter feed value, or None if the feed has no value
+        :param legacy_score: Plain score from the network, if it was read
+        """
+        if value and value.isdigit():
+            self._reset_counter(feed_key, value)
+            return
+        remote = None
+        if value:
+            try:
+                remote = PNCounter.decode(value)
+            except PNCounterDecodeError as e:
+                print(f"Ignoring score counter: {e}")
+        if remote is None:
+            remote = PNCounter({LEGACY_REPLICA: legacy_score} if legacy_score else None)
+        self._synced_counters[feed_key] = remote.encode()
+        self._counters[feed_key].merge(remote)
+
+    def _reset_counter(self, feed_key: str, value: str) -> None:
+        """Start a new epoch of a counter from a score written over its feed.
+
+        The counter is pushed back in place of the score. Reading the same score
+        again before that push lands is not another reset.
+
+        :param feed_key: Counter feed key
+        :param value: Score the feed holds
+        """
+        if value == self._synced_counters[feed_key]:
+            return
+        self._synced_counters[feed_key] = value
+        counter = self._counters[feed_key]
+        counter.reset(int(value))
+        print(f"Score counter reset to {value}, epoch {counter.epoch}")
+
+    def _apply_merged_counters(self) -> bool:
+        """Update the scores from merged counters, and push ours if the network lacks them.
+
+        :return: True if either score has changed, False otherwise
+        """
+        previous_left_score = self.left_score
+        previous_right_score = self.right_score
+        self._update_scores_from_counters()
+        if self._pending_counter_values() and not self._has_pending_sync:
+            self._mark_pending()
+        if (self.left_score, self.right_score) == (previous_left_score, previous_right_score):
+            return False
+        print(
+            f"Scores from network: {previous_left_score}-{previous_right_score} -> "
+            f"{self.left_score}-{self.right_score}"
+        )
+        return True
+
+    def _update_scores_from_counters(self) -> None:
+        """Set both scores to what their counters add up to."""
+        self.left_score = self._counters[NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED].value()
+        self.right_score = self._counters[NetworkManager.SCORES_RIGHT_TEAM_COUNTER_FEED].value()
+
+    def _increment_counter(self, score_feed: str, replica_id: str) -> None:
+        """Count a point for this board in a score's counter and mark for network sync.
+
+        :param score_feed: Score feed key of the score to count the point in
+        :param replica_id: This board's replica id
+        """
+        self._counters[_COUNTER_FEEDS[score_feed]].increment(replica_id)
+        self._update_scores_from_counters()
+        self._mark_pending()
+
     def increment_left_score(self) -> None:
         """Increment left team score by 1 and mark for network sync."""
+        if self._replica_id is not None:
+            self._increment_counter(NetworkManager.SCORES_LEFT_TEAM_FEED, self._replica_id)
+            return
         self.left_score += 1
         self._mark_pending()
 
     def increment_right_score(self) -> None:
         """Increment right team score by 1 and mark for network sync."""
+        if self._replica_id is not None:
+            self._increment_counter(NetworkManager.SCORES_RIGHT_TEAM_FEED, self._replica_id)
+            return
         self.right_score += 1
         self._mark_pending()
@@ -0,0 +1,76 @@
+"""Coalescing of concurrent identical requests.
+
+At boot several tasks read the same feeds at once. Instead of each one sending
+its own request, the first caller for a key makes the call and later callers
+wait for its result.
+"""
+
+import asyncio
+
+from src.compat import Any, Callable
+
+
+class _Call:
+    """An in-flight call whose outcome is shared with waiting callers."""
+
+    def __init__(self):
+        self.done = asyncio.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time, sharing its outcome."""
+
+    def __init__(self):
+        """Initialize SingleFlight with no calls in flight."""
+        self._calls: dict[str, _Call] = {}
+        self.coalesced = 0
+
+    def is_in_flight(self, key: str) -> bool:
+        """Check if a call for a key is currently running.
+
+        :param key: The call's key
+        :return: True if a call is in flight
+        """
+        return key in self._calls
+
+    def forget(self, key: str) -> None:
+        """Stop sharing the call in flight for a key with new callers.
+
+        Use after a write, so later reads don't join a request that was sent
+        before the write and may return the old value. Callers already waiting
+        still get its result.
+
+        :param key: The call's key
+        """
+        self._calls.pop(key, None)
+
+    async def do(self, key: str, func: Callable) -> Any:
+        """Run func, or wait for the call already in flight for the same key.
+
+        :param key: Key identifying identical calls, e.g. a feed key
+        :param func: Coroutine function taking no arguments
+        :return: The call's result
+        :raises Exception: Whatever the call raised, for every caller sharing it
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            await call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        call = _Call()
+        self._calls[key] = call
+        try:
+            call.result = await func()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            call.done.set()
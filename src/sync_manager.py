@@ -2,22 +2,110 @@
 
 We use this to prioritize local state changes until we can sync to the network.
 We keep track of pending changes and refuse to allow updates from the network
-until we can sync the pending changes.
+until we can sync the pending changes. With a journal, pending changes also
+survive a reset.
+
+A burst of presses, e.g. a scorekeeper correcting a score, would otherwise push
+every intermediate value. With a coalescing window, a change is only pushed
+once no other change has followed it for the window, or once the oldest unsynced
+change has waited the maximum delay, so only the final value goes out.
+
+A failed sync is retried with exponential backoff: each consecutive failure
+doubles the wait before the next attempt, up to a cap, with jitter so several
+boards that lost Wi-Fi together don't retry in lockstep. Without it every pass
+of the loop would send another request that is bound to fail while the network
+is down. The first successful sync resets the backoff. Changes made while
+syncs are failing, or while a subclass holds pushes back, are journaled right
+away rather than at the next attempt.
 """
 
-from .compat import ABC, abstractmethod
+from __future__ import annotations
+
+import random
+import time
+
+from .circuit_breaker import DEFAULT_JITTER
+from .compat import ABC, TYPE_CHECKING, Callable, abstractmethod
+
+if TYPE_CHECKING:
+    from src.network_manager import NetworkManager
+    from src.outbound_journal import OutboundJournal
+
+# Quiet time after a change before it is pushed, in seconds
+COALESCE_WINDOW = 0.3
+# Longest a change is held back while changes keep coming, in seconds
+COALESCE_MAX_DELAY = 1.0
+# Wait before retrying after the first failed sync, in seconds
+SYNC_RETRY_BASE_DELAY = 1.0
+# Cap on the wait between retries, in seconds
+SYNC_RETRY_MAX_DELAY = 30.0
 
 
 class SyncManager(ABC):
     """Abstract base class for managing state sync.
 
-    Provides common infrastructure for tracking pending changes.
-    Subclasses implement domain-specific sync logic.
+    Provides common infrastructure for tracking pending changes and pushing them
+    with a single batched write. Subclasses describe which feeds are dirty.
+    Every manager registers itself with the network manager's sync queue, which
+    schedules its writes by SYNC_PRIORITY.
     """
 
-    def __init__(self):
-        """Initialize SyncManager with common sync state."""
+    # Order of this manager's writes in the sync queue, lower goes first
+    SYNC_PRIORITY = 50
+
+    def __init__(
+        self,
+        network_manager: NetworkManager,
+        journal: OutboundJournal | None = None,
+        coalesce_window: float = 0.0,
+        coalesce_max_delay: float = COALESCE_MAX_DELAY,
+        clock: Callable | None = None,
+        random_source: Callable = random.random,
+        retry_base_delay: float = SYNC_RETRY_BASE_DELAY,
+        retry_max_delay: float = SYNC_RETRY_MAX_DELAY,
+    ):
+        """Initialize SyncManager with common sync state.
+
+        :param network_manager: NetworkManager instance used to push changes
+        :param journal: Journal keeping pending changes across resets, shared by
+            every manager. If None, pending changes only live in RAM.
+        :param coalesce_window: Quiet time after a change before it is pushed, in
+            seconds, e.g. COALESCE_WINDOW. 0 pushes changes right away.
+        :param coalesce_max_delay: Longest a change is held back while changes
+            keep coming, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        :param random_source: Function returning a float in [0, 1), for jitter
+        :param retry_base_delay: Wait before retrying after the first failed
+            sync, in seconds
+        :param retry_max_delay: Cap on the wait between retries, in seconds
+        """
+        self._network_manager = network_manager
+        self._journal = journal
         self._has_pending_sync = False
+        self._coalesce_window = coalesce_window
+        self._coalesce_max_delay = coalesce_max_delay
+        self._clock = clock
+        # When the oldest and the latest unsynced changes were made, and how many
+        # changes the next write will carry
+        self._dirty_since: float | None = None
+        self._last_change_at: float | None = None
+        self._unsynced_changes = 0
+        self._random = random_source
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        # Failed syncs since the last success, and when the next attempt may start
+        self._sync_failures = 0
+        self._retry_at: float | None = None
+        self.counters = {"writes": 0, "writes_saved": 0}
+        self._sync_queue = network_manager.get_sync_queue()
+        self._sync_queue.register(self)
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
 
     def has_pending_changes(self) -> bool:
         """Check if there are pending local changes to sync.
@@ -26,30 +114,232 @@ class SyncManager(ABC):
         """
         return self._has_pending_sync
 
+    def is_sync_due(self) -> bool:
+        """Check if the pending changes should be pushed now.
+
+        They are held back while more changes may follow, see the module
+        docstring.
+
+        They are also held back until the retry backoff after a failed sync has
+        passed, and while the subclass holds them back, see _is_sync_held.
+
+        :return: True if there are pending changes, the coalescing window or
+            maximum delay has passed, and no retry backoff is running
+        """
+        if not self._has_pending_sync or self._is_sync_held():
+            return False
+        now = self._now()
+        if self._retry_at is not None and now < self._retry_at:
+            return False
+        if (
+            self._coalesce_window <= 0
+            or self._dirty_since is None
+            or self._last_change_at is None
+        ):
+            return True
+        return (
+            now - self._last_change_at >= self._coalesce_window
+            or now - self._dirty_since >= self._coalesce_max_delay
+        )
+
     def _mark_pending(self) -> None:
-        """Mark that there are pending changes to sync."""
+        """Mark that there are pending changes to sync, and journal them."""
+        now = self._now()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        self._last_change_at = now
+        self._unsynced_changes += 1
         self._has_pending_sync = True
+        self._sync_queue.submit_write(self)
+        if self._journal is not None:
+            self._journal.append(self._journal_values(self._pending_feed_values()))
+            if self._sync_failures > 0 or self._is_sync_held():
+                self._journal.flush()
+
+    def _complete_sync(self, values: dict[str, str | int]) -> None:
+        """Record that values were pushed and recompute the pending flag.
+
+        Changes made while the push was in flight stay pending.
+
+        :param values: Mapping of feed key to the value that was pushed
+        """
+        self._mark_feed_values_synced(values)
+        self._sync_failures = 0
+        self._retry_at = None
+        self._has_pending_sync = bool(self._pending_feed_values())
+        if self._journal is not None:
+            self._journal.mark_synced(self._journal_values(values))
+        if self._unsynced_changes:
+            self.counters["writes"] += 1
+            self.counters["writes_saved"] += self._unsynced_changes - 1
+        if self._has_pending_sync:
+            # Changed while the push was in flight, so push again without delay
+            self._unsynced_changes = 1
+        else:
+            self._dirty_since = None
+            self._unsynced_changes = 0
+
+    def _record_sync_failure(self) -> None:
+        """Back off before the next attempt and persist the pending changes.
+
+        Each consecutive failure doubles the wait, see the module docstring.
+        Changes that sync right away are never written to flash.
+        """
+        self._sync_failures += 1
+        delay = min(
+            self._retry_base_delay * 2 ** (self._sync_failures - 1), self._retry_max_delay
+        )
+        delay *= 1 - DEFAULT_JITTER * self._random()
+        self._retry_at = self._now() + delay
+        print(f"Retrying sync in {delay:.1f}s ({self._sync_failures} failed)")
+        if self._journal is not None:
+            self._journal.flush()
+
+    def get_retry_stats(self) -> dict[str, float | int | None]:
+        """Get the failed syncs since the last success and the wait until the next attempt.
+
+        :return: Mapping of "failures" to the count and "retry_in" to the seconds
+            left, or None if no retry backoff is running
+        """
+        retry_in = None
+        if self._retry_at is not None:
+            retry_in = max(0.0, self._retry_at - self._now())
+        return {"failures": self._sync_failures, "retry_in": retry_in}
+
+    def flush_deferred_journal(self) -> None:
+        """Write out changes whose journal flush was put off by its rate limit."""
+        if self._journal is not None:
+            self._journal.flush_deferred()
+
+    def restore_from_journal(self) -> bool:
+        """Restore the changes that were still pending when the board last reset.
+
+        :return: True if any change was restored
+        """
+        if self._journal is None:
+            return False
+        if not self._restore_feed_values(self._journal.pending_values()):
+            return False
+        self._has_pending_sync = bool(self._pending_feed_values())
+        if self._has_pending_sync:
+            self._sync_queue.submit_write(self)
+        return True
 
     async def _try_sync_with_backoff(self) -> bool:
-        """Attempt to sync pending changes.
+        """Attempt to sync pending changes, unless a retry backoff is running.
 
-        Calls abstract _perform_sync() method for actual sync logic.
+        Calls _perform_sync() method for actual sync logic. Changes still inside
+        their coalescing window or retry backoff are not pushed yet, see
+        is_sync_due.
 
         :return: True if sync was successful, False otherwise
         """
+        if self._has_pending_sync and not self.is_sync_due():
+            return False
         try:
             await self._perform_sync()
-            self._has_pending_sync = False
             return True
         except Exception as e:
             print(f"Sync failed: {e}")
+            self._record_sync_failure()
             return False
 
-    @abstractmethod
     async def _perform_sync(self) -> None:
         """Perform the actual sync operation.
 
-        Subclasses implement this method with their specific sync logic.
-        This method should sync local state to network.
+        Pushes every dirty field of this manager in one batched write.
+        """
+        values = self._pending_feed_values()
+        if values:
+            await self._network_manager.set_feed_values(values)
+        self._complete_sync(values)
+
+    def _is_sync_held(self) -> bool:
+        """Check if pending changes can't be pushed yet for a reason of the subclass.
+
+        Changes made meanwhile are journaled right away, as while syncs are failing.
+
+        :return: True to hold back pushes. Never, unless a subclass says so.
+        """
+        return False
+
+    def _journal_values(self, values: dict[str, str | int]) -> dict[str, str | int]:
+        """Get the form in which feed values are kept in the journal.
+
+        :param values: Mapping of feed key to a pending or pushed value
+        :return: Mapping of feed key to the value to journal. The values as they
+            are, unless a subclass keeps a smaller form.
+        """
+        return values
+
+    @abstractmethod
+    def _pending_feed_values(self) -> dict[str, str | int]:
+        """Get the feed values that differ from the last synced state.
+
+        :return: Mapping of feed key to the local value to push
+        """
+        pass
+
+    @abstractmethod
+    def _mark_feed_values_synced(self, values: dict[str, str | int]) -> None:
+        """Record values as the last synced state.
+
+        :param values: Mapping of feed key to pushed value. May include feeds owned
+            by other managers, which must be ignored.
         """
         pass
+
+    @abstractmethod
+    def get_local_feed_values(self) -> dict[str, str | int]:
+        """Get the local value of every feed this manager owns, synced or not.
+
+        :return: Mapping of feed key to local value
+        """
+        pass
+
+    @abstractmethod
+    def _restore_feed_values(self, values: dict[str, str | int]) -> bool:
+        """Set local state from journaled values that were never synced.
+
+        :param values: Mapping of feed key to the unsynced value. May include
+            feeds owned by other managers, which must be ignored.
+        :return: True if any of this manager's feeds was restored
+        """
+        pass
+
+
+async def sync_pending_changes(managers: list[SyncManager]) -> bool:
+    """Sync pending changes from several managers in a single batched write.
+
+    Every dirty field across the managers is sent in one request, so the network
+    either gets all of them or none of them. Nothing is sent until at least one
+    manager's changes are due, see SyncManager.is_sync_due, and then every
+    manager's pending changes go out together, except those of managers that
+    hold their pushes back, see SyncManager._is_sync_held.
+
+    :param managers: Managers whose pending changes should be synced
+    :return: True if sync was successful or nothing was due, False otherwise
+    """
+    pending = [
+        manager
+        for manager in managers
+        if manager.has_pending_changes() and not manager._is_sync_held()
+    ]
+    if not any(manager.is_sync_due() for manager in pending):
+        return True
+
+    values = {}
+    for manager in pending:
+        values.update(manager._pending_feed_values())
+    try:
+        if values:
+            await pending[0]._network_manager.set_feed_values(values)
+    except Exception as e:
+        print(f"Sync failed: {e}")
+        for manager in pending:
+            manager._record_sync_failure()
+        return False
+
+    for manager in pending:
+        manager._complete_sync(values)
+    return True
@@ -0,0 +1,187 @@
+"""Priority queue of the network work of every synced manager.
+
+Managers register themselves with the queue when they are created, and submit
+a write whenever they have changes to push; other work such as polls is
+submitted as an async action. A single worker drains the queue in priority
+order: the pending writes of every manager that is due go out together in one
+batched write, highest priority first as far as the request budget allows, and
+submitted actions run after them until their deadline passes. The sync loop
+only talks to the queue, so a new synced field needs a manager, not changes to
+the loop.
+"""
+
+from __future__ import annotations
+
+import time
+
+from src.compat import TYPE_CHECKING, Callable
+from src.sync_manager import sync_pending_changes
+
+if TYPE_CHECKING:
+    from src.network_manager import NetworkManager
+    from src.sync_manager import SyncManager
+
+# Lower runs first
+PRIORITY_SCORES = 0
+PRIORITY_GENDER = 10
+PRIORITY_READ = 100
+
+
+class SyncItem:
+    """An action waiting in the queue."""
+
+    def __init__(self, priority: int, seq: int, action: Callable, deadline: float | None):
+        """Initialize SyncItem.
+
+        :param priority: Lower runs first
+        :param seq: Submission order, breaking ties between equal priorities
+        :param action: Async function to run
+        :param deadline: Time after which the action is dropped instead of run,
+            or None to always run it
+        """
+        self.priority = priority
+        self.seq = seq
+        self.action = action
+        self.deadline = deadline
+
+
+class SyncQueue:
+    """Orders and runs the network work of the synced managers."""
+
+    def __init__(self, network_manager: NetworkManager, clock: Callable | None = None):
+        """Initialize an empty SyncQueue.
+
+        :param network_manager: NetworkManager whose request budget limits writes
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        """
+        self._network_manager = network_manager
+        self._clock = clock
+        self._managers: list[SyncManager] = []
+        # Managers with changes submitted and not yet pushed
+        self._writes: list[SyncManager] = []
+        self._items: list[SyncItem] = []
+        self._seq = 0
+        self.counters = {"writes": 0, "deferred": 0, "actions": 0, "expired": 0}
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    @property
+    def managers(self) -> list[SyncManager]:
+        """Get the registered managers, highest priority first."""
+        return self._managers
+
+    def register(self, manager: SyncManager) -> None:
+        """Add a manager whose writes the queue schedules.
+
+        :param manager: Manager with a SYNC_PRIORITY
+        """
+        self._managers.append(manager)
+        self._managers.sort(key=lambda registered: registered.SYNC_PRIORITY)
+
+    def submit_write(self, manager: SyncManager) -> None:
+        """Queue a manager's pending changes to be pushed.
+
+        :param manager: Manager with changes to push. Writes never expire.
+        """
+        if manager not in self._writes:
+            self._writes.append(manager)
+
+    def submit(self, priority: int, action: Callable, timeout: float | None = None) -> None:
+        """Queue an action to run once the writes are done.
+
+        :param priority: Lower runs first, e.g. PRIORITY_READ
+        :param action: Async function to run
+        :param timeout: Time from now after which the action is dropped, in
+            seconds, or None to always run it
+        """
+        deadline = None if timeout is None else self._now() + timeout
+        self._seq += 1
+        self._items.append(SyncItem(priority, self._seq, action, deadline))
+
+    def has_pending_changes(self) -> bool:
+        """Check if any registered manager has changes to push.
+
+        :return: True if changes need to be synced
+        """
+        return any(manager.has_pending_changes() for manager in self._managers)
+
+    def is_sync_due(self) -> bool:
+        """Check if any registered manager's changes should be pushed now.
+
+        :return: True if a write is due
+        """
+        return any(manager.is_sync_due() for manager in self._managers)
+
+    def get_local_feed_values(self) -> dict[str, str | int]:
+        """Get the local value of every feed the registered managers own.
+
+        :return: Mapping of feed key to local value
+        """
+        values = {}
+        for manager in self._managers:
+            values.update(manager.get_local_feed_values())
+        return values
+
+    def _affordable_writes(self, pending: list[SyncManager]) -> list[SyncManager]:
+        """Pick the pending writes the request budget can pay for, by priority.
+
+        The highest priority write is always picked, so a spent budget is
+        reported by the write failing as before. The cost of the batch is what
+        NetworkManager.write_cost charges for it, packed and mirrored feeds
+        included. Managers holding their pushes back are never picked.
+
+        :param pending: Managers with changes to push, highest priority first
+        :return: The managers whose changes go into this write
+        """
+        tokens = self._network_manager.get_request_budget().tokens
+        picked = []
+        values = {}
+        for manager in pending:
+            if manager._is_sync_held():
+                continue
+            batch = {**values, **manager._pending_feed_values()}
+            if picked and self._network_manager.write_cost(batch) > tokens:
+                self.counters["deferred"] += 1
+                continue
+            picked.append(manager)
+            values = batch
+        return picked
+
+    async def _drain_writes(self) -> bool:
+        """Push the due writes in one batched write.
+
+        :return: True if the write succeeded or nothing was due
+        """
+        self._writes = [manager for manager in self._writes if manager.has_pending_changes()]
+        if not any(manager.is_sync_due() for manager in self._writes):
+            return True
+        pending = [manager for manager in self._managers if manager in self._writes]
+        picked = self._affordable_writes(pending)
+        if not await sync_pending_changes(picked):
+            return False
+        self.counters["writes"] += 1
+        self._writes = [manager for manager in self._writes if manager.has_pending_changes()]
+        return True
+
+    async def drain(self) -> bool:
+        """Run the queued work: due writes, put-off journal flushes, then actions by priority.
+
+        :return: True if the writes succeeded or none were due
+        """
+        synced = await self._drain_writes()
+        for manager in self._managers:
+            manager.flush_deferred_journal()
+        items = sorted(self._items, key=lambda item: (item.priority, item.seq))
+        self._items = []
+        for item in items:
+            if item.deadline is not None and self._now() > item.deadline:
+                self.counters["expired"] += 1
+                continue
+            self.counters["actions"] += 1
+            await item.action()
+        return synced
@@ -0,0 +1,6 @@
+"""Transports that carry feed values between boards, see protocols.Transport.
+
+Import each transport from its own module. They are not re-exported here,
+since the MQTT and LAN transports import NetworkManager, which imports the
+Adafruit IO transport.
+"""
@@ -0,0 +1,202 @@
+"""Feed values over the Adafruit IO HTTP API, the default transport.
+
+Reads of several feeds in one group are served by a single group request, and
+writes to one group go out as a single group data request. Uses the
+non-blocking client when there is one, and the blocking MatrixPortal calls run
+off the event loop otherwise.
+"""
+
+from __future__ import annotations
+
+from src.adafruit_io_client import is_throttle_error
+from src.async_http import run_blocking
+from src.compat import TYPE_CHECKING, Callable
+from src.protocols import MatrixPortalLike
+
+if TYPE_CHECKING:
+    from src.adafruit_io_client import AsyncIOClient
+
+
+# The only response fields the scoreboard reads, decoded without parsing the rest
+FEED_DETAILS_FIELDS = ("details.data.last.value",)
+GROUP_FIELDS = ("feeds.key", "feeds.last_value", "feeds.updated_at")
+
+
+def _group_feeds(feed_keys) -> dict[str, list[str]]:
+    """Sort full feed keys by the group they belong to.
+
+    :return: Mapping of group key to its feed keys. Feeds outside any group are
+        listed under the empty group key.
+    """
+    groups: dict[str, list[str]] = {}
+    for feed_key in feed_keys:
+        group_key = feed_key.partition(".")[0] if "." in feed_key else ""
+        groups.setdefault(group_key, []).append(feed_key)
+    return groups
+
+
+class AdafruitIOTransport:
+    """Reads and writes feeds through the Adafruit IO HTTP API."""
+
+    name = "aio"
+
+    def __init__(self, matrixportal: MatrixPortalLike, io_client: AsyncIOClient | None = None):
+        """Initialize AdafruitIOTransport.
+
+        :param matrixportal: MatrixPortal-like instance whose blocking calls are
+            used when there is no async client
+        :param io_client: Non-blocking Adafruit IO client. If None, the blocking
+            MatrixPortal calls are used instead, run off the event loop where the
+            platform allows it.
+        """
+        self._matrixportal = matrixportal
+        self._io_client = io_client
+        # Full feed key -> updated_at of the feed in the last group read that
+        # included it, or None if that response had no timestamp
+        self._updated_at: dict[str, str | None] = {}
+
+    async def warm_up(self) -> None:
+        """Open the connection to Adafruit IO ahead of the first request.
+
+        Only the async client keeps connections open, so this does nothing
+        without one.
+        """
+        if self._io_client is not None:
+            await self._io_client.warm_up()
+
+    async def _get_feed(self, feed_key: str) -> dict:
+        """Fetch the detailed structure of a feed without blocking the event loop."""
+        if self._io_client is not None:
+            return await self._io_client.get_feed(
+                feed_key, detailed=True, fields=FEED_DETAILS_FIELDS
+            )
+        return await run_blocking(self._matrixportal.get_io_feed, feed_key, detailed=True)
+
+    async def _get_last_value(self, feed_key: str) -> None | str:
+        """Fetch only the last value of a feed without blocking the event loop.
+
+        Uses the lean last-value endpoint when the async client is available, and
+        the detailed feed structure otherwise or when the lean request is refused.
+        """
+        if self._io_client is not None:
+            try:
+                return await self._io_client.get_last_value(feed_key)
+            except (KeyError, TypeError):
+                print(f"Unexpected last value response for {feed_key}, fetching details")
+            except Exception as e:
+                status_code = getattr(e, "status_code", None)
+                if status_code is None or status_code >= 500 or is_throttle_error(e):
+                    raise
+                print(f"Last value request for {feed_key} failed ({e}), fetching details")
+        feed = await self._get_feed(feed_key)
+        last = feed["details"]["data"]["last"]
+        return None if last is None else last["value"]
+
+    async def _get_group(self, group_key: str) -> dict:
+        """Fetch a group without blocking the event loop."""
+        if self._io_client is not None:
+            return await self._io_client.get_group(group_key, fields=GROUP_FIELDS)
+        return await run_blocking(self._matrixportal.get_io_group, group_key)
+
+    def _parse_group(
+        self, group_key: str, group: dict, feed_keys: list[str]
+    ) -> dict[str, str | None]:
+        """Extract the requested feeds' last values from a group response.
+
+        Also remembers when each feed was last written, for get_version.
+
+        :param group_key: The group key the response belongs to
+        :param group: Group data structure with a ``feeds`` list
+        :param feed_keys: Full feed keys to extract
+        :return: Mapping of each full feed key to its last value
+        """
+        found = {}
+        for feed in group["feeds"]:
+            feed_key = feed["key"]
+            if "." not in feed_key:
+                feed_key = f"{group_key}.{feed_key}"
+            found[feed_key] = feed["last_value"]
+            self._updated_at[feed_key] = feed.get("updated_at")
+        for feed_key in feed_keys:
+            if feed_key not in found:
+                self._updated_at.pop(feed_key, None)
+        return {feed_key: found.get(feed_key) for feed_key in feed_keys}
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Read several feeds, with one group request per group.
+
+        A feed read on its own uses the lean last-value endpoint instead.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each feed key to its last value, or None if it has none
+        """
+        values = {}
+        for group_key, group_feed_keys in _group_feeds(feed_keys).items():
+            if group_key and len(group_feed_keys) > 1:
+                group = await self._get_group(group_key)
+                values.update(self._parse_group(group_key, group, group_feed_keys))
+                continue
+            for feed_key in group_feed_keys:
+                values[feed_key] = await self._get_last_value(feed_key)
+        return values
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Write several feeds, with one group data request per group.
+
+        :param values: Mapping of full feed key to the value to write
+        """
+        for group_key, feed_keys in _group_feeds(values).items():
+            if not group_key:
+                for feed_key in feed_keys:
+                    await self._push(feed_key, values[feed_key])
+                continue
+            feeds_and_data = [
+                {"key": feed_key[len(group_key) + 1 :], "value": values[feed_key]}
+                for feed_key in feed_keys
+            ]
+            await self._send_group_data(group_key, feeds_and_data)
+
+    async def _push(self, feed_key: str, value: str | int) -> None:
+        """Push a value to a feed without blocking the event loop."""
+        if self._io_client is not None:
+            await self._io_client.send_data(feed_key, value)
+        else:
+            await run_blocking(self._matrixportal.push_to_io, feed_key, value)
+
+    async def _send_group_data(self, group_key: str, feeds_and_data: list) -> None:
+        """Send values to several feeds in a group without blocking the event loop."""
+        if self._io_client is not None:
+            await self._io_client.send_group_data(group_key, feeds_and_data)
+        else:
+            await run_blocking(
+                self._matrixportal.network.io_client.send_group_data,
+                group_key,
+                feeds_and_data,
+            )
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """Identify the writes behind the feeds' values in the last group read.
+
+        Adafruit IO bumps a feed's ``updated_at`` whenever data is written to it,
+        so an unchanged set of timestamps means none of the feeds was written.
+
+        :param feed_keys: Full feed keys the version covers
+        :return: Tuple of (feed key, updated_at) for each feed the last group read
+            returned, or None if one of them had no timestamp
+        """
+        timestamps = []
+        for feed_key in feed_keys:
+            if feed_key not in self._updated_at:
+                continue
+            updated_at = self._updated_at[feed_key]
+            if updated_at is None:
+                return None
+            timestamps.append((feed_key, updated_at))
+        return tuple(timestamps)
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Adafruit IO's HTTP API can't push updates, see MqttTransport for that.
+
+        :return: False, the feeds must be polled
+        """
+        return False
@@ -0,0 +1,101 @@
+"""Feed values multicast between boards on the LAN, with no cloud copy.
+
+Every write is multicast to the peer boards, and every value received from a
+peer is kept, so reads are answered from the latest values seen. Nothing is
+stored off the boards: a board that restarts has no values until a peer
+writes again.
+"""
+
+from src.compat import Any, Callable
+from src.lan_sync import DEFAULT_GROUP, DEFAULT_PORT, LanSync
+
+
+class LanTransport:
+    """Reads and writes feeds by multicasting them between peer boards."""
+
+    name = "lan"
+
+    def __init__(
+        self,
+        socket_pool: Any,
+        board_id: str | None = None,
+        group: str = DEFAULT_GROUP,
+        port: int = DEFAULT_PORT,
+        interface: str = "0.0.0.0",
+    ):
+        """Initialize LanTransport without opening its socket.
+
+        :param socket_pool: socketpool.SocketPool (or the CPython socket module)
+        :param board_id: Identifies this board's messages, see LanSync
+        :param group: Multicast group address shared by the boards
+        :param port: UDP port shared by the boards
+        :param interface: Address of the network interface to multicast on
+        """
+        self._lan_sync = LanSync(
+            socket_pool, self._receive, board_id, group, port, interface
+        )
+        # Full feed key -> latest value received or written
+        self._values: dict[str, str] = {}
+        self._callbacks: list[Callable] = []
+
+    async def _receive(self, feed_key: str, value: str) -> None:
+        """Keep a value received from a peer and pass it to subscribers."""
+        self._values[feed_key] = value
+        for on_feed_update in self._callbacks:
+            await on_feed_update(feed_key, value)
+
+    def _ensure_open(self) -> None:
+        """Open the socket if it is closed.
+
+        :raises ConnectionError: If the socket can't be opened
+        """
+        if not self._lan_sync.is_open and not self._lan_sync.open():
+            raise ConnectionError("LAN multicast unavailable")
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._lan_sync.close()
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Apply waiting peer messages and read the latest value of several feeds.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each feed key to its latest value, or None if none
+            has been seen
+        :raises ConnectionError: If the socket can't be opened
+        """
+        self._ensure_open()
+        await self._lan_sync.process_messages()
+        return {feed_key: self._values.get(feed_key) for feed_key in feed_keys}
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Multicast several feed values to the peers in one message.
+
+        :param values: Mapping of full feed key to the value to write
+        :raises ConnectionError: If the socket can't be opened or sending fails
+        """
+        self._ensure_open()
+        if not self._lan_sync.broadcast(values):
+            raise ConnectionError("LAN multicast send failed")
+        for feed_key, value in values.items():
+            self._values[feed_key] = str(value)
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """Peer messages carry no write timestamps.
+
+        :return: None, reads can't be told apart
+        """
+        return None
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Pass every value received from a peer to a callback.
+
+        :param on_feed_update: Async callback called with (feed_key, value)
+        :return: True, updates are pushed
+        """
+        self._callbacks.append(on_feed_update)
+        return True
+
+    async def run(self) -> None:
+        """Keep the socket open and apply peer messages as they arrive."""
+        await self._lan_sync.run()
@@ -0,0 +1,162 @@
+"""Transports that keep feed values locally, for tests and benchmarks.
+
+MemoryTransport keeps them in a FeedStore that several simulated boards can
+share, so a write from one is pushed to the others like it would be over the
+network. FileTransport keeps them in a JSON file, which boards (or processes)
+on the same machine can share by polling.
+
+Values are stored as strings, like Adafruit IO stores them.
+"""
+
+import json
+
+from src.compat import Callable
+
+
+class FeedStore:
+    """Feed values shared by the memory transports of several simulated boards."""
+
+    def __init__(self):
+        """Initialize an empty store."""
+        self.values: dict[str, str] = {}
+        # Full feed key -> number of writes to the feed
+        self.writes: dict[str, int] = {}
+        # (transport, callback) of each subscriber
+        self._subscribers: list[tuple] = []
+
+    def subscribe(self, transport: "MemoryTransport", on_feed_update: Callable) -> None:
+        """Push writes made through other transports to a callback.
+
+        :param transport: The subscribing transport, whose own writes are not pushed
+        :param on_feed_update: Async callback called with (feed_key, value)
+        """
+        self._subscribers.append((transport, on_feed_update))
+
+    async def write(self, sender: "MemoryTransport", values: dict[str, str | int]) -> None:
+        """Store feed values and push them to the other transports' subscribers.
+
+        :param sender: The transport the values were written through
+        :param values: Mapping of full feed key to the value to write
+        """
+        for feed_key, value in values.items():
+            self.values[feed_key] = str(value)
+            self.writes[feed_key] = self.writes.get(feed_key, 0) + 1
+        for transport, on_feed_update in self._subscribers:
+            if transport is sender:
+                continue
+            for feed_key in values:
+                await on_feed_update(feed_key, self.values[feed_key])
+
+
+class MemoryTransport:
+    """Reads and writes feeds in a FeedStore in this process."""
+
+    name = "memory"
+
+    def __init__(self, store: FeedStore | None = None):
+        """Initialize MemoryTransport.
+
+        :param store: Store shared with other simulated boards. If None, the
+            transport gets a store of its own.
+        """
+        self.store = store or FeedStore()
+        # Full feed key -> the feed's write count as of the last read
+        self._read_writes: dict[str, int] = {}
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Read several feeds from the store.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each feed key to its value, or None if it has none
+        """
+        for feed_key in feed_keys:
+            self._read_writes[feed_key] = self.store.writes.get(feed_key, 0)
+        return {feed_key: self.store.values.get(feed_key) for feed_key in feed_keys}
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Write several feeds to the store.
+
+        :param values: Mapping of full feed key to the value to write
+        """
+        await self.store.write(self, values)
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """Identify the writes behind the values last read.
+
+        :param feed_keys: Full feed keys the version covers
+        :return: Tuple of each feed's write count as of the last read
+        """
+        return tuple(self._read_writes.get(feed_key, 0) for feed_key in feed_keys)
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Push writes made through other transports on the same store.
+
+        :param on_feed_update: Async callback called with (feed_key, value)
+        :return: True, writes are pushed
+        """
+        self.store.subscribe(self, on_feed_update)
+        return True
+
+
+class FileTransport:
+    """Reads and writes feeds in a local JSON file."""
+
+    name = "file"
+
+    def __init__(self, path: str):
+        """Initialize FileTransport. The file is created on the first write.
+
+        :param path: Path of the JSON file holding the feed values
+        """
+        self._path = path
+        # Full feed key -> the feed's write count as of the last read
+        self._read_writes: dict[str, int] = {}
+
+    def _load(self) -> dict:
+        """Read the file, or an empty store if it doesn't exist yet.
+
+        :return: Dict with ``values`` and ``writes`` mappings
+        """
+        try:
+            with open(self._path) as file:
+                return json.load(file)
+        except OSError:
+            return {"values": {}, "writes": {}}
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Read several feeds from the file.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each feed key to its value, or None if it has none
+        """
+        data = self._load()
+        for feed_key in feed_keys:
+            self._read_writes[feed_key] = data["writes"].get(feed_key, 0)
+        return {feed_key: data["values"].get(feed_key) for feed_key in feed_keys}
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Write several feeds to the file at once.
+
+        :param values: Mapping of full feed key to the value to write
+        """
+        data = self._load()
+        for feed_key, value in values.items():
+            data["values"][feed_key] = str(value)
+            data["writes"][feed_key] = data["writes"].get(feed_key, 0) + 1
+        with open(self._path, "w") as file:
+            json.dump(data, file)
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """Identify the writes behind the values last read.
+
+        :param feed_keys: Full feed keys the version covers
+        :return: Tuple of each feed's write count as of the last read
+        """
+        return tuple(self._read_writes.get(feed_key, 0) for feed_key in feed_keys)
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Files can't push updates, readers poll instead.
+
+        :return: False, the file must be polled
+        """
+        return False
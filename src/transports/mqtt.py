@@ -0,0 +1,87 @@
+"""Feed values over Adafruit IO's MQTT broker.
+
+Writes are published to the feeds' topics, and every update the broker
+delivers is kept, so reads are answered from the latest values received
+instead of a request. Right after connecting, reads return only the values
+the broker has re-sent so far.
+"""
+
+from src.compat import Callable
+from src.mqtt_subscriber import MqttSubscriber
+from src.protocols import MQTTClientLike
+
+
+class MqttTransport:
+    """Reads and writes the scores group feeds through an MQTT subscription."""
+
+    name = "mqtt"
+
+    def __init__(self, mqtt_client: MQTTClientLike, username: str):
+        """Initialize MqttTransport without connecting.
+
+        :param mqtt_client: MiniMQTT client (or MQTTClientLike implementation)
+        :param username: Adafruit IO username that owns the feeds
+        """
+        self._client = mqtt_client
+        self._topic_prefix = f"{username}/f/"
+        self._subscriber = MqttSubscriber(mqtt_client, username, self._receive)
+        # Full feed key -> latest value received or written
+        self._values: dict[str, str] = {}
+        self._callbacks: list[Callable] = []
+
+    async def _receive(self, feed_key: str, value: str) -> None:
+        """Keep a value delivered by the broker and pass it to subscribers."""
+        self._values[feed_key] = value
+        for on_feed_update in self._callbacks:
+            await on_feed_update(feed_key, value)
+
+    def _ensure_connected(self) -> None:
+        """Connect to the broker if the subscription is down.
+
+        :raises ConnectionError: If the broker can't be reached
+        """
+        if not self._subscriber.is_connected and not self._subscriber.connect():
+            raise ConnectionError("MQTT broker unreachable")
+
+    async def read_many(self, feed_keys: tuple[str, ...]) -> dict[str, str | None]:
+        """Apply waiting broker messages and read the latest value of several feeds.
+
+        :param feed_keys: Full feed keys to read
+        :return: Mapping of each feed key to its latest value, or None if none
+            has been received
+        :raises ConnectionError: If the broker can't be reached
+        """
+        self._ensure_connected()
+        await self._subscriber.process_messages()
+        return {feed_key: self._values.get(feed_key) for feed_key in feed_keys}
+
+    async def write_many(self, values: dict[str, str | int]) -> None:
+        """Publish several feed values, one message per feed.
+
+        :param values: Mapping of full feed key to the value to write
+        :raises ConnectionError: If the broker can't be reached
+        """
+        self._ensure_connected()
+        for feed_key, value in values.items():
+            self._client.publish(self._topic_prefix + feed_key, str(value))
+            self._values[feed_key] = str(value)
+
+    def get_version(self, feed_keys: tuple[str, ...]) -> tuple | None:
+        """MQTT messages carry no write timestamps.
+
+        :return: None, reads can't be told apart
+        """
+        return None
+
+    def subscribe(self, on_feed_update: Callable) -> bool:
+        """Pass every update the broker delivers to a callback.
+
+        :param on_feed_update: Async callback called with (feed_key, value)
+        :return: True, updates are pushed
+        """
+        self._callbacks.append(on_feed_update)
+        return True
+
+    async def run(self) -> None:
+        """Keep the subscription connected and apply updates as they arrive."""
+        await self._subscriber.run()
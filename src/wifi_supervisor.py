@@ -0,0 +1,166 @@
+"""Background supervision of the Wi-Fi link.
+
+The network patches make a connect attempt fail fast instead of retrying, so
+without a supervisor the link is only re-established lazily, by whichever feed
+request finds it down, and that request pays for association and DHCP or
+fails. The supervisor owns the link instead: it checks it on a short timer,
+reconnects in the background with exponential backoff, and tells its
+listeners (NetworkManager) whenever the link goes up or down, so requests are
+not started against a dead interface.
+
+Once the link is up it pre-warms the connection to Adafruit IO, resolving DNS
+and completing the TLS handshake, so the first real request reuses it.
+"""
+
+import asyncio
+import random
+import time
+
+from src.async_http import run_blocking
+from src.circuit_breaker import CircuitBreaker
+from src.compat import AsyncTimeoutError, Callable
+
+# How often the link is checked, in seconds
+LINK_CHECK_INTERVAL = 1.0
+
+# Delay before the first reconnect retry, doubling with each failure up to the cap
+RECONNECT_BASE_DELAY = 2.0
+RECONNECT_MAX_DELAY = 60.0
+
+# How long boot waits for the link before showing the defaults, in seconds
+BOOT_LINK_TIMEOUT = 15.0
+
+
+class WifiSupervisor:
+    """Keeps the Wi-Fi link up and reports changes in its state."""
+
+    def __init__(
+        self,
+        connect: Callable,
+        is_connected: Callable,
+        on_link_change: Callable | None = None,
+        prewarm: Callable | None = None,
+        base_delay: float = RECONNECT_BASE_DELAY,
+        max_delay: float = RECONNECT_MAX_DELAY,
+        clock: Callable | None = None,
+        random_source: Callable = random.random,
+    ):
+        """Initialize WifiSupervisor with the link down.
+
+        :param connect: Blocking function making one attempt to connect, raising
+            on failure
+        :param is_connected: Function returning True while the link is up
+        :param on_link_change: Function called with True when the link comes up
+            and False when it goes down
+        :param prewarm: Async function opening connections ahead of the first
+            request, called each time the link comes up
+        :param base_delay: Delay before retrying after the first failed connect,
+            in seconds
+        :param max_delay: Cap on the delay between connect attempts, in seconds
+        :param clock: Function returning the current time in seconds. Defaults to
+            time.monotonic, looked up on each call.
+        :param random_source: Function returning a float in [0, 1), for jitter
+        """
+        self._connect = connect
+        self._is_connected = is_connected
+        self._on_link_change = on_link_change
+        self._prewarm = prewarm
+        self._clock = clock
+        # Reconnect attempts back off like requests to a failing endpoint
+        self._backoff = CircuitBreaker(
+            "wifi",
+            base_delay=base_delay,
+            max_delay=max_delay,
+            clock=clock,
+            random_source=random_source,
+        )
+        self._link_up = False
+        self._link_event = asyncio.Event()
+        self.counters = {"connects": 0, "connect_failures": 0, "drops": 0, "prewarms": 0}
+
+    def _now(self) -> float:
+        """Get the current time in seconds."""
+        if self._clock is not None:
+            return self._clock()
+        return time.monotonic()
+
+    @property
+    def link_up(self) -> bool:
+        """Check if the link was up at the last check.
+
+        :return: True if connected
+        """
+        return self._link_up
+
+    async def _try_connect(self) -> bool:
+        """Make one connect attempt, recording it with the backoff.
+
+        :return: True if connected
+        """
+        started = self._now()
+        try:
+            await run_blocking(self._connect)
+        except Exception as e:
+            self.counters["connect_failures"] += 1
+            self._backoff.record_failure()
+            print(f"Wi-Fi connect failed: {e}")
+            return False
+        self.counters["connects"] += 1
+        self._backoff.record_success()
+        print(f"Wi-Fi connected in {self._now() - started:.1f}s")
+        return True
+
+    def _set_link(self, up: bool) -> bool:
+        """Record the link state, notifying the listener if it changed.
+
+        :return: True if the link just came up
+        """
+        if up == self._link_up:
+            return False
+        self._link_up = up
+        if up:
+            self._link_event.set()
+        else:
+            self._link_event = asyncio.Event()
+            self.counters["drops"] += 1
+            print("Wi-Fi link lost")
+        if self._on_link_change is not None:
+            self._on_link_change(up)
+        return up
+
+    async def check(self) -> bool:
+        """Check the link, reconnecting if it is down and the backoff allows it.
+
+        :return: True if the link is up
+        """
+        up = bool(self._is_connected())
+        if not up:
+            # Report a drop before reconnecting, connections opened before it are dead
+            self._set_link(False)
+            if self._backoff.allow_request():
+                up = await self._try_connect()
+        if self._set_link(up) and self._prewarm is not None:
+            try:
+                await self._prewarm()
+                self.counters["prewarms"] += 1
+            except Exception as e:
+                print(f"Pre-warming connections failed: {e}")
+        return up
+
+    async def wait_for_link(self, timeout: float) -> bool:
+        """Wait until the link is up, e.g. before the first fetch at boot.
+
+        :param timeout: Maximum time to wait, in seconds
+        :return: True if the link is up
+        """
+        try:
+            await asyncio.wait_for(self._link_event.wait(), timeout)
+        except AsyncTimeoutError:
+            pass
+        return self._link_up
+
+    async def run(self) -> None:
+        """Check the link on a timer for as long as the board runs."""
+        while True:
+            await self.check()
+            await asyncio.sleep(LINK_CHECK_INTERVAL)
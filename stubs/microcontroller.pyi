@@ -0,0 +1,10 @@
+"""Type stubs for CircuitPython microcontroller module.
+
+This module provides access to features of the microcontroller itself.
+Only available on CircuitPython hardware.
+"""
+
+from typing import Any
+
+# Non-volatile memory, or None on boards without it
+nvm: Any | None
@@ -0,0 +1,15 @@
+"""Type stubs for CircuitPython wifi module.
+
+This module provides access to the board's Wi-Fi radio.
+Only available on CircuitPython hardware.
+"""
+
+from typing import Any
+
+class Radio:
+    """The board's Wi-Fi radio."""
+
+    connected: bool
+    ipv4_address: Any
+
+radio: Radio
@@ -0,0 +1,430 @@
+"""Tests for the cooperative HTTP client and async Adafruit IO client."""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.adafruit_io_client import AdafruitIORequestError, AsyncIOClient
+from src.async_http import AsyncHttpClient, RequestTimeoutError, run_blocking
+from src.rtt_estimator import RttEstimator, host_of
+
+
+class _Server(ThreadingHTTPServer):
+    """Local test server that records the requests it handles."""
+
+    def __init__(self, address, handler):
+        super().__init__(address, handler)
+        self.requests: list[tuple] = []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves canned responses for the local test server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        """Silence request logging."""
+
+    def _record(self, method, payload):
+        """Record a request on the server."""
+        assert isinstance(self.server, _Server)
+        self.server.requests.append((method, self.path, dict(self.headers), payload))
+
+    def _send_json(self, status, value):
+        body = json.dumps(value).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        """Handle GET requests."""
+        self._record("GET", None)
+        if self.path == "/slow":
+            time.sleep(0.3)
+            self._send_json(200, {"slow": True})
+        elif self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in (b'{"value": ', b'"42"}'):
+                self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/close":
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+            self.close_connection = True
+        elif self.path == "/drop-after":
+            # Drop the connection without telling the client, like an idle timeout
+            self._send_json(200, {"dropped": True})
+            self.close_connection = True
+        elif self.path.endswith("/throttled"):
+            body = b"slow down"
+            self.send_response(429)
+            self.send_header("Retry-After", "17")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path.endswith("/empty/data/last?include=value"):
+            self._send_json(200, None)
+        elif self.path.endswith("/data/last?include=value"):
+            self._send_json(200, {"value": "5"})
+        elif self.path == "/large":
+            self._send_json(200, {"items": ["x" * 100] * 200, "last_value": "9"})
+        elif self.path.endswith("/missing"):
+            self._send_json(404, {"error": "not found"})
+        else:
+            self._send_json(200, {"path": self.path})
+
+    def do_POST(self):
+        """Handle POST requests by echoing the JSON body."""
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        self._record("POST", payload)
+        self._send_json(200, payload)
+
+
+@pytest.fixture
+def http_server():
+    """Run a local HTTP server on a background thread."""
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def base_url(http_server):
+    """Get the base URL of the local HTTP server."""
+    return f"http://127.0.0.1:{http_server.server_address[1]}"
+
+
+@pytest.fixture
+def http_client():
+    """Create an AsyncHttpClient using CPython's socket module as the pool."""
+    client = AsyncHttpClient(socket)
+    yield client
+    client.close()
+
+
+class TestAsyncHttpClient:
+    """Test the cooperative HTTP client against a local server."""
+
+    @pytest.mark.asyncio
+    async def test_get_json(self, http_client, base_url):
+        """Test a GET request with a Content-Length response."""
+        response = await http_client.request("GET", f"{base_url}/hello")
+
+        assert response.status_code == 200
+        assert response.json() == {"path": "/hello"}
+
+    @pytest.mark.asyncio
+    async def test_chunked_response(self, http_client, base_url):
+        """Test that chunked responses are decoded."""
+        response = await http_client.request("GET", f"{base_url}/chunked")
+
+        assert response.json() == {"value": "42"}
+
+    @pytest.mark.asyncio
+    async def test_post_json_with_headers(self, http_client, base_url, http_server):
+        """Test that a JSON body and extra headers are sent."""
+        response = await http_client.request(
+            "POST", f"{base_url}/data", headers={"X-Test": "1"}, json_body={"a": 1}
+        )
+
+        assert response.json() == {"a": 1}
+        method, path, headers, payload = http_server.requests[0]
+        assert (method, path, payload) == ("POST", "/data", {"a": 1})
+        assert headers["X-Test"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises(self, http_client, base_url):
+        """Test that a request slower than its timeout raises."""
+        with pytest.raises(RequestTimeoutError):
+            await http_client.request("GET", f"{base_url}/slow", timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_adaptive_timeout_backs_off(self, base_url):
+        """Test that a request timed out adaptively lengthens the host's next timeout."""
+        estimator = RttEstimator(min_timeout=0.05, initial_timeout=0.05, log=lambda m: None)
+        client = AsyncHttpClient(socket, rtt_estimator=estimator)
+        host = host_of(base_url).partition(":")[0]
+
+        with pytest.raises(RequestTimeoutError):
+            await client.request("GET", f"{base_url}/slow")
+        client.close()
+
+        assert estimator.timeout(host) == pytest.approx(0.1)
+
+    @pytest.mark.asyncio
+    async def test_explicit_timeout_not_learned(self, http_client, base_url):
+        """Test that a timeout passed by the caller leaves the adaptive timeout alone."""
+        host = host_of(base_url).partition(":")[0]
+        before = http_client.rtt_estimator.timeout(host)
+
+        with pytest.raises(RequestTimeoutError):
+            await http_client.request("GET", f"{base_url}/slow", timeout=0.05)
+
+        assert http_client.rtt_estimator.timeout(host) == before
+
+    @pytest.mark.asyncio
+    async def test_completed_request_recorded(self, http_client, base_url):
+        """Test that a completed request's duration is recorded for its host."""
+        await http_client.request("GET", f"{base_url}/hello")
+
+        assert http_client.rtt_estimator.get_stats()["127.0.0.1"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_loop_runs_while_waiting(self, http_client, base_url):
+        """Test that other tasks keep running while a slow response is pending."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        await http_client.request("GET", f"{base_url}/slow")
+        ticker_task.cancel()
+
+        assert ticks >= 10
+
+    def test_unsupported_scheme_raises(self, http_client):
+        """Test that non-HTTP URLs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported URL scheme"):
+            asyncio.run(http_client.request("GET", "ftp://example.com/"))
+
+
+class TestAsyncHttpClientBuffer:
+    """Test reading responses into the reused receive buffer."""
+
+    @pytest.mark.asyncio
+    async def test_buffer_reused_across_requests(self, http_client, base_url):
+        """Test that sequential requests share one response buffer."""
+        for _ in range(3):
+            await http_client.request("GET", f"{base_url}/hello")
+
+        assert http_client.get_connection_stats()["buffers_allocated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_overlapping_requests_get_own_buffers(self, http_client, base_url):
+        """Test that concurrent requests don't share a buffer."""
+        responses = await asyncio.gather(
+            http_client.request("GET", f"{base_url}/slow"),
+            http_client.request("GET", f"{base_url}/hello"),
+        )
+
+        assert [response.json() for response in responses] == [
+            {"slow": True},
+            {"path": "/hello"},
+        ]
+        assert http_client.get_connection_stats()["buffers_allocated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_large_response_grows_buffer(self, base_url):
+        """Test that a response bigger than the buffer is read completely."""
+        http_client = AsyncHttpClient(socket, buffer_size=256)
+
+        response = await http_client.request("GET", f"{base_url}/large")
+
+        assert response.json()["last_value"] == "9"
+        assert len(response.json()["items"]) == 200
+        http_client.close()
+
+    @pytest.mark.asyncio
+    async def test_json_fields_decoded_from_buffer(self, http_client, base_url):
+        """Test that only the requested JSON fields are decoded, without keeping the body."""
+        response = await http_client.request(
+            "GET", f"{base_url}/large", json_fields=("last_value",)
+        )
+
+        assert response.json() == {"last_value": "9"}
+        assert response.body == b""
+
+    @pytest.mark.asyncio
+    async def test_json_fields_from_chunked_body(self, http_client, base_url):
+        """Test that a chunked body is decoded in place before fields are read."""
+        response = await http_client.request(
+            "GET", f"{base_url}/chunked", json_fields=("value",)
+        )
+
+        assert response.json() == {"value": "42"}
+
+    @pytest.mark.asyncio
+    async def test_error_response_keeps_body(self, http_client, base_url):
+        """Test that error responses keep their body for the error message."""
+        response = await http_client.request(
+            "GET", f"{base_url}/missing", json_fields=("value",)
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "not found"}
+
+
+class TestAsyncHttpClientKeepAlive:
+    """Test reuse of persistent connections."""
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_requests(self, http_client, base_url):
+        """Test that consecutive requests to one host share a single connection."""
+        for _ in range(3):
+            response = await http_client.request("GET", f"{base_url}/hello")
+            assert response.status_code == 200
+
+        stats = http_client.get_connection_stats()
+        assert stats["connects"] == 1
+        assert stats["reuses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bytes_transferred_counted(self, http_client, base_url):
+        """Test that request and response bytes on the wire are counted."""
+        response = await http_client.request("GET", f"{base_url}/hello")
+
+        stats = http_client.get_connection_stats()
+        assert stats["bytes_sent"] > len("GET /hello HTTP/1.1")
+        assert stats["bytes_received"] > len(response.body)
+
+    @pytest.mark.asyncio
+    async def test_warm_up_connection_used_by_first_request(self, http_client, base_url):
+        """Test that the first request after warming up reuses the warm connection."""
+        await http_client.warm_up(base_url)
+
+        response = await http_client.request("GET", f"{base_url}/hello")
+
+        assert response.status_code == 200
+        stats = http_client.get_connection_stats()
+        assert stats["connects"] == 1
+        assert stats["reuses"] == 1
+        assert stats["buffers_allocated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_connection_close_response_not_reused(self, http_client, base_url):
+        """Test that a connection the server asks to close is not kept."""
+        await http_client.request("GET", f"{base_url}/close")
+        await http_client.request("GET", f"{base_url}/hello")
+
+        stats = http_client.get_connection_stats()
+        assert stats["connects"] == 2
+        assert stats["reuses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_connection_replaced_transparently(self, http_client, base_url):
+        """Test that a connection dropped by the server is replaced and the request retried."""
+        await http_client.request("GET", f"{base_url}/drop-after")
+        await asyncio.sleep(0.05)
+
+        response = await http_client.request("GET", f"{base_url}/hello")
+
+        assert response.json() == {"path": "/hello"}
+        stats = http_client.get_connection_stats()
+        assert stats["connects"] == 2
+        assert stats["stale_reconnects"] == 1
+
+
+class TestRunBlocking:
+    """Test running blocking calls off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Test that the function's return value is passed through."""
+        assert await run_blocking(lambda a, b=0: a + b, 1, b=2) == 3
+
+    @pytest.mark.asyncio
+    async def test_event_loop_runs_during_blocking_call(self):
+        """Test that a blocking call does not stall other tasks on CPython."""
+        blocking = asyncio.create_task(run_blocking(time.sleep, 0.2))
+        started = time.monotonic()
+        await asyncio.sleep(0.01)
+
+        assert time.monotonic() - started < 0.1
+        assert not blocking.done()
+        await blocking
+
+
+class TestAsyncIOClient:
+    """Test the async Adafruit IO client against a local server."""
+
+    @pytest.fixture
+    def io_client(self, http_client, base_url):
+        """Create an AsyncIOClient pointed at the local server."""
+        return AsyncIOClient(http_client, "user", "aio_key", base_url=base_url)
+
+    @pytest.mark.asyncio
+    async def test_get_group_path_and_key(self, io_client, http_server):
+        """Test that group requests use the group path and send the AIO key."""
+        result = await io_client.get_group("scores-group")
+
+        assert result == {"path": "/user/groups/scores-group"}
+        assert http_server.requests[0][2]["X-AIO-KEY"] == "aio_key"
+
+    @pytest.mark.asyncio
+    async def test_get_feed_detailed_path(self, io_client):
+        """Test that detailed feed requests use the details path."""
+        result = await io_client.get_feed("scores-group.left", detailed=True)
+
+        assert result == {"path": "/user/feeds/scores-group.left/details"}
+
+    @pytest.mark.asyncio
+    async def test_get_last_value_asks_for_value_only(self, io_client, http_server):
+        """Test that last-value requests ask for just the value and return it."""
+        assert await io_client.get_last_value("scores-group.left") == "5"
+
+        assert http_server.requests[0][1] == (
+            "/user/feeds/scores-group.left/data/last?include=value"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_group_decodes_only_requested_fields(self, io_client):
+        """Test that group reads can ask for a subset of the response."""
+        result = await io_client.get_group("scores-group", fields=("path",))
+
+        assert result == {"path": "/user/groups/scores-group"}
+
+    @pytest.mark.asyncio
+    async def test_get_last_value_of_empty_feed(self, io_client):
+        """Test that a feed without data has no last value."""
+        assert await io_client.get_last_value("empty") is None
+
+    @pytest.mark.asyncio
+    async def test_send_group_data_payload(self, io_client, http_server):
+        """Test that group writes post every feed in one request."""
+        feeds = [{"key": "left", "value": 1}, {"key": "right", "value": 2}]
+
+        await io_client.send_group_data("scores-group", feeds)
+
+        method, path, _, payload = http_server.requests[0]
+        assert (method, path) == ("POST", "/user/groups/scores-group/data")
+        assert payload == {"feeds": feeds}
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, io_client):
+        """Test that error responses raise AdafruitIORequestError."""
+        with pytest.raises(AdafruitIORequestError) as error:
+            await io_client.get_feed("missing")
+
+        assert error.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_throttle_response_carries_retry_after(self, io_client):
+        """Test that a 429 response exposes the server's Retry-After hint."""
+        with pytest.raises(AdafruitIORequestError) as error:
+            await io_client.get_feed("throttled")
+
+        assert error.value.status_code == 429
+        assert error.value.retry_after == 17
@@ -0,0 +1,151 @@
+"""Tests for CircuitBreaker."""
+
+import pytest
+
+from src.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for CircuitBreaker."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    """Create a CircuitBreaker with a 1 s base delay, 8 s cap and no jitter."""
+    return CircuitBreaker(
+        "feeds/test", base_delay=1.0, max_delay=8.0, jitter=0.0, clock=clock
+    )
+
+
+class TestCircuitBreakerStates:
+    """Test transitions between closed, open and half-open."""
+
+    def test_starts_closed(self, breaker):
+        """Test that a new breaker lets requests through."""
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request()
+
+    def test_failure_opens_breaker(self, breaker):
+        """Test that a failure rejects requests until the delay passes."""
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        assert not breaker.allow_request()
+        assert breaker.counters["rejected"] == 1
+
+    def test_half_open_allows_single_probe(self, breaker, clock):
+        """Test that only one probe is let through after the delay passes."""
+        breaker.record_failure()
+        clock.advance(1.0)
+
+        assert breaker.allow_request()
+        assert breaker.state == STATE_HALF_OPEN
+        assert not breaker.allow_request()
+
+    def test_successful_probe_closes_breaker(self, breaker, clock):
+        """Test that a successful probe closes the breaker and resets backoff."""
+        breaker.record_failure()
+        clock.advance(1.0)
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.consecutive_failures == 0
+        assert breaker.allow_request()
+
+    def test_failed_probe_reopens_with_longer_delay(self, breaker, clock):
+        """Test that a failed probe doubles the open delay."""
+        breaker.record_failure()
+        clock.advance(1.0)
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        clock.advance(1.5)
+        assert not breaker.allow_request()
+        clock.advance(0.5)
+        assert breaker.allow_request()
+
+    def test_stuck_probe_is_given_up_on(self, breaker, clock):
+        """Test that a probe that never reports back does not block forever."""
+        breaker.record_failure()
+        clock.advance(1.0)
+        breaker.allow_request()
+
+        clock.advance(8.0)
+
+        assert breaker.allow_request()
+
+    def test_reset_closes_breaker(self, breaker):
+        """Test that reset closes an open breaker immediately."""
+        breaker.record_failure()
+
+        breaker.reset()
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request()
+
+
+class TestCircuitBreakerBackoff:
+    """Test the open delay."""
+
+    def test_delay_capped_at_max(self, breaker, clock):
+        """Test that repeated failures never keep the breaker open past the cap."""
+        for _ in range(10):
+            breaker.record_failure()
+
+        clock.advance(7.9)
+        assert not breaker.allow_request()
+        clock.advance(0.1)
+        assert breaker.allow_request()
+
+    def test_jitter_shortens_delay(self, clock):
+        """Test that jitter removes up to its fraction of the delay."""
+        breaker = CircuitBreaker(
+            "feeds/test",
+            base_delay=4.0,
+            jitter=0.5,
+            clock=clock,
+            random_source=lambda: 1.0,
+        )
+        breaker.record_failure()
+
+        clock.advance(2.0)
+
+        assert breaker.allow_request()
+
+    def test_counters_track_transitions(self, breaker, clock):
+        """Test that each state transition is counted."""
+        breaker.record_failure()
+        clock.advance(1.0)
+        breaker.allow_request()
+        breaker.record_success()
+
+        assert breaker.counters == {
+            "opened": 1,
+            "half_opened": 1,
+            "closed": 1,
+            "rejected": 0,
+        }
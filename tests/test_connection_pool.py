@@ -0,0 +1,135 @@
+"""Tests for ConnectionPool."""
+
+import pytest
+
+from src.connection_pool import ConnectionPool
+
+
+class FakeSocket:
+    """Socket that records calls instead of connecting."""
+
+    def __init__(self):
+        self.closed = False
+        self.session = None
+        self.session_reused = False
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, address):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSocketPool:
+    """Socket pool handing out FakeSockets."""
+
+    AF_INET = 2
+    SOCK_STREAM = 1
+
+    def __init__(self):
+        self.sockets = []
+
+    def getaddrinfo(self, host, port):
+        return [(self.AF_INET, self.SOCK_STREAM, 0, "", (host, port))]
+
+    def socket(self, family, kind):
+        sock = FakeSocket()
+        self.sockets.append(sock)
+        return sock
+
+
+class FakeSSLContext:
+    """SSL context that hands out a session and reports resumption."""
+
+    def __init__(self, supports_sessions=True):
+        self.supports_sessions = supports_sessions
+        self.sessions_offered = []
+
+    def wrap_socket(self, sock, server_hostname=None, **kwargs):
+        if "session" in kwargs:
+            if not self.supports_sessions:
+                raise TypeError("unexpected keyword argument 'session'")
+            self.sessions_offered.append(kwargs["session"])
+            sock.session_reused = True
+        sock.session = f"session-for-{server_hostname}"
+        return sock
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def socket_pool():
+    """Create a fake socket pool."""
+    return FakeSocketPool()
+
+
+class TestConnectionPool:
+    """Test reuse, expiry and TLS resumption of pooled connections."""
+
+    def test_released_socket_reused(self, socket_pool):
+        """Test that a released socket is handed out again."""
+        pool = ConnectionPool(socket_pool)
+        sock, reused = pool.acquire("http", "example.com", 80, deadline=1e9)
+        assert not reused
+        pool.release("http", "example.com", 80, sock)
+
+        again, reused = pool.acquire("http", "example.com", 80, deadline=1e9)
+
+        assert again is sock
+        assert reused
+        assert pool.get_stats()["reuses"] == 1
+
+    def test_idle_socket_expires(self, socket_pool):
+        """Test that a socket idle longer than the timeout is closed, not reused."""
+        clock = FakeClock()
+        pool = ConnectionPool(socket_pool, idle_timeout=30.0, clock=clock)
+        sock, _ = pool.acquire("http", "example.com", 80, deadline=1e9)
+        pool.release("http", "example.com", 80, sock)
+        clock.now = 30.0
+
+        fresh, reused = pool.acquire("http", "example.com", 80, deadline=1e9)
+
+        assert not reused
+        assert fresh is not sock
+        assert sock.closed
+
+    def test_tls_session_resumed(self, socket_pool):
+        """Test that a new TLS connection offers the host's previous session."""
+        ssl_context = FakeSSLContext()
+        pool = ConnectionPool(socket_pool, ssl_context)
+        pool.discard(pool.acquire("https", "io.example", 443, deadline=1e9)[0])
+
+        pool.acquire("https", "io.example", 443, deadline=1e9)
+
+        assert ssl_context.sessions_offered == ["session-for-io.example"]
+        assert pool.get_stats()["tls_resumptions"] == 1
+
+    def test_tls_without_session_support(self, socket_pool):
+        """Test that SSL stacks without session resumption still connect."""
+        pool = ConnectionPool(socket_pool, FakeSSLContext(supports_sessions=False))
+        pool.discard(pool.acquire("https", "io.example", 443, deadline=1e9)[0])
+
+        sock, _ = pool.acquire("https", "io.example", 443, deadline=1e9)
+
+        assert not sock.closed
+        assert pool.get_stats()["connects"] == 2
+        assert pool.get_stats()["tls_resumptions"] == 0
+
+    def test_https_without_ssl_context_rejected(self, socket_pool):
+        """Test that an https connection without an SSL context fails clearly."""
+        pool = ConnectionPool(socket_pool)
+
+        with pytest.raises(ValueError):
+            pool.acquire("https", "example.com", 443, deadline=1e9)
+        assert socket_pool.sockets[0].closed
@@ -0,0 +1,76 @@
+"""Tests for CycleBudget."""
+
+import pytest
+
+from src.cycle_budget import CycleBudget
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cycle_budget(clock):
+    """Create a 6 s cycle budget with a 2 s low-priority reserve."""
+    return CycleBudget(budget=6.0, low_priority_reserve=2.0, clock=clock)
+
+
+class TestCycleBudget:
+    """Test the per-pass deadline and its counters."""
+
+    def test_no_deadline_outside_cycle(self, cycle_budget):
+        """Test that every call may start when no pass is running."""
+        assert cycle_budget.remaining() is None
+        assert cycle_budget.allow_call(low_priority=True)
+
+    def test_remaining_counts_down(self, cycle_budget, clock):
+        """Test that the time left shrinks as the pass runs, and never goes negative."""
+        cycle_budget.start_cycle()
+        clock.advance(2.5)
+
+        assert cycle_budget.remaining() == pytest.approx(3.5)
+
+        clock.advance(10.0)
+
+        assert cycle_budget.remaining() == 0.0
+
+    def test_low_priority_calls_need_reserve(self, cycle_budget, clock):
+        """Test that low-priority calls stop before the deadline, others at it."""
+        cycle_budget.start_cycle()
+        clock.advance(4.5)
+
+        assert not cycle_budget.allow_call(low_priority=True)
+        assert cycle_budget.allow_call()
+
+        clock.advance(1.5)
+
+        assert not cycle_budget.allow_call()
+        assert cycle_budget.counters["skipped"] == 2
+
+    def test_overrun_counted(self, cycle_budget, clock):
+        """Test that only a pass ending after its deadline counts as an overrun."""
+        cycle_budget.start_cycle()
+        clock.advance(5.0)
+        cycle_budget.end_cycle()
+        cycle_budget.start_cycle()
+        clock.advance(7.0)
+        cycle_budget.end_cycle()
+
+        stats = cycle_budget.get_stats()
+        assert (stats["cycles"], stats["overruns"]) == (2, 1)
+        assert stats["remaining"] is None
@@ -0,0 +1,97 @@
+"""Tests for FeedCache."""
+
+import pytest
+
+from src.feed_cache import FeedCache
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for FeedCache."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create a FeedCache that keeps the "names" feed for 10 s."""
+    return FeedCache({"names": 10.0}, clock=clock)
+
+
+class TestFeedCache:
+    """Test FeedCache freshness, invalidation and counters."""
+
+    def test_miss_before_put(self, cache):
+        """Test that a feed with no stored value is a miss."""
+        assert cache.get("names") is None
+        assert cache.misses == 1
+
+    def test_fresh_within_ttl(self, cache, clock):
+        """Test that a stored value is fresh until its time-to-live passes."""
+        cache.put("names", "Owls")
+        clock.advance(9.9)
+
+        assert cache.get("names") == ("Owls", True)
+        assert cache.hits == 1
+
+    def test_stale_after_ttl(self, cache, clock):
+        """Test that an expired value is still returned, marked stale."""
+        cache.put("names", "Owls")
+        clock.advance(10.0)
+
+        assert cache.get("names") == ("Owls", False)
+        assert cache.stale_hits == 1
+
+    def test_none_value_is_cached(self, cache):
+        """Test that an empty feed is cached rather than treated as a miss."""
+        cache.put("names", None)
+
+        assert cache.get("names") == (None, True)
+
+    def test_feed_without_ttl_not_cached(self, cache):
+        """Test that feeds without a time-to-live are never stored."""
+        cache.put("scores", "3")
+
+        assert not cache.is_cacheable("scores")
+        assert cache.get("scores") is None
+
+    def test_invalidate_one_feed(self, clock):
+        """Test that invalidating a feed leaves other feeds cached."""
+        cache = FeedCache({"names": 10.0, "gender": 10.0}, clock=clock)
+        cache.put("names", "Owls")
+        cache.put("gender", "MMP")
+
+        cache.invalidate("names")
+
+        assert cache.get("names") is None
+        assert cache.get("gender") == ("MMP", True)
+
+    def test_invalidate_all(self, cache):
+        """Test that invalidating without a feed key clears the cache."""
+        cache.put("names", "Owls")
+
+        cache.invalidate()
+
+        assert cache.get("names") is None
+
+    def test_stats(self, cache, clock):
+        """Test that get_stats reports every counter."""
+        cache.get("names")
+        cache.put("names", "Owls")
+        cache.get("names")
+        clock.advance(10.0)
+        cache.get("names")
+
+        assert cache.get_stats() == {"hits": 1, "stale_hits": 1, "misses": 1}
@@ -1,11 +1,14 @@
 """Tests for GameController using real manager instances."""
 
-from unittest.mock import patch
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.gender_manager import GenderManager
 from src.network_manager import NetworkManager
+from src.sync_manager import SYNC_RETRY_BASE_DELAY
 
 
 class TestGenderMatchupCalculation:
@@ -277,6 +280,101 @@ class TestGameControllerKeepsScore:
         assert await network_manager.get_left_team_name() == "Warriors"
         assert await network_manager.get_right_team_name() == "Dragons"
 
+    @pytest.mark.asyncio
+    async def test_unchanged_snapshot_not_applied_again(
+        self, fake_matrix_portal, game_controller, score_manager
+    ):
+        """Test that polls after nothing was written skip the score and display updates."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 2)
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 1)
+
+        with patch.object(
+            score_manager,
+            "update_scores_from_network",
+            wraps=score_manager.update_scores_from_network,
+        ) as update_scores:
+            for _ in range(4):
+                assert await game_controller.update_from_network()
+            # Applied on the first two reads of a version, then skipped
+            assert update_scores.call_count == 2
+
+            fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 3)
+            await game_controller.update_from_network()
+
+            assert update_scores.call_count == 3
+        assert score_manager.left_score == 3
+
+    @pytest.mark.asyncio
+    async def test_update_from_network_fetches_group_once(
+        self, fake_matrix_portal, game_controller, display_manager
+    ):
+        """Test that a full refresh after a score change costs a single group request."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 1)
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 0)
+        fake_matrix_portal.get_io_group = MagicMock(
+            wraps=fake_matrix_portal.get_io_group
+        )
+        fake_matrix_portal.get_io_feed = MagicMock(wraps=fake_matrix_portal.get_io_feed)
+
+        await game_controller.update_from_network()
+
+        assert fake_matrix_portal.get_io_group.call_count == 1
+        assert fake_matrix_portal.get_io_feed.call_count == 0
+        assert display_manager.text_elements["left_team"]["label"].text == "Owls"
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot_not_fetched_again(
+        self, fake_matrix_portal, game_controller, score_manager
+    ):
+        """Test that a failed group read isn't repeated by the managers in the same update."""
+        fake_matrix_portal.get_io_group = MagicMock(side_effect=OSError("Offline"))
+
+        assert not await game_controller.update_from_network()
+
+        assert fake_matrix_portal.get_io_group.call_count == 1
+        assert score_manager.left_score == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_boot_fetches_share_group_request(
+        self, fake_matrix_portal, game_controller, display_manager
+    ):
+        """Test that the two boot-time fetches running at once read the group once."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 2)
+        get_io_group = fake_matrix_portal.get_io_group
+
+        def get_io_group_slowly(group_key):
+            time.sleep(0.02)
+            return get_io_group(group_key)
+
+        fake_matrix_portal.get_io_group = MagicMock(side_effect=get_io_group_slowly)
+
+        await asyncio.gather(
+            game_controller.update_from_network(),
+            game_controller.update_team_names_and_gender(),
+        )
+
+        assert fake_matrix_portal.get_io_group.call_count == 1
+        assert display_manager.text_elements["left_team"]["label"].text == "Owls"
+
+    @pytest.mark.asyncio
+    async def test_team_names_refresh_costs_one_group_request(
+        self, fake_matrix_portal, game_controller, display_manager
+    ):
+        """Test that refreshing names and gender without a snapshot reads the group once."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_RIGHT_TEAM_FEED, "Hawks")
+        fake_matrix_portal.get_io_group = MagicMock(
+            wraps=fake_matrix_portal.get_io_group
+        )
+
+        await game_controller.update_team_names_and_gender()
+
+        assert fake_matrix_portal.get_io_group.call_count == 1
+        assert display_manager.text_elements["left_team"]["label"].text == "Owls"
+        assert display_manager.text_elements["right_team"]["label"].text == "Hawks"
+
     @pytest.mark.asyncio
     async def test_update_team_names_with_custom_names(
         self, fake_matrix_portal, game_controller, network_manager
@@ -399,7 +497,7 @@ class TestGameControllerSyncsScores:
         """Test that local changes are preserved when network is unavailable."""
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Network unavailable"),
         ):
             await game_controller.handle_left_score_button()
@@ -414,7 +512,7 @@ class TestGameControllerSyncsScores:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Still offline"),
         ):
             await game_controller.update_from_network()
@@ -433,7 +531,7 @@ class TestGameControllerSyncsScores:
         """Test that pending changes sync after network connection is restored."""
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Network unavailable"),
         ):
             await game_controller.handle_left_score_button()
@@ -459,17 +557,10 @@ class TestGameControllerSyncsScores:
         score_manager,
     ):
         """Test multiple button presses offline followed by successful sync."""
-        with (
-            patch.object(
-                network_manager,
-                "set_left_team_score",
-                side_effect=Exception("Offline"),
-            ),
-            patch.object(
-                network_manager,
-                "set_right_team_score",
-                side_effect=Exception("Offline"),
-            ),
+        with patch.object(
+            network_manager,
+            "set_feed_values",
+            side_effect=Exception("Offline"),
         ):
             await game_controller.handle_left_score_button()
             await game_controller.handle_left_score_button()
@@ -494,20 +585,44 @@ class TestGameControllerSyncsScores:
         )
 
     @pytest.mark.asyncio
-    async def test_partial_network_failure(self, network_manager, score_manager):
-        """Test scenario where one score syncs but the other fails."""
+    async def test_failed_batched_push_keeps_both_scores_pending(
+        self, fake_matrix_portal, network_manager, score_manager, sync_clock
+    ):
+        """Test that a failed push applies neither score, leaving no torn state."""
         score_manager.increment_left_score()
         score_manager.increment_right_score()
 
         with patch.object(
             network_manager,
-            "set_right_team_score",
-            side_effect=Exception("Network error on right"),
+            "set_feed_values",
+            side_effect=Exception("Network error"),
         ):
             success = await score_manager.try_sync_scores()
 
         assert not success
         assert score_manager.has_pending_changes()
+        assert (
+            fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED)
+            is None
+        )
+        assert (
+            fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED)
+            is None
+        )
+
+        # Wait out the retry backoff
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
+        success = await score_manager.try_sync_scores()
+        assert success
+        assert not score_manager.has_pending_changes()
+        assert (
+            fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED)
+            == 1
+        )
+        assert (
+            fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED)
+            == 1
+        )
 
     @pytest.mark.asyncio
     async def test_network_recovery_workflow(
@@ -516,6 +631,7 @@ class TestGameControllerSyncsScores:
         game_controller,
         network_manager,
         score_manager,
+        sync_clock,
     ):
         """Test complete offline-to-online workflow."""
         await game_controller.handle_left_score_button()
@@ -523,11 +639,13 @@ class TestGameControllerSyncsScores:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Offline"),
         ):
             await score_manager.try_sync_scores()
 
+        # Wait out the retry backoff
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
         success = await score_manager.try_sync_scores()
         assert success
         assert not score_manager.has_pending_changes()
@@ -544,13 +662,14 @@ class TestGameControllerSyncsScores:
         game_controller,
         network_manager,
         score_manager,
+        sync_clock,
     ):
         """Test that local updates take precedence over network when pending."""
         fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 100)
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Offline"),
         ):
             await game_controller.handle_left_score_button()
@@ -560,13 +679,15 @@ class TestGameControllerSyncsScores:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Still offline"),
         ):
             await game_controller.update_from_network()
 
         assert score_manager.left_score == 2
 
+        # Wait out the retry backoff
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
         success = await score_manager.try_sync_scores()
         assert success
         assert (
@@ -707,7 +828,7 @@ class TestGenderFeedSupport:
 
     @pytest.mark.asyncio
     async def test_local_gender_takes_precedence_until_sync(
-        self, game_controller, gender_manager, fake_matrix_portal
+        self, game_controller, gender_manager, fake_matrix_portal, sync_clock
     ):
         """Test that local gender value is trusted until successful sync."""
         # Toggle locally
@@ -722,7 +843,7 @@ class TestGenderFeedSupport:
         # Update from network should skip due to pending changes
         with patch.object(
             gender_manager._network_manager,
-            "set_first_point_gender",
+            "set_feed_values",
             side_effect=Exception("Offline"),
         ):
             changed = await gender_manager.update_gender_from_network()
@@ -730,6 +851,7 @@ class TestGenderFeedSupport:
             assert gender_manager.get_first_point_gender() == GenderManager.GENDER_MMP
 
         # After successful sync, network value should be used
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
         success = await gender_manager.try_sync_gender()
         assert success
         # Set feed to WMP again after sync (sync overwrote it with MMP)
@@ -740,3 +862,33 @@ class TestGenderFeedSupport:
         changed = await gender_manager.update_gender_from_network()
         assert changed
         assert gender_manager.get_first_point_gender() == GenderManager.GENDER_WMP
+
+
+class TestGameControllerNonBlockingNetwork:
+    """Test that button handling is not stalled by slow network requests."""
+
+    @pytest.mark.asyncio
+    async def test_button_latency_flat_during_slow_fetch(
+        self, fake_matrix_portal, game_controller, display_manager
+    ):
+        """Test that a button press updates the display while a slow fetch is in flight."""
+        slow_get_io_group = fake_matrix_portal.get_io_group
+
+        def get_io_group_slowly(group_key):
+            time.sleep(0.3)
+            return slow_get_io_group(group_key)
+
+        fake_matrix_portal.get_io_group = get_io_group_slowly
+
+        fetch = asyncio.create_task(game_controller.update_from_network())
+        await asyncio.sleep(0.01)
+
+        started = time.monotonic()
+        await game_controller.handle_left_score_button()
+        await asyncio.sleep(0)
+        latency = time.monotonic() - started
+
+        assert not fetch.done()
+        assert latency < 0.05
+        assert display_manager.text_elements["left_team_score"]["label"].text == "1"
+        await fetch
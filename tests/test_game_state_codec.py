@@ -0,0 +1,71 @@
+"""Tests for the packed game state encoding."""
+
+from typing import Any
+
+import pytest
+
+from src.game_snapshot import GameSnapshot
+from src.game_state_codec import GameStateDecodeError, decode_game_state, encode_game_state
+from src.gender_manager import GenderManager
+
+
+def _snapshot(**overrides) -> GameSnapshot:
+    """Create a snapshot with default values, overridden by keyword."""
+    values: dict[str, Any] = {
+        "left_score": 7,
+        "right_score": 5,
+        "left_team_name": "Owls",
+        "right_team_name": "Hawks",
+        "first_point_gender": GenderManager.GENDER_MMP,
+    }
+    values.update(overrides)
+    return GameSnapshot(**values)
+
+
+class TestGameStateCodec:
+    """Test encoding and decoding packed game states."""
+
+    def test_round_trip(self):
+        """Test that every field survives encoding and decoding."""
+        snapshot, version = decode_game_state(encode_game_state(_snapshot(), 12))
+
+        assert version == 12
+        assert snapshot.left_score == 7
+        assert snapshot.right_score == 5
+        assert snapshot.left_team_name == "Owls"
+        assert snapshot.right_team_name == "Hawks"
+        assert snapshot.first_point_gender == GenderManager.GENDER_MMP
+
+    def test_encoding_is_compact(self):
+        """Test the exact packed format."""
+        assert encode_game_state(_snapshot(), 3).startswith("GS1;3;7;5;MMP;Owls;Hawks;")
+
+    def test_missing_scores_round_trip(self):
+        """Test that unknown scores stay unknown."""
+        encoded = encode_game_state(_snapshot(left_score=None, right_score=None), 1)
+
+        snapshot, _ = decode_game_state(encoded)
+
+        assert snapshot.left_score is None
+        assert snapshot.right_score is None
+
+    def test_separator_in_team_name(self):
+        """Test that team names containing the separator or escapes round trip."""
+        encoded = encode_game_state(_snapshot(left_team_name="A;B %3B"), 1)
+
+        snapshot, _ = decode_game_state(encoded)
+
+        assert snapshot.left_team_name == "A;B %3B"
+
+    def test_corrupted_value_rejected(self):
+        """Test that a value altered in transit fails the checksum."""
+        encoded = encode_game_state(_snapshot(), 1).replace(";7;", ";8;")
+
+        with pytest.raises(GameStateDecodeError, match="checksum"):
+            decode_game_state(encoded)
+
+    @pytest.mark.parametrize("value", ["", "7", "GS2;1;0;0;WMP;A;B;0000"])
+    def test_invalid_value_rejected(self, value):
+        """Test that values that aren't packed game states are rejected."""
+        with pytest.raises(GameStateDecodeError):
+            decode_game_state(value)
@@ -6,6 +6,7 @@ import pytest
 
 from src.gender_manager import GenderManager
 from src.network_manager import NetworkManager
+from src.sync_manager import SYNC_RETRY_BASE_DELAY
 
 
 class TestGenderManager:
@@ -93,7 +94,7 @@ class TestGenderManager:
 
         with patch.object(
             network_manager,
-            "set_first_point_gender",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             success = await gender_manager.try_sync_gender()
@@ -113,7 +114,7 @@ class TestGenderManager:
 
         with patch.object(
             network_manager,
-            "set_first_point_gender",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             changed = await gender_manager.update_gender_from_network()
@@ -135,7 +136,7 @@ class TestGenderManager:
 
     @pytest.mark.asyncio
     async def test_concurrent_local_and_network_updates(
-        self, gender_manager, fake_matrix_portal, network_manager
+        self, gender_manager, fake_matrix_portal, network_manager, sync_clock
     ):
         """Test behavior when local changes are made while network has different values."""
         fake_matrix_portal.set_feed_value(NetworkManager.FIRST_POINT_GENDER_FEED, "wmp")
@@ -146,13 +147,15 @@ class TestGenderManager:
 
         with patch.object(
             network_manager,
-            "set_first_point_gender",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             changed = await gender_manager.update_gender_from_network()
             assert not changed
             assert gender_manager.get_first_point_gender() == GenderManager.GENDER_MMP
 
+        # Wait out the retry backoff
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
         success = await gender_manager.try_sync_gender()
         assert success
         assert not gender_manager.has_pending_changes()
@@ -0,0 +1,80 @@
+"""Tests for the incremental JSON field scanner."""
+
+import json
+
+import pytest
+
+from src.json_scan import project_json
+
+GROUP: dict = {
+    "id": 123,
+    "key": "scores-group",
+    "description": "Scores, with \"quotes\" and {braces}",
+    "feeds": [
+        {
+            "id": 1,
+            "last_value": "3",
+            "key": "scores-group.left",
+            "group": {"key": "scores-group", "feeds": [{"key": "nested"}]},
+            "tags": ["a", "b]"],
+        },
+        {"key": "scores-group.right", "last_value": None, "history": True},
+    ],
+}
+
+
+def _buffer(value) -> bytearray:
+    """Encode a value as indented JSON in a bytearray."""
+    return bytearray(json.dumps(value, indent=2).encode())
+
+
+class TestProjectJson:
+    """Test decoding selected fields from a buffer."""
+
+    def test_selects_fields_of_array_elements(self):
+        """Test that array elements keep only the selected fields, in any member order."""
+        result = project_json(_buffer(GROUP), ("feeds.key", "feeds.last_value"))
+
+        assert result == {
+            "feeds": [
+                {"key": "scores-group.left", "last_value": "3"},
+                {"key": "scores-group.right", "last_value": None},
+            ]
+        }
+
+    def test_null_on_the_path_is_kept(self):
+        """Test that a null where an object was expected comes back as None."""
+        buf = bytearray(b'{"details": {"data": {"last": null, "count": 0}}}')
+
+        assert project_json(buf, ("details.data.last.value",)) == {
+            "details": {"data": {"last": None}}
+        }
+
+    def test_scalar_types(self):
+        """Test that numbers, literals and escaped strings decode like json.loads."""
+        doc = {"i": -12, "f": 2.5e3, "t": True, "f2": False, "s": 'a "b" \\ é'}
+
+        assert project_json(_buffer(doc), tuple(doc)) == doc
+
+    def test_whole_subtree_selected(self):
+        """Test that selecting an object field decodes all of it."""
+        result = project_json(_buffer(GROUP), ("feeds.group",))
+
+        assert result["feeds"][0]["group"] == GROUP["feeds"][0]["group"]
+        assert result["feeds"][1] == {}
+
+    def test_respects_start_and_end(self):
+        """Test that only the given slice of the buffer is read."""
+        buf = bytearray(b'HTTP/1.1 200 OK\r\n\r\n{"value": "7"}garbage')
+
+        assert project_json(buf, ("value",), start=19, end=33) == {"value": "7"}
+
+    def test_top_level_null(self):
+        """Test that a null document decodes to None."""
+        assert project_json(bytearray(b"null"), ("value",)) is None
+
+    @pytest.mark.parametrize("doc", [b'{"value": "7"', b'{"value" "7"}', b'{"value": "7}'])
+    def test_malformed_json_raises(self, doc):
+        """Test that truncated or malformed documents raise ValueError."""
+        with pytest.raises(ValueError):
+            project_json(bytearray(doc), ("value",))
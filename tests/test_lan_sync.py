@@ -0,0 +1,189 @@
+"""Tests for LanSync with two simulated boards on loopback."""
+
+import asyncio
+import json
+import socket
+import time
+
+import pytest
+
+from src.gender_manager import GenderManager
+from src.lan_sync import SEND_REPEAT, LanSync
+from src.network_manager import NetworkManager
+
+
+def _free_port() -> int:
+    """Get a UDP port that is free right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Recorder:
+    """Async feed update callback that records what it is called with."""
+
+    def __init__(self):
+        self.updates = []
+
+    async def __call__(self, feed_key, value):
+        self.updates.append((feed_key, value))
+
+
+@pytest.fixture
+def port():
+    """Pick the UDP port both boards share."""
+    return _free_port()
+
+
+def _open_board(port, on_feed_update, board_id):
+    """Create and open a LanSync on loopback, skipping if multicast is unavailable."""
+    lan_sync = LanSync(
+        socket, on_feed_update, board_id=board_id, port=port, interface="127.0.0.1"
+    )
+    if not lan_sync.open():
+        pytest.skip("UDP multicast is not available on loopback")
+    return lan_sync
+
+
+@pytest.fixture
+def recorder():
+    """Record the feed updates board a applies."""
+    return Recorder()
+
+
+@pytest.fixture
+def board_a(port, recorder):
+    """Create the board where changes are made."""
+    lan_sync = _open_board(port, recorder, "board-a")
+    yield lan_sync
+    lan_sync.close()
+
+
+@pytest.fixture
+def board_b(port, game_controller):
+    """Create the peer board, applying updates through its game controller."""
+    lan_sync = _open_board(port, game_controller.handle_feed_update, "board-b")
+    yield lan_sync
+    lan_sync.close()
+
+
+async def _process_until(lan_sync, condition, timeout=1.0):
+    """Process messages until condition() holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        await lan_sync.process_messages()
+        await asyncio.sleep(0.001)
+
+
+class TestLanSync:
+    """Test sending state changes between boards."""
+
+    @pytest.mark.asyncio
+    async def test_peer_applies_broadcast_state(
+        self, board_a, board_b, score_manager, gender_manager, display_manager
+    ):
+        """Test that a change broadcast by one board updates the other board."""
+        board_a.broadcast(
+            {
+                NetworkManager.SCORES_LEFT_TEAM_FEED: 4,
+                NetworkManager.SCORES_RIGHT_TEAM_FEED: 2,
+                NetworkManager.FIRST_POINT_GENDER_FEED: GenderManager.GENDER_MMP,
+            }
+        )
+
+        await _process_until(board_b, lambda: board_b.counters["received"] == 1)
+
+        assert (score_manager.left_score, score_manager.right_score) == (4, 2)
+        assert gender_manager.get_first_point_gender() == GenderManager.GENDER_MMP
+        assert display_manager.text_elements["left_team_score"]["label"].text == "4"
+        # Received state counts as synced, only the sending board pushes it
+        assert not score_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_peer_update_arrives_within_tens_of_ms(self, board_a, board_b, score_manager):
+        """Test that a running peer applies a change well under a poll interval."""
+        task = asyncio.create_task(board_b.run())
+        try:
+            started = time.monotonic()
+            board_a.broadcast({NetworkManager.SCORES_LEFT_TEAM_FEED: 9})
+            while score_manager.left_score != 9 and time.monotonic() - started < 1.0:
+                await asyncio.sleep(0.001)
+            elapsed = time.monotonic() - started
+        finally:
+            task.cancel()
+
+        assert score_manager.left_score == 9
+        assert elapsed < 0.1
+
+    @pytest.mark.asyncio
+    async def test_repeated_copies_applied_once(self, board_a, board_b):
+        """Test that the extra copies of a message are dropped as duplicates."""
+        board_a.broadcast({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+
+        await _process_until(
+            board_b, lambda: board_b.counters["duplicates"] == SEND_REPEAT - 1
+        )
+
+        assert board_b.counters["received"] == 1
+        assert board_b.counters["duplicates"] == SEND_REPEAT - 1
+
+    @pytest.mark.asyncio
+    async def test_own_messages_ignored(self, board_a, board_b, recorder):
+        """Test that a board does not apply the messages it sent itself."""
+        board_a.broadcast({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+        await _process_until(board_b, lambda: board_b.counters["received"] == 1)
+
+        await board_a.process_messages()
+
+        assert recorder.updates == []
+
+
+class TestLanSyncMessages:
+    """Test decoding and ordering of received messages."""
+
+    @pytest.fixture
+    def lan_sync(self):
+        """Create a LanSync without opening a socket."""
+        return LanSync(socket, Recorder(), board_id="self")
+
+    def _message(self, board_id, sequence, values=None):
+        return json.dumps(
+            {"v": 1, "b": board_id, "s": sequence, "f": values or {"feed": 1}}
+        )
+
+    def test_older_sequence_dropped(self, lan_sync):
+        """Test that a message older than one already applied is dropped."""
+        assert lan_sync._accept(self._message("peer", 2)) == {"feed": 1}
+        assert lan_sync._accept(self._message("peer", 1)) is None
+        assert lan_sync._accept(self._message("peer", 3)) == {"feed": 1}
+
+    def test_sequences_tracked_per_board(self, lan_sync):
+        """Test that each peer has its own sequence numbers."""
+        assert lan_sync._accept(self._message("peer-1", 5)) is not None
+        assert lan_sync._accept(self._message("peer-2", 1)) is not None
+
+    @pytest.mark.parametrize(
+        "data",
+        ["not json", '{"v": 1, "b": "peer"}', '{"v": 1, "b": "peer", "s": 1, "f": 5}'],
+    )
+    def test_invalid_message_counted(self, lan_sync, data):
+        """Test that malformed messages are ignored and counted."""
+        assert lan_sync._accept(data) is None
+        assert lan_sync.counters["invalid"] == 1
+
+    def test_other_version_ignored(self, lan_sync):
+        """Test that messages in another format version are ignored."""
+        data = json.dumps({"v": 2, "b": "peer", "s": 1, "f": {"feed": 1}})
+
+        assert lan_sync._accept(data) is None
+
+    def test_broadcast_without_socket_fails(self, lan_sync):
+        """Test that broadcasting before opening reports failure."""
+        assert not lan_sync.broadcast({"feed": 1})
+
+    def test_open_failure_returns_false(self):
+        """Test that a socket that can't join the group is reported, not raised."""
+        lan_sync = LanSync(socket, Recorder(), group="not-an-address", port=_free_port())
+
+        assert not lan_sync.open()
+        assert not lan_sync.is_open
@@ -0,0 +1,139 @@
+"""Tests for MqttSubscriber against a local fake MQTT broker."""
+
+import pytest
+
+from fakes import FakeMQTTBroker, FakeMQTTClient
+from src.game_snapshot import GameSnapshot
+from src.game_state_codec import encode_game_state
+from src.gender_manager import GenderManager
+from src.mqtt_subscriber import SUBSCRIBED_FEEDS, MqttSubscriber
+from src.network_manager import NetworkManager
+
+USERNAME = "scorekeeper"
+
+
+def feed_topic(feed_key):
+    """Get the Adafruit IO MQTT topic for a feed."""
+    return f"{USERNAME}/f/{feed_key}"
+
+
+@pytest.fixture
+def mqtt_broker():
+    """Create a local MQTT broker stand-in."""
+    return FakeMQTTBroker()
+
+
+@pytest.fixture
+def mqtt_subscriber(mqtt_broker, game_controller):
+    """Create an MqttSubscriber that applies updates through the game controller."""
+    return MqttSubscriber(
+        FakeMQTTClient(mqtt_broker), USERNAME, game_controller.handle_feed_update
+    )
+
+
+class TestMqttSubscriber:
+    """Test applying pushed feed updates from MQTT."""
+
+    def test_connect_subscribes_to_every_feed(self, mqtt_subscriber, mqtt_broker):
+        """Test that connecting subscribes to all scores group feeds."""
+        assert mqtt_subscriber.connect()
+
+        assert mqtt_subscriber.is_connected
+        for feed_key in SUBSCRIBED_FEEDS:
+            assert feed_topic(feed_key) in mqtt_broker._subscriptions
+
+    def test_connect_failure_returns_false(self, mqtt_subscriber):
+        """Test that a failed connection is reported instead of raised."""
+        mqtt_subscriber._client.fail_connect = True
+
+        assert not mqtt_subscriber.connect()
+        assert not mqtt_subscriber.is_connected
+
+    @pytest.mark.asyncio
+    async def test_pushed_score_applied_to_score_manager(
+        self, mqtt_subscriber, mqtt_broker, score_manager, display_manager
+    ):
+        """Test that a published score updates the score and display on the next loop."""
+        mqtt_subscriber.connect()
+
+        mqtt_broker.publish(feed_topic(NetworkManager.SCORES_LEFT_TEAM_FEED), "7")
+        applied = await mqtt_subscriber.process_messages()
+
+        assert applied == 1
+        assert score_manager.left_score == 7
+        assert score_manager.right_score == 0
+        assert display_manager.text_elements["left_team_score"]["label"].text == "7"
+
+    @pytest.mark.asyncio
+    async def test_pushed_gender_applied_to_gender_manager(
+        self, mqtt_subscriber, mqtt_broker, gender_manager, display_manager
+    ):
+        """Test that a published gender updates the gender matchup."""
+        mqtt_subscriber.connect()
+
+        mqtt_broker.publish(feed_topic(NetworkManager.FIRST_POINT_GENDER_FEED), "mmp")
+        await mqtt_subscriber.process_messages()
+
+        assert gender_manager.get_first_point_gender() == GenderManager.GENDER_MMP
+        assert display_manager.text_elements["gender_matchup"]["label"].text == "MMP"
+
+    @pytest.mark.asyncio
+    async def test_pushed_team_name_updates_display(
+        self, mqtt_subscriber, mqtt_broker, display_manager
+    ):
+        """Test that a published team name is shown immediately."""
+        mqtt_subscriber.connect()
+
+        mqtt_broker.publish(feed_topic(NetworkManager.TEAM_RIGHT_TEAM_FEED), "Hawks")
+        await mqtt_subscriber.process_messages()
+
+        assert display_manager.text_elements["right_team"]["label"].text == "Hawks"
+
+    @pytest.mark.asyncio
+    async def test_pushed_packed_state_applied(
+        self, mqtt_subscriber, mqtt_broker, score_manager, display_manager
+    ):
+        """Test that a published packed game state updates scores and names at once."""
+        mqtt_subscriber.connect()
+        snapshot = GameSnapshot(3, 2, "Owls", "Hawks", GenderManager.GENDER_WMP)
+
+        mqtt_broker.publish(
+            feed_topic(NetworkManager.GAME_STATE_FEED), encode_game_state(snapshot, 1)
+        )
+        await mqtt_subscriber.process_messages()
+
+        assert (score_manager.left_score, score_manager.right_score) == (3, 2)
+        assert display_manager.text_elements["left_team"]["label"].text == "Owls"
+
+    @pytest.mark.asyncio
+    async def test_pending_local_changes_win_over_pushed_score(
+        self, mqtt_subscriber, mqtt_broker, score_manager
+    ):
+        """Test that a pushed score does not overwrite an unsynced local press."""
+        mqtt_subscriber.connect()
+        score_manager.increment_left_score()
+
+        mqtt_broker.publish(feed_topic(NetworkManager.SCORES_LEFT_TEAM_FEED), "7")
+        await mqtt_subscriber.process_messages()
+
+        assert score_manager.left_score == 1
+        assert score_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_connect_requests_last_values(
+        self, mqtt_subscriber, mqtt_broker, score_manager
+    ):
+        """Test that values published before connecting are re-sent on connect."""
+        mqtt_broker.publish(feed_topic(NetworkManager.SCORES_RIGHT_TEAM_FEED), "4")
+
+        mqtt_subscriber.connect()
+        await mqtt_subscriber.process_messages()
+
+        assert score_manager.right_score == 4
+
+    @pytest.mark.asyncio
+    async def test_no_messages_when_idle(self, mqtt_subscriber):
+        """Test that an idle subscription applies nothing."""
+        mqtt_subscriber.connect()
+
+        assert await mqtt_subscriber.process_messages() == 0
@@ -1,12 +1,20 @@
 """Tests for NetworkManager using fake implementations."""
 
+import asyncio
 import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.adafruit_io_client import AdafruitIORequestError
+from src.circuit_breaker import DEFAULT_BASE_DELAY, STATE_CLOSED, STATE_OPEN
+from src.cycle_budget import CycleBudget
+from src.game_snapshot import GameSnapshot
+from src.game_state_codec import decode_game_state, encode_game_state
 from src.gender_manager import GenderManager
 from src.network_manager import NetworkManager
+from src.request_budget import PRIORITY_POLL, PRIORITY_PUSH, RequestBudget
+from src.transports.memory import MemoryTransport
 
 
 class TestNetworkManager:
@@ -169,6 +177,7 @@ class TestNetworkManagerGender:
         assert result == GenderManager.GENDER_MMP
 
         fake_matrix_portal.set_feed_value(NetworkManager.FIRST_POINT_GENDER_FEED, "WMP")
+        network_manager.invalidate_feed_cache(NetworkManager.FIRST_POINT_GENDER_FEED)
 
         result = await network_manager.get_first_point_gender()
 
@@ -244,6 +253,8 @@ class TestNetworkManagerGender:
 class TestNetworkManagerCircuitBreaker:
     """Test circuit breaker functionality in NetworkManager."""
 
+    LEFT_SCORE_ENDPOINT = f"feeds/{NetworkManager.SCORES_LEFT_TEAM_FEED}"
+
     @pytest.mark.asyncio
     async def test_circuit_breaker_triggers_on_network_exception(
         self, network_manager, fake_matrix_portal
@@ -256,7 +267,8 @@ class TestNetworkManagerCircuitBreaker:
         result = await network_manager.get_left_team_score()
 
         assert result is None
-        assert network_manager._circuit_breaker_open_until is not None
+        breaker = network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT)
+        assert breaker.state == STATE_OPEN
 
     @pytest.mark.asyncio
     async def test_circuit_breaker_skips_requests_when_open(
@@ -276,7 +288,7 @@ class TestNetworkManagerCircuitBreaker:
         )
         fake_matrix_portal.get_io_feed = mock_get_io_feed
 
-        network_manager._circuit_breaker_open_until = time.monotonic() + 60
+        network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT).record_failure()
 
         result = await network_manager.get_left_team_score()
 
@@ -284,10 +296,19 @@ class TestNetworkManagerCircuitBreaker:
         assert mock_get_io_feed.call_count == 0
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_resets_after_timeout(
+    async def test_circuit_breaker_is_per_endpoint(self, network_manager, fake_matrix_portal):
+        """Test that a failing feed does not block reads of other feeds."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 4)
+        network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT).record_failure()
+
+        assert await network_manager.get_left_team_score() is None
+        assert await network_manager.get_right_team_score() == 4
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_circuit_breaker(
         self, network_manager, fake_matrix_portal
     ):
-        """Test that circuit breaker resets after 60 seconds."""
+        """Test that a successful probe after the backoff delay closes the breaker."""
         fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 5)
         fake_matrix_portal.get_io_feed = MagicMock(
             side_effect=Exception("Network error")
@@ -295,11 +316,11 @@ class TestNetworkManagerCircuitBreaker:
 
         await network_manager.get_left_team_score()
 
-        assert network_manager._circuit_breaker_open_until is not None
-        original_open_until = network_manager._circuit_breaker_open_until
+        breaker = network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT)
+        assert breaker.state == STATE_OPEN
 
-        with patch("src.network_manager.time.monotonic") as mock_time:
-            mock_time.return_value = original_open_until + 1
+        with patch("src.circuit_breaker.time") as mock_time:
+            mock_time.monotonic.return_value = time.monotonic() + DEFAULT_BASE_DELAY
             mock_get_io_feed = MagicMock(
                 return_value={
                     "details": {
@@ -317,6 +338,7 @@ class TestNetworkManagerCircuitBreaker:
 
             assert result == 5
             assert mock_get_io_feed.call_count == 1
+            assert breaker.state == STATE_CLOSED
 
     @pytest.mark.asyncio
     async def test_circuit_breaker_applies_to_set_feed_value(
@@ -330,8 +352,6 @@ class TestNetworkManagerCircuitBreaker:
         with pytest.raises(Exception, match="Network error"):
             await network_manager.set_left_team_score(5)
 
-        assert network_manager._circuit_breaker_open_until is not None
-
         fake_matrix_portal.push_to_io = MagicMock()
         await network_manager.set_left_team_score(10)
 
@@ -347,7 +367,8 @@ class TestNetworkManagerCircuitBreaker:
         result = await network_manager.get_left_team_score()
 
         assert result is None
-        assert network_manager._circuit_breaker_open_until is None
+        breaker = network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT)
+        assert breaker.state == STATE_CLOSED
 
     @pytest.mark.asyncio
     async def test_circuit_breaker_not_triggered_by_typeerror(
@@ -359,7 +380,8 @@ class TestNetworkManagerCircuitBreaker:
         result = await network_manager.get_left_team_score()
 
         assert result is None
-        assert network_manager._circuit_breaker_open_until is None
+        breaker = network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT)
+        assert breaker.state == STATE_CLOSED
 
     @pytest.mark.asyncio
     async def test_show_connecting_not_called_when_circuit_breaker_open(
@@ -368,8 +390,788 @@ class TestNetworkManagerCircuitBreaker:
         """Test that show_connecting is not called when circuit breaker is open."""
         mock_show_connecting = MagicMock()
         network_manager.display_manager.show_connecting = mock_show_connecting
-        network_manager._circuit_breaker_open_until = time.monotonic() + 60
+        network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT).record_failure()
 
         await network_manager.get_left_team_score()
 
         assert mock_show_connecting.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_reset_closes_every_circuit_breaker(self, network_manager):
+        """Test that reset_circuit_breaker closes the breakers of all endpoints."""
+        network_manager._circuit_breaker(self.LEFT_SCORE_ENDPOINT).record_failure()
+        network_manager._circuit_breaker("groups/scores-group").record_failure()
+
+        network_manager.reset_circuit_breaker()
+
+        stats = network_manager.get_circuit_breaker_stats()
+        assert stats[self.LEFT_SCORE_ENDPOINT]["state"] == STATE_CLOSED
+        assert stats["groups/scores-group"]["state"] == STATE_CLOSED
+        assert stats["groups/scores-group"]["opened"] == 1
+        assert stats["groups/scores-group"]["closed"] == 1
+
+
+class TestNetworkManagerLink:
+    """Test skipping requests while the Wi-Fi link is down."""
+
+    @pytest.mark.asyncio
+    async def test_requests_skipped_while_link_down(
+        self, network_manager, fake_matrix_portal, request_budget
+    ):
+        """Test that no request starts and no budget is spent while the link is down."""
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+        network_manager.set_link_up(False)
+
+        assert await network_manager.get_group_snapshot() is None
+        with pytest.raises(ConnectionError):
+            await network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+
+        assert fake_matrix_portal.get_io_group.call_count == 0
+        assert request_budget.counters["granted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_link_up_resets_circuit_breakers(self, network_manager, fake_matrix_portal):
+        """Test that failures from before the link came back don't keep requests blocked."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "3")
+        network_manager._circuit_breaker(f"groups/{NetworkManager.SCORES_GROUP}").record_failure()
+        network_manager.set_link_up(False)
+
+        network_manager.set_link_up(True)
+
+        snapshot = await network_manager.get_group_snapshot()
+        assert snapshot.left_score == 3
+
+
+class SlowTransport(MemoryTransport):
+    """In-memory transport whose reads take longer than any cycle budget in these tests."""
+
+    async def read_many(self, feed_keys):
+        await asyncio.sleep(1.0)
+        return await super().read_many(feed_keys)
+
+
+class TestNetworkManagerCycleBudget:
+    """Test holding requests to the deadline of the current sync cycle."""
+
+    @pytest.fixture
+    def clock(self):
+        """Clock whose time only moves when the test sets it."""
+        return MagicMock(return_value=100.0)
+
+    @pytest.fixture
+    def cycle_budget(self, clock):
+        """Create a 6 s cycle budget with a 2 s low-priority reserve."""
+        return CycleBudget(budget=6.0, low_priority_reserve=2.0, clock=clock)
+
+    @pytest.fixture
+    def budgeted_network_manager(
+        self, fake_matrix_portal, display_manager, request_budget, cycle_budget
+    ):
+        """Create a NetworkManager over memory held to the cycle budget."""
+        return NetworkManager(
+            fake_matrix_portal,
+            display_manager,
+            request_budget=request_budget,
+            transport=MemoryTransport(),
+            cycle_budget=cycle_budget,
+        )
+
+    @pytest.mark.asyncio
+    async def test_low_priority_read_skipped_when_budget_low(
+        self, budgeted_network_manager, cycle_budget, clock
+    ):
+        """Test that a team name read is skipped with little budget left, a score read isn't."""
+        cycle_budget.start_cycle()
+        clock.return_value = 105.0
+
+        assert await budgeted_network_manager.get_left_team_name() == "AWAY"
+        assert cycle_budget.counters["skipped"] == 1
+        assert await budgeted_network_manager.get_group_snapshot() is not None
+        assert cycle_budget.counters["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_push_refused_after_deadline(
+        self, budgeted_network_manager, cycle_budget, clock, request_budget
+    ):
+        """Test that a push is not started once the cycle's deadline has passed."""
+        cycle_budget.start_cycle()
+        clock.return_value = 107.0
+
+        with pytest.raises(ConnectionError):
+            await budgeted_network_manager.set_feed_values(
+                {NetworkManager.SCORES_LEFT_TEAM_FEED: 1}
+            )
+
+        assert request_budget.counters["granted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_unlimited_outside_cycle(self, budgeted_network_manager, clock):
+        """Test that requests outside of a cycle have no deadline."""
+        clock.return_value = 1000.0
+
+        await budgeted_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 2})
+
+        snapshot = await budgeted_network_manager.get_group_snapshot()
+        assert snapshot.left_score == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_read_cut_off_at_deadline(
+        self, fake_matrix_portal, display_manager, request_budget
+    ):
+        """Test that a read still running at the deadline is cut off and counted."""
+        cycle_budget = CycleBudget(budget=0.05)
+        manager = NetworkManager(
+            fake_matrix_portal,
+            display_manager,
+            request_budget=request_budget,
+            transport=SlowTransport(),
+            cycle_budget=cycle_budget,
+        )
+        cycle_budget.start_cycle()
+        started = time.monotonic()
+
+        assert await manager.get_group_snapshot() is None
+
+        assert time.monotonic() - started < 0.5
+        assert cycle_budget.counters["timed_out"] == 1
+
+    @pytest.mark.asyncio
+    async def test_circuitpython_timeout_counted(
+        self, budgeted_network_manager, cycle_budget
+    ):
+        """Test that a wait_for timeout that isn't the builtin TimeoutError is counted."""
+
+        class CoreTimeoutError(Exception):
+            """Stand-in for CircuitPython's asyncio.core.TimeoutError."""
+
+        async def wait_for(awaitable, timeout):
+            awaitable.close()
+            raise CoreTimeoutError
+
+        cycle_budget.start_cycle()
+        with (
+            patch("src.network_manager.AsyncTimeoutError", CoreTimeoutError),
+            patch("src.network_manager.asyncio.wait_for", wait_for),
+        ):
+            assert await budgeted_network_manager.get_group_snapshot() is None
+
+        assert cycle_budget.counters["timed_out"] == 1
+
+
+class TestNetworkManagerReadYourWrites:
+    """Test answering group reads right after our own write from the written values."""
+
+    @pytest.fixture
+    def clock(self):
+        """Clock whose time only moves when the test sets it."""
+        return MagicMock(return_value=100.0)
+
+    @pytest.fixture
+    def ryw_network_manager(self, fake_matrix_portal, display_manager, request_budget, clock):
+        """Create a NetworkManager with a 5 s read-your-writes window."""
+        return NetworkManager(
+            fake_matrix_portal,
+            display_manager,
+            request_budget=request_budget,
+            read_your_writes_window=5.0,
+            clock=clock,
+        )
+
+    @pytest.mark.asyncio
+    async def test_read_after_own_write_skipped(self, ryw_network_manager, fake_matrix_portal):
+        """Test that a read within the window returns our write without a request."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Red")
+        await ryw_network_manager.get_group_snapshot()
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 4})
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        snapshot = await ryw_network_manager.get_group_snapshot()
+
+        assert fake_matrix_portal.get_io_group.call_count == 0
+        assert snapshot.left_score == 4
+        assert snapshot.left_team_name == "Red"
+        assert snapshot.version is None
+        assert ryw_network_manager.get_read_your_writes_stats()["reads_skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_read_after_window_sees_other_writers(
+        self, ryw_network_manager, fake_matrix_portal, clock
+    ):
+        """Test that once the window has passed, another board's write is read."""
+        await ryw_network_manager.get_group_snapshot()
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 4})
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, "7")
+        clock.return_value = 105.0
+
+        snapshot = await ryw_network_manager.get_group_snapshot()
+
+        assert snapshot.right_score == 7
+
+    @pytest.mark.asyncio
+    async def test_later_writes_dont_extend_window(
+        self, ryw_network_manager, fake_matrix_portal, clock
+    ):
+        """Test that a board that keeps writing still reads once the first write's window passes."""
+        await ryw_network_manager.get_group_snapshot()
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_RIGHT_TEAM_FEED, "Blue")
+        clock.return_value = 104.0
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 2})
+        clock.return_value = 105.0
+
+        snapshot = await ryw_network_manager.get_group_snapshot()
+
+        assert snapshot.right_team_name == "Blue"
+        assert snapshot.left_score == 2
+
+    @pytest.mark.asyncio
+    async def test_pushed_value_from_other_board_forces_read(
+        self, ryw_network_manager, fake_matrix_portal
+    ):
+        """Test that a pushed value differing from our write makes the next poll read."""
+        await ryw_network_manager.get_group_snapshot()
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 4})
+        ryw_network_manager.cache_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "4")
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "5")
+        ryw_network_manager.cache_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "5")
+
+        snapshot = await ryw_network_manager.get_group_snapshot()
+
+        assert snapshot.left_score == 5
+        assert ryw_network_manager.get_read_your_writes_stats()["reads_skipped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_no_shortcut_before_first_read(self, ryw_network_manager, fake_matrix_portal):
+        """Test that a write before any read doesn't stand in for the feeds never read."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, "3")
+        await ryw_network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+
+        snapshot = await ryw_network_manager.get_group_snapshot()
+
+        assert snapshot.right_score == 3
+
+
+class TestNetworkManagerGroupSnapshot:
+    """Test fetching the whole scores group in one request."""
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_reads_all_feeds(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that the snapshot holds the value of every feed in the group."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "4")
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, "2")
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Red")
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_RIGHT_TEAM_FEED, "Blue")
+        fake_matrix_portal.set_feed_value(NetworkManager.FIRST_POINT_GENDER_FEED, "mmp")
+
+        snapshot = await network_manager.get_group_snapshot()
+
+        assert snapshot.left_score == 4
+        assert snapshot.right_score == 2
+        assert snapshot.left_team_name == "Red"
+        assert snapshot.right_team_name == "Blue"
+        assert snapshot.first_point_gender == GenderManager.GENDER_MMP
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_uses_single_request(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that the snapshot is fetched with one group call and no feed calls."""
+        fake_matrix_portal.get_io_group = MagicMock(
+            wraps=fake_matrix_portal.get_io_group
+        )
+        fake_matrix_portal.get_io_feed = MagicMock(wraps=fake_matrix_portal.get_io_feed)
+
+        await network_manager.get_group_snapshot()
+
+        fake_matrix_portal.get_io_group.assert_called_once_with(
+            NetworkManager.SCORES_GROUP
+        )
+        assert fake_matrix_portal.get_io_feed.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_version_tracks_feed_writes(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that the version stays put until a feed in the group is written."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "4")
+
+        first = await network_manager.get_group_snapshot()
+        second = await network_manager.get_group_snapshot()
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, "4")
+        third = await network_manager.get_group_snapshot()
+
+        assert first.version is not None
+        assert second.version == first.version
+        assert third.version != first.version
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_without_timestamps_has_no_version(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that a group response without updated_at can't be told apart."""
+        fake_matrix_portal.get_io_group = MagicMock(
+            return_value={
+                "key": NetworkManager.SCORES_GROUP,
+                "feeds": [{"key": NetworkManager.SCORES_LEFT_TEAM_FEED, "last_value": "9"}],
+            }
+        )
+
+        snapshot = await network_manager.get_group_snapshot()
+
+        assert snapshot.left_score == 9
+        assert snapshot.version is None
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_defaults_for_missing_feeds(self, network_manager):
+        """Test that missing feeds give None scores and default names and gender."""
+        snapshot = await network_manager.get_group_snapshot()
+
+        assert snapshot.left_score is None
+        assert snapshot.right_score is None
+        assert snapshot.left_team_name == NetworkManager.DEFAULT_LEFT_TEAM_NAME
+        assert snapshot.right_team_name == NetworkManager.DEFAULT_RIGHT_TEAM_NAME
+        assert snapshot.first_point_gender == GenderManager.DEFAULT_GENDER
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_accepts_unprefixed_feed_keys(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that feed keys without the group prefix are matched to the group."""
+        fake_matrix_portal.get_io_group = MagicMock(
+            return_value={
+                "key": NetworkManager.SCORES_GROUP,
+                "feeds": [{"key": "left-team-score-feed", "last_value": "9"}],
+            }
+        )
+
+        snapshot = await network_manager.get_group_snapshot()
+
+        assert snapshot.left_score == 9
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_triggers_circuit_breaker_on_exception(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that a network error returns None and opens the circuit breaker."""
+        fake_matrix_portal.get_io_group = MagicMock(
+            side_effect=Exception("Network error")
+        )
+
+        snapshot = await network_manager.get_group_snapshot()
+
+        assert snapshot is None
+        breaker = network_manager._circuit_breaker(f"groups/{NetworkManager.SCORES_GROUP}")
+        assert breaker.state == STATE_OPEN
+
+
+class TestNetworkManagerFeedCache:
+    """Test caching of slow-changing feeds."""
+
+    @pytest.mark.asyncio
+    async def test_team_name_served_from_cache(self, network_manager, fake_matrix_portal):
+        """Test that a second read within the time-to-live makes no request."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        assert await network_manager.get_left_team_name() == "Owls"
+        assert await network_manager.get_left_team_name() == "Owls"
+
+        assert fake_matrix_portal.get_io_group.call_count == 1
+        assert network_manager.get_feed_cache_stats() == {
+            "hits": 1,
+            "stale_hits": 0,
+            "misses": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_group_snapshot_primes_cache(self, network_manager, fake_matrix_portal):
+        """Test that the score poll's group read refreshes cached names and gender."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_RIGHT_TEAM_FEED, "Hawks")
+        fake_matrix_portal.set_feed_value(NetworkManager.FIRST_POINT_GENDER_FEED, "MMP")
+        await network_manager.get_group_snapshot()
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        assert await network_manager.get_right_team_name() == "Hawks"
+        assert await network_manager.get_first_point_gender() == GenderManager.GENDER_MMP
+        assert fake_matrix_portal.get_io_group.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_revalidating(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that an expired value is returned at once and refreshed in the background."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        await network_manager.get_left_team_name()
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Hawks")
+
+        ttl = NetworkManager.FEED_CACHE_TTLS[NetworkManager.TEAM_LEFT_TEAM_FEED]
+        with patch("src.feed_cache.time") as mock_time:
+            mock_time.monotonic.return_value = time.monotonic() + ttl
+            assert await network_manager.get_left_team_name() == "Owls"
+            await asyncio.gather(*network_manager._revalidating.values())
+
+        assert await network_manager.get_left_team_name() == "Hawks"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self, network_manager, fake_matrix_portal):
+        """Test that an invalidated feed is read from the network again."""
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        await network_manager.get_left_team_name()
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Hawks")
+
+        network_manager.invalidate_feed_cache(NetworkManager.TEAM_LEFT_TEAM_FEED)
+
+        assert await network_manager.get_left_team_name() == "Hawks"
+
+    @pytest.mark.asyncio
+    async def test_batched_write_updates_cache(self, network_manager, fake_matrix_portal):
+        """Test that values written by this board are cached without a read."""
+        await network_manager.set_feed_values(
+            {NetworkManager.FIRST_POINT_GENDER_FEED: GenderManager.GENDER_MMP}
+        )
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        assert await network_manager.get_first_point_gender() == GenderManager.GENDER_MMP
+        assert fake_matrix_portal.get_io_group.call_count == 0
+
+
+class TestNetworkManagerSingleFlight:
+    """Test that concurrent identical reads share one request."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_group_reads_share_request(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that concurrent snapshot reads make a single group request."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 7)
+        get_io_group = fake_matrix_portal.get_io_group
+        calls = []
+
+        def get_io_group_slowly(group_key):
+            calls.append(group_key)
+            time.sleep(0.02)
+            return get_io_group(group_key)
+
+        fake_matrix_portal.get_io_group = get_io_group_slowly
+
+        snapshots = await asyncio.gather(
+            network_manager.get_group_snapshot(),
+            network_manager.get_group_snapshot(),
+        )
+
+        assert [snapshot.left_score for snapshot in snapshots] == [7, 7]
+        assert calls == [NetworkManager.SCORES_GROUP]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_feed_reads_share_request(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that concurrent reads of one feed make a single feed request."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 0)
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 2)
+        fake_matrix_portal.get_io_feed = MagicMock(wraps=fake_matrix_portal.get_io_feed)
+
+        scores = await asyncio.gather(
+            network_manager.get_right_team_score(),
+            network_manager.get_right_team_score(),
+            network_manager.get_left_team_score(),
+        )
+
+        assert scores == [2, 2, 0]
+        assert fake_matrix_portal.get_io_feed.call_count == 2
+
+
+class TestNetworkManagerRequestBudget:
+    """Test that requests are paced by the request budget."""
+
+    @pytest.fixture
+    def request_budget(self):
+        """Create a budget of 60 requests per minute with half reserved for pushes."""
+        return RequestBudget(rate_per_minute=60, push_reserve=0.5)
+
+    @pytest.mark.asyncio
+    async def test_polls_skipped_when_only_reserve_left(
+        self, network_manager, fake_matrix_portal, request_budget
+    ):
+        """Test that reads stop once only the push reserve is left, but pushes go out."""
+        request_budget.try_acquire(PRIORITY_POLL, cost=5)
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        assert await network_manager.get_group_snapshot() is None
+        assert fake_matrix_portal.get_io_group.call_count == 0
+
+        await network_manager.set_feed_values({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+        assert len(fake_matrix_portal.network.io_client.group_data_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_push_raises_when_budget_spent(self, network_manager, request_budget):
+        """Test that a push over budget fails so its changes stay pending."""
+        request_budget.try_acquire(PRIORITY_PUSH, cost=10)
+
+        with pytest.raises(ConnectionError):
+            await network_manager.set_feed_values(
+                {NetworkManager.SCORES_LEFT_TEAM_FEED: 1}
+            )
+
+    @pytest.mark.asyncio
+    async def test_throttle_response_pauses_requests(
+        self, network_manager, fake_matrix_portal, request_budget
+    ):
+        """Test that HTTP 429 backs off for the server's hint without opening the breaker."""
+        fake_matrix_portal.get_io_group = MagicMock(
+            side_effect=AdafruitIORequestError(429, "throttled", retry_after=30)
+        )
+
+        assert await network_manager.get_group_snapshot() is None
+
+        assert request_budget.is_throttled()
+        breaker = network_manager._circuit_breaker(f"groups/{NetworkManager.SCORES_GROUP}")
+        assert breaker.state == STATE_CLOSED
+
+    @pytest.mark.asyncio
+    async def test_breaker_rejection_refunds_budget(self, network_manager, request_budget):
+        """Test that a request skipped by an open breaker costs no tokens."""
+        network_manager._circuit_breaker(f"groups/{NetworkManager.SCORES_GROUP}").record_failure()
+        tokens = request_budget.tokens
+
+        await network_manager.get_group_snapshot()
+
+        assert request_budget.tokens == pytest.approx(tokens, abs=0.1)
+
+
+class TestNetworkManagerPackedState:
+    """Test reading and writing the game state through the packed feed."""
+
+    @pytest.fixture
+    def packed_network_manager(self, fake_matrix_portal, display_manager, request_budget):
+        """Create a NetworkManager with packed state and mirrored legacy feeds."""
+        return NetworkManager(
+            fake_matrix_portal,
+            display_manager,
+            request_budget=request_budget,
+            packed_state=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_snapshot_read_from_packed_feed(
+        self, packed_network_manager, fake_matrix_portal
+    ):
+        """Test that a valid packed state is read with one feed request."""
+        snapshot = GameSnapshot(4, 6, "Owls", "Hawks", GenderManager.GENDER_MMP)
+        fake_matrix_portal.set_feed_value(
+            NetworkManager.GAME_STATE_FEED, encode_game_state(snapshot, 2)
+        )
+        fake_matrix_portal.get_io_group = MagicMock(wraps=fake_matrix_portal.get_io_group)
+
+        result = await packed_network_manager.get_group_snapshot()
+
+        assert (result.left_score, result.right_score) == (4, 6)
+        assert result.left_team_name == "Owls"
+        assert result.first_point_gender == GenderManager.GENDER_MMP
+        assert fake_matrix_portal.get_io_group.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_legacy_feeds(
+        self, packed_network_manager, fake_matrix_portal
+    ):
+        """Test that the per-field feeds are read while there is no valid packed state."""
+        fake_matrix_portal.set_feed_value(NetworkManager.GAME_STATE_FEED, "garbage")
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 3)
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 1)
+
+        result = await packed_network_manager.get_group_snapshot()
+
+        assert (result.left_score, result.right_score) == (3, 1)
+
+    @pytest.mark.asyncio
+    async def test_write_packs_merged_state_and_mirrors(
+        self, packed_network_manager, fake_matrix_portal
+    ):
+        """Test that a write packs the full state and mirrors the changed fields."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 3)
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED, 1)
+        fake_matrix_portal.set_feed_value(NetworkManager.TEAM_LEFT_TEAM_FEED, "Owls")
+        await packed_network_manager.get_group_snapshot()
+
+        await packed_network_manager.set_feed_values(
+            {NetworkManager.SCORES_LEFT_TEAM_FEED: 4}
+        )
+
+        packed = fake_matrix_portal.get_pushed_value(NetworkManager.GAME_STATE_FEED)
+        snapshot, version = decode_game_state(packed)
+        assert (snapshot.left_score, snapshot.right_score) == (4, 1)
+        assert snapshot.left_team_name == "Owls"
+        assert version == 1
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED) == 4
+        assert len(fake_matrix_portal.network.io_client.group_data_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_write_without_mirror_is_one_value(
+        self, fake_matrix_portal, display_manager, request_budget
+    ):
+        """Test that only the packed feed is written when mirroring is off."""
+        network_manager = NetworkManager(
+            fake_matrix_portal,
+            display_manager,
+            request_budget=request_budget,
+            packed_state=True,
+            mirror_legacy_feeds=False,
+        )
+
+        await network_manager.set_feed_values(
+            {
+                NetworkManager.SCORES_LEFT_TEAM_FEED: 1,
+                NetworkManager.FIRST_POINT_GENDER_FEED: GenderManager.GENDER_MMP,
+            }
+        )
+
+        ((_, feeds_and_data),) = fake_matrix_portal.network.io_client.group_data_calls
+        assert [feed["key"] for feed in feeds_and_data] == ["game-state"]
+
+    @pytest.mark.asyncio
+    async def test_outdated_packed_state_ignored(self, packed_network_manager):
+        """Test that a packed state older than one already seen is not applied."""
+        newer = GameSnapshot(5, 5, "Owls", "Hawks", GenderManager.GENDER_WMP)
+        older = GameSnapshot(1, 1, "Owls", "Hawks", GenderManager.GENDER_WMP)
+        packed_network_manager.decode_packed_state(encode_game_state(newer, 9))
+
+        assert packed_network_manager.decode_packed_state(encode_game_state(older, 8)) is None
+
+
+class TestNetworkManagerBatchedWrite:
+    """Test writing several feeds in the scores group with one request."""
+
+    @pytest.mark.asyncio
+    async def test_set_feed_values_sends_one_group_request(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that all values are sent together under the group's short feed keys."""
+        await network_manager.set_feed_values(
+            {
+                NetworkManager.SCORES_LEFT_TEAM_FEED: 3,
+                NetworkManager.FIRST_POINT_GENDER_FEED: GenderManager.GENDER_MMP,
+            }
+        )
+
+        assert fake_matrix_portal.network.io_client.group_data_calls == [
+            (
+                NetworkManager.SCORES_GROUP,
+                [
+                    {"key": "left-team-score-feed", "value": 3},
+                    {"key": "first-point-gender", "value": GenderManager.GENDER_MMP},
+                ],
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def test_set_feed_values_rejects_feed_outside_group(self, network_manager):
+        """Test that feeds outside the scores group are rejected."""
+        with pytest.raises(ValueError, match="not in group"):
+            await network_manager.set_feed_values({"other-group.feed": 1})
+
+    @pytest.mark.asyncio
+    async def test_set_feed_values_rejects_invalid_gender(self, network_manager):
+        """Test that an invalid gender value is rejected before sending."""
+        with pytest.raises(ValueError, match="Invalid gender value"):
+            await network_manager.set_feed_values(
+                {NetworkManager.FIRST_POINT_GENDER_FEED: "invalid"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_set_feed_values_raises_when_circuit_breaker_open(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that a batched write fails loudly instead of being dropped."""
+        network_manager._circuit_breaker(
+            f"groups/{NetworkManager.SCORES_GROUP}/data"
+        ).record_failure()
+
+        with pytest.raises(ConnectionError):
+            await network_manager.set_feed_values(
+                {NetworkManager.SCORES_LEFT_TEAM_FEED: 3}
+            )
+
+        assert fake_matrix_portal.network.io_client.group_data_calls == []
+
+    @pytest.mark.asyncio
+    async def test_set_feed_values_triggers_circuit_breaker(
+        self, network_manager, fake_matrix_portal
+    ):
+        """Test that a network error opens the circuit breaker and is re-raised."""
+        fake_matrix_portal.network.io_client.send_group_data = MagicMock(
+            side_effect=Exception("Network error")
+        )
+
+        with pytest.raises(Exception, match="Network error"):
+            await network_manager.set_feed_values(
+                {NetworkManager.SCORES_LEFT_TEAM_FEED: 3}
+            )
+
+        breaker = network_manager._circuit_breaker(f"groups/{NetworkManager.SCORES_GROUP}/data")
+        assert breaker.state == STATE_OPEN
+
+
+class _FakeAsyncIOClient:
+    """Async Adafruit IO client serving canned last values and feed details."""
+
+    def __init__(self, last_value_error=None):
+        self.last_value_error = last_value_error
+        self.calls = []
+
+    async def get_last_value(self, feed_key):
+        self.calls.append(("last", feed_key))
+        if self.last_value_error is not None:
+            raise self.last_value_error
+        return "7"
+
+    async def get_feed(self, feed_key, detailed=False, fields=None):
+        self.calls.append(("details", feed_key))
+        return {"details": {"data": {"last": {"value": "7"}}}}
+
+
+class TestNetworkManagerLastValue:
+    """Test reading single feeds through the lean last-value endpoint."""
+
+    @pytest.fixture
+    def io_client(self):
+        """Create a fake async Adafruit IO client."""
+        return _FakeAsyncIOClient()
+
+    @pytest.fixture
+    def lean_network_manager(self, fake_matrix_portal, display_manager, io_client, request_budget):
+        """Create a NetworkManager that talks to the fake async client."""
+        return NetworkManager(fake_matrix_portal, display_manager, io_client, request_budget)
+
+    @pytest.mark.asyncio
+    async def test_uses_last_value_endpoint(self, lean_network_manager, io_client):
+        """Test that a feed read asks only for the last value."""
+        value = await lean_network_manager._get_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED)
+
+        assert value == "7"
+        assert io_client.calls == [("last", NetworkManager.SCORES_LEFT_TEAM_FEED)]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_details_when_refused(self, lean_network_manager, io_client):
+        """Test that a client error on the lean endpoint falls back to the detailed read."""
+        io_client.last_value_error = AdafruitIORequestError(400, "bad request")
+
+        value = await lean_network_manager._get_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED)
+
+        assert value == "7"
+        assert [kind for kind, _ in io_client.calls] == ["last", "details"]
+
+    @pytest.mark.asyncio
+    async def test_server_error_not_retried_with_details(self, lean_network_manager, io_client):
+        """Test that a server error counts as a failure instead of doubling the load."""
+        io_client.last_value_error = AdafruitIORequestError(503, "unavailable")
+
+        value = await lean_network_manager._get_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED)
+
+        assert value is None
+        assert [kind for kind, _ in io_client.calls] == ["last"]
+        breaker = lean_network_manager._circuit_breaker(
+            f"feeds/{NetworkManager.SCORES_LEFT_TEAM_FEED}"
+        )
+        assert breaker.consecutive_failures == 1
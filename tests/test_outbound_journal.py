@@ -0,0 +1,163 @@
+"""Tests for OutboundJournal."""
+
+import pytest
+
+from src.gender_manager import GenderManager
+from src.network_manager import NetworkManager
+from src.outbound_journal import RECORD_SIZE, OutboundJournal
+
+LEFT = NetworkManager.SCORES_LEFT_TEAM_FEED
+RIGHT = NetworkManager.SCORES_RIGHT_TEAM_FEED
+GENDER = NetworkManager.FIRST_POINT_GENDER_FEED
+
+
+class FakeNvm(bytearray):
+    """Non-volatile memory that counts the writes made to it."""
+
+    def __init__(self, size: int):
+        super().__init__(b"\xff" * size)
+        self.writes = 0
+
+    def __setitem__(self, index, value):
+        self.writes += 1
+        super().__setitem__(index, value)
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def nvm():
+    """Create erased non-volatile memory with room for 8 records."""
+    return FakeNvm(8 + 8 * RECORD_SIZE)
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def journal(nvm, clock):
+    """Create a journal on the fake memory."""
+    return OutboundJournal(nvm, clock=clock)
+
+
+class TestOutboundJournal:
+    """Test recording, persisting and compacting unsynced values."""
+
+    def test_replays_flushed_values_after_reset(self, journal, nvm, clock):
+        """Test that a new journal on the same memory restores the latest values."""
+        journal.append({LEFT: 1})
+        journal.append({LEFT: 2, GENDER: GenderManager.GENDER_MMP})
+        journal.flush()
+
+        restored = OutboundJournal(nvm, clock=clock)
+
+        assert restored.pending_values() == {LEFT: 2, GENDER: GenderManager.GENDER_MMP}
+
+    def test_append_does_not_write_flash(self, journal, nvm):
+        """Test that recording a change only touches RAM."""
+        writes = nvm.writes
+
+        for score in range(1, 20):
+            journal.append({LEFT: score})
+
+        assert nvm.writes == writes
+
+    def test_flush_batches_and_is_rate_limited(self, journal, nvm, clock):
+        """Test that one flush writes every change once, and flushes are spaced out."""
+        writes = nvm.writes
+        journal.append({LEFT: 1})
+        journal.append({RIGHT: 1})
+        assert journal.flush()
+        journal.append({LEFT: 2})
+
+        assert not journal.flush()
+        assert nvm.writes == writes + 1
+
+        clock.advance(5.0)
+
+        assert journal.flush()
+        assert nvm.writes == writes + 2
+
+    def test_rate_limited_flush_deferred(self, journal, nvm, clock):
+        """Test that a flush asked for too soon is done once the interval has passed."""
+        journal.append({LEFT: 1})
+        assert journal.flush()
+        writes = nvm.writes
+        assert journal.flush_deferred()
+
+        journal.append({LEFT: 2})
+        assert not journal.flush()
+        assert not journal.flush_deferred()
+        clock.advance(5.0)
+
+        assert journal.flush_deferred()
+        assert nvm.writes == writes + 1
+        assert journal.flush_deferred()
+        assert nvm.writes == writes + 1
+
+    def test_synced_before_flush_never_written(self, journal, nvm):
+        """Test that a change synced right away costs no flash write."""
+        writes = nvm.writes
+        journal.append({LEFT: 1})
+
+        journal.mark_synced({LEFT: 1})
+
+        assert nvm.writes == writes
+        assert journal.pending_values() == {}
+
+    def test_sync_compacts_flushed_values(self, journal, nvm, clock):
+        """Test that syncing values on flash starts a generation without them."""
+        journal.append({LEFT: 1, RIGHT: 3})
+        journal.flush()
+
+        journal.mark_synced({LEFT: 1})
+
+        assert OutboundJournal(nvm, clock=clock).pending_values() == {RIGHT: 3}
+        assert journal.get_stats()["compactions"] == 1
+
+    def test_value_changed_since_push_stays(self, journal):
+        """Test that a change made while its push was in flight stays pending."""
+        journal.append({LEFT: 1})
+        journal.append({LEFT: 2})
+
+        journal.mark_synced({LEFT: 1})
+
+        assert journal.pending_values() == {LEFT: 2}
+
+    def test_full_journal_compacts_on_flush(self, journal, nvm, clock):
+        """Test that running out of record slots compacts to the latest values."""
+        for score in range(1, 12):
+            journal.append({LEFT: score})
+            journal.flush(force=True)
+
+        assert OutboundJournal(nvm, clock=clock).pending_values() == {LEFT: 11}
+        assert journal.get_stats()["records"] <= journal.capacity
+
+    def test_torn_record_ignored(self, journal, nvm, clock):
+        """Test that a record corrupted by a reset mid-write is not replayed."""
+        journal.append({LEFT: 1})
+        journal.flush()
+        journal.append({LEFT: 2})
+        journal.flush(force=True)
+        nvm[8 + RECORD_SIZE + 4] ^= 0xFF
+
+        assert OutboundJournal(nvm, clock=clock).pending_values() == {LEFT: 1}
+
+    def test_unknown_feed_rejected(self, journal):
+        """Test that values the journal has no record format for are rejected."""
+        with pytest.raises(ValueError):
+            journal.append({NetworkManager.TEAM_LEFT_TEAM_FEED: "Red"})
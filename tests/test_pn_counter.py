@@ -0,0 +1,101 @@
+"""Tests for the PN-counter score encoding and merge."""
+
+import pytest
+
+from src.pn_counter import PNCounter, PNCounterDecodeError, validate_replica_id
+
+
+class TestPNCounter:
+    """Test counting, merging and encoding per-replica totals."""
+
+    def test_value_is_increments_minus_decrements(self):
+        """Test that the score adds up every replica's totals."""
+        counter = PNCounter()
+        counter.increment("a", 3)
+        counter.increment("b")
+        counter.decrement("a")
+
+        assert counter.value() == 3
+
+    def test_concurrent_increments_both_count(self):
+        """Test that increments made on two replicas at once both survive a merge."""
+        base = PNCounter({"a": 4})
+        board_a = base.copy()
+        board_b = base.copy()
+        board_a.increment("a")
+        board_b.increment("b")
+
+        board_a.merge(board_b)
+        board_b.merge(board_a)
+
+        assert board_a.value() == board_b.value() == 6
+
+    def test_merge_commutes_and_repeats(self):
+        """Test that merge order and repeated merges don't change the result."""
+        first = PNCounter({"a": 2, "b": 1}, {"a": 1})
+        second = PNCounter({"b": 3}, {"c": 2})
+        left = first.copy()
+        left.merge(second)
+        right = second.copy()
+        right.merge(first)
+
+        assert left.encode() == right.encode()
+        assert not left.merge(second)
+
+    def test_later_epoch_replaces_counter(self):
+        """Test that a reset wins over changes made before it, in either merge order."""
+        before = PNCounter({"a": 4, "b": 2})
+        reset = before.copy()
+        reset.reset(1)
+        before.increment("a")
+
+        assert before.merge(reset)
+        assert not reset.merge(before)
+        assert before.encode() == reset.encode() == "PN1@1;legacy:1:0"
+        assert before.value() == 1
+
+    def test_changes_after_reset_merge(self):
+        """Test that counters of the same epoch merge as usual after a reset."""
+        board_a = PNCounter(epoch=2)
+        board_b = board_a.copy()
+        board_a.increment("a")
+        board_b.increment("b")
+
+        board_a.merge(board_b)
+
+        assert board_a.value() == 2
+        assert board_a.epoch == 2
+
+    def test_encode_round_trip(self):
+        """Test that a decoded counter encodes to the same value."""
+        counter = PNCounter({"b": 2, "a": 5}, {"b": 1})
+
+        encoded = counter.encode()
+
+        assert encoded == "PN1;a:5:0,b:2:1"
+        assert PNCounter.decode(encoded).encode() == encoded
+
+    def test_empty_counter_round_trip(self):
+        """Test that an empty counter decodes to a score of 0."""
+        assert PNCounter.decode(PNCounter().encode()).value() == 0
+
+    def test_epoch_round_trip(self):
+        """Test that a counter's epoch survives encoding."""
+        counter = PNCounter({"a": 1}, epoch=3)
+
+        assert PNCounter.decode(counter.encode()).epoch == 3
+
+    @pytest.mark.parametrize(
+        "text",
+        ["GS1;a:1:0", "PN1;a:1", "PN1;a:x:0", "PN1;a:-1:0", "PN1@x;a:1:0", "PN1@-1;a:1:0"],
+    )
+    def test_invalid_values_rejected(self, text):
+        """Test that values that aren't counters raise PNCounterDecodeError."""
+        with pytest.raises(PNCounterDecodeError):
+            PNCounter.decode(text)
+
+    @pytest.mark.parametrize("replica_id", ["", "a:b", "a,b", "a;b"])
+    def test_unencodable_replica_ids_rejected(self, replica_id):
+        """Test that replica ids containing a separator are rejected."""
+        with pytest.raises(ValueError):
+            validate_replica_id(replica_id)
@@ -0,0 +1,162 @@
+"""Tests for PollScheduler."""
+
+import time
+
+import pytest
+
+from src.poll_scheduler import (
+    REASON_IDLE,
+    REASON_LOCAL_ACTIVITY,
+    REASON_RATE_LIMIT,
+    REASON_REMOTE_ACTIVITY,
+    REASON_STARTUP,
+    REASON_SUBSCRIBED,
+    PollScheduler,
+)
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for PollScheduler."""
+    return FakeClock()
+
+
+@pytest.fixture
+def scheduler(clock):
+    """Create a PollScheduler with a 2 s floor and a 60 s ceiling."""
+    return PollScheduler(min_interval=2.0, max_interval=60.0, backoff_factor=2.0, clock=clock)
+
+
+class TestPollSchedulerInterval:
+    """Test how activity moves the poll interval."""
+
+    def test_starts_at_floor(self, scheduler):
+        """Test that the first interval is the floor."""
+        assert scheduler.interval == 2.0
+        assert scheduler.reason == REASON_STARTUP
+
+    def test_idle_polls_back_off_to_ceiling(self, scheduler):
+        """Test that idle polls grow the interval without passing the ceiling."""
+        intervals = []
+        for _ in range(7):
+            scheduler.record_idle()
+            intervals.append(scheduler.interval)
+
+        assert intervals == [4.0, 8.0, 16.0, 32.0, 60.0, 60.0, 60.0]
+        assert scheduler.reason == REASON_IDLE
+
+    def test_local_activity_snaps_to_floor(self, scheduler):
+        """Test that a local change brings the interval back to the floor."""
+        for _ in range(5):
+            scheduler.record_idle()
+
+        scheduler.record_local_activity()
+
+        assert scheduler.interval == 2.0
+        assert scheduler.reason == REASON_LOCAL_ACTIVITY
+
+    def test_remote_activity_snaps_to_floor(self, scheduler):
+        """Test that a change from the network brings the interval back to the floor."""
+        for _ in range(5):
+            scheduler.record_idle()
+
+        scheduler.record_remote_activity()
+
+        assert scheduler.interval == 2.0
+        assert scheduler.reason == REASON_REMOTE_ACTIVITY
+
+    def test_subscribed_polls_at_ceiling(self, scheduler):
+        """Test that a live push subscription moves polling to the ceiling."""
+        scheduler.record_subscribed()
+
+        assert scheduler.interval == 60.0
+        assert scheduler.reason == REASON_SUBSCRIBED
+
+    def test_rate_floor_raises_floor(self, scheduler):
+        """Test that activity can't push polling faster than the budget allows."""
+        scheduler.set_rate_floor(5.0)
+
+        assert scheduler.interval == 5.0
+        assert scheduler.reason == REASON_RATE_LIMIT
+        scheduler.record_remote_activity()
+        assert scheduler.interval == 5.0
+
+        scheduler.set_rate_floor(0.0)
+        scheduler.record_remote_activity()
+        assert scheduler.interval == 2.0
+
+    def test_floor_above_ceiling_rejected(self):
+        """Test that an inverted floor and ceiling is rejected."""
+        with pytest.raises(ValueError):
+            PollScheduler(min_interval=10.0, max_interval=5.0)
+
+
+class TestPollSchedulerTiming:
+    """Test when polls are due."""
+
+    def test_first_poll_due_immediately(self, scheduler):
+        """Test that a poll is due before any poll has been made."""
+        assert scheduler.is_poll_due()
+
+    def test_poll_due_after_interval(self, scheduler, clock):
+        """Test that the next poll is due once the interval has elapsed."""
+        scheduler.record_poll()
+        clock.advance(1.5)
+        assert not scheduler.is_poll_due()
+        assert scheduler.time_until_poll() == pytest.approx(0.5)
+
+        clock.advance(0.5)
+        assert scheduler.is_poll_due()
+
+    def test_activity_brings_next_poll_forward(self, scheduler, clock):
+        """Test that activity during a long idle wait shortens it."""
+        for _ in range(5):
+            scheduler.record_idle()
+        scheduler.record_poll()
+        clock.advance(3.0)
+        assert not scheduler.is_poll_due()
+
+        scheduler.record_remote_activity()
+
+        assert scheduler.is_poll_due()
+
+
+class TestPollSchedulerWait:
+    """Test waiting for the next poll."""
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_when_poll_due(self):
+        """Test that wait() sleeps until the interval has elapsed."""
+        scheduler = PollScheduler(min_interval=0.05, max_interval=1.0)
+        scheduler.record_poll()
+
+        start = time.monotonic()
+        await scheduler.wait()
+
+        assert time.monotonic() - start >= 0.04
+        assert scheduler.is_poll_due()
+
+    @pytest.mark.asyncio
+    async def test_wake_condition_ends_wait_early(self):
+        """Test that wait() returns promptly once the wake condition holds."""
+        scheduler = PollScheduler(min_interval=30.0, max_interval=60.0)
+        scheduler.record_poll()
+
+        start = time.monotonic()
+        await scheduler.wait(wake_condition=lambda: True)
+
+        assert time.monotonic() - start < 0.05
+        assert not scheduler.is_poll_due()
@@ -0,0 +1,109 @@
+"""Tests for RequestBudget."""
+
+import pytest
+
+from src.request_budget import PRIORITY_POLL, PRIORITY_PUSH, RequestBudget
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for RequestBudget."""
+    return FakeClock()
+
+
+@pytest.fixture
+def budget(clock):
+    """Create a budget of 60 requests per minute: one per second, bursts of 10."""
+    return RequestBudget(rate_per_minute=60, push_reserve=0.5, clock=clock)
+
+
+class TestRequestBudget:
+    """Test spending, refilling and reserving tokens."""
+
+    def test_polls_stop_at_push_reserve(self, budget):
+        """Test that polls can't use the tokens reserved for pushes."""
+        granted = [budget.try_acquire(PRIORITY_POLL) for _ in range(10)]
+
+        assert granted == [True] * 5 + [False] * 5
+        assert budget.try_acquire(PRIORITY_PUSH)
+
+    def test_pushes_use_whole_bucket(self, budget):
+        """Test that pushes may spend every token."""
+        assert budget.try_acquire(PRIORITY_PUSH, cost=10)
+        assert not budget.try_acquire(PRIORITY_PUSH)
+
+    def test_tokens_refill_over_time(self, budget, clock):
+        """Test that spent tokens come back at the configured rate."""
+        budget.try_acquire(PRIORITY_PUSH, cost=10)
+        clock.advance(3.0)
+
+        assert budget.tokens == pytest.approx(3.0)
+
+    def test_rate_shared_between_boards(self, clock):
+        """Test that each board sharing a key gets an equal share of the rate."""
+        budget = RequestBudget(rate_per_minute=60, boards_sharing=3, clock=clock)
+        budget.try_acquire(PRIORITY_PUSH, cost=budget.capacity)
+        clock.advance(3.0)
+
+        assert budget.tokens == pytest.approx(1.0)
+
+    def test_refund_returns_tokens(self, budget):
+        """Test that a request that wasn't sent gives its tokens back."""
+        budget.try_acquire(PRIORITY_PUSH, cost=4)
+
+        budget.refund(4)
+
+        assert budget.tokens == pytest.approx(10.0)
+
+
+class TestRequestBudgetThrottling:
+    """Test backing off after HTTP 429."""
+
+    def test_throttle_blocks_until_retry_after(self, budget, clock):
+        """Test that no request is allowed until the server's hint has passed."""
+        budget.record_throttled(retry_after=20)
+
+        assert not budget.try_acquire(PRIORITY_PUSH)
+        clock.advance(20)
+        assert budget.try_acquire(PRIORITY_PUSH)
+
+    def test_throttle_without_hint_uses_default(self, budget, clock):
+        """Test that a 429 without Retry-After still backs off."""
+        budget.record_throttled()
+
+        clock.advance(30)
+
+        assert budget.is_throttled()
+
+
+class TestRequestBudgetPollInterval:
+    """Test the poll interval recommended to the sync loop."""
+
+    def test_interval_fits_unreserved_rate(self, budget):
+        """Test that polls are paced to the share of the rate not reserved."""
+        assert budget.recommended_poll_interval() == pytest.approx(2.0)
+
+    def test_interval_doubles_when_bucket_low(self, budget):
+        """Test that polling slows down before the bucket runs out."""
+        budget.try_acquire(PRIORITY_PUSH, cost=6)
+
+        assert budget.recommended_poll_interval() == pytest.approx(4.0)
+
+    def test_interval_covers_throttle(self, budget):
+        """Test that no poll is recommended before the throttle backoff ends."""
+        budget.record_throttled(retry_after=45)
+
+        assert budget.recommended_poll_interval() == pytest.approx(45.0)
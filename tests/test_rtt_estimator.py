@@ -0,0 +1,186 @@
+"""Tests for RttEstimator and the adaptive timeouts of the network patches."""
+
+import pytest
+
+from src.network_patches import apply_network_patches
+from src.rtt_estimator import DEFAULT_INITIAL_TIMEOUT, RttEstimator, host_of
+
+HOST = "io.adafruit.com"
+
+
+@pytest.fixture
+def log():
+    """Collect the estimator's log messages."""
+    return []
+
+
+@pytest.fixture
+def estimator(log):
+    """Create an RttEstimator with bounds of 0.5 s and 10 s."""
+    return RttEstimator(min_timeout=0.5, max_timeout=10.0, log=log.append)
+
+
+class TestHostOf:
+    """Test extracting the host from a URL."""
+
+    def test_host_with_path(self):
+        """Test that the scheme and path are dropped."""
+        assert host_of("https://io.adafruit.com/api/v2/user/feeds") == HOST
+
+    def test_host_with_port(self):
+        """Test that an explicit port is kept."""
+        assert host_of("http://127.0.0.1:8080/feeds") == "127.0.0.1:8080"
+
+
+class TestRttEstimator:
+    """Test the per-host round-trip time estimate and the timeouts derived from it."""
+
+    def test_unknown_host_gets_initial_timeout(self, estimator):
+        """Test that a host without samples gets the initial timeout."""
+        assert estimator.timeout(HOST) == DEFAULT_INITIAL_TIMEOUT
+
+    def test_first_sample_sets_timeout(self, estimator):
+        """Test that the first sample gives a timeout of three times the RTT."""
+        estimator.record_sample(HOST, 0.4)
+
+        # srtt 0.4 plus 4 * rttvar 0.2
+        assert estimator.timeout(HOST) == pytest.approx(1.2)
+
+    def test_steady_samples_converge_on_rtt(self, estimator):
+        """Test that a steady RTT shrinks the timeout toward the lower bound."""
+        for _ in range(50):
+            estimator.record_sample(HOST, 0.2)
+
+        assert estimator.get_stats()[HOST]["srtt"] == pytest.approx(0.2)
+        assert estimator.timeout(HOST) == pytest.approx(0.5)
+
+    def test_jittery_samples_widen_timeout(self, estimator):
+        """Test that a varying RTT gives a longer timeout than a steady one."""
+        steady = RttEstimator(log=lambda message: None)
+        for rtt in (0.3, 1.5) * 10:
+            estimator.record_sample(HOST, rtt)
+            steady.record_sample(HOST, 0.9)
+
+        assert estimator.timeout(HOST) > steady.timeout(HOST)
+
+    def test_timeout_clamped_to_upper_bound(self, estimator):
+        """Test that a very slow host is still timed out at the upper bound."""
+        estimator.record_sample(HOST, 8.0)
+
+        assert estimator.timeout(HOST) == 10.0
+
+    def test_timeout_doubles_until_sample(self, estimator):
+        """Test that each timeout doubles the next one and a success undoes it."""
+        estimator.record_sample(HOST, 0.4)
+        estimator.record_timeout(HOST)
+        estimator.record_timeout(HOST)
+
+        assert estimator.timeout(HOST) == pytest.approx(4.8)
+
+        estimator.record_sample(HOST, 0.4)
+
+        assert estimator.timeout(HOST) < 1.2
+
+    def test_hosts_estimated_separately(self, estimator):
+        """Test that one host's samples don't change another's timeout."""
+        estimator.record_sample(HOST, 0.2)
+
+        assert estimator.timeout("example.com") == DEFAULT_INITIAL_TIMEOUT
+
+    def test_logs_timeouts_and_large_changes_only(self, estimator, log):
+        """Test that timeouts and noticeable changes are logged, small changes not."""
+        estimator.record_sample(HOST, 0.4)
+        estimator.record_sample(HOST, 0.4)
+        estimator.record_timeout(HOST)
+
+        assert len(log) == 2
+        assert "now 1.20s" in log[0]
+        assert "timed out after" in log[1]
+
+    def test_stats_count_samples_and_timeouts(self, estimator):
+        """Test that the stats report each host's counts."""
+        estimator.record_sample(HOST, 0.4)
+        estimator.record_timeout(HOST)
+
+        stats = estimator.get_stats()[HOST]
+        assert (stats["samples"], stats["timeouts"]) == (1, 1)
+
+    def test_inverted_bounds_rejected(self):
+        """Test that a lower bound above the upper bound is rejected."""
+        with pytest.raises(ValueError):
+            RttEstimator(min_timeout=5.0, max_timeout=1.0)
+
+
+class FakeWifi:
+    """Wi-Fi wrapper without a requests session, as before the first connect."""
+
+    requests = None
+
+
+class FakeNetwork:
+    """MatrixPortal network whose fetch records the timeouts it is given."""
+
+    def __init__(self):
+        self._wifi = FakeWifi()
+        self.timeouts = []
+        self.timed_out = False
+
+    def fetch(self, url, timeout=10):
+        self.timeouts.append(timeout)
+        if self.timed_out:
+            raise OSError(110, "ETIMEDOUT")
+        return url
+
+    def connect(self, max_attempts=10):
+        return max_attempts
+
+
+class FakePortal:
+    """MatrixPortal with only the network the patches touch."""
+
+    def __init__(self):
+        self.network = FakeNetwork()
+
+
+class TestAdaptiveNetworkPatches:
+    """Test that the patched blocking fetch times out adaptively."""
+
+    def test_fetch_uses_host_timeout(self, estimator):
+        """Test that fetch gets the host's adaptive timeout and records a sample."""
+        portal = FakePortal()
+        network = portal.network
+        apply_network_patches(portal, estimator)
+
+        portal.network.fetch(f"https://{HOST}/api/v2/user/feeds")
+
+        assert network.timeouts == [DEFAULT_INITIAL_TIMEOUT]
+        assert estimator.get_stats()[HOST]["samples"] == 1
+
+    def test_library_timeout_overridden(self, estimator):
+        """Test that a caller's timeout, like PortalBase's 10 s, is replaced."""
+        portal = FakePortal()
+        network = portal.network
+        apply_network_patches(portal, estimator)
+
+        portal.network.fetch(f"https://{HOST}/feeds", timeout=10)
+
+        assert network.timeouts == [DEFAULT_INITIAL_TIMEOUT]
+        assert estimator.get_stats()[HOST]["samples"] == 1
+
+    def test_fetch_timeout_backs_off(self, estimator):
+        """Test that a timed-out fetch doubles the host's timeout."""
+        portal = FakePortal()
+        portal.network.timed_out = True
+        apply_network_patches(portal, estimator)
+
+        with pytest.raises(OSError):
+            portal.network.fetch(f"https://{HOST}/feeds")
+
+        assert estimator.timeout(HOST) == DEFAULT_INITIAL_TIMEOUT * 2
+
+    def test_connect_not_retried(self, estimator):
+        """Test that connect still makes a single attempt."""
+        portal = FakePortal()
+        apply_network_patches(portal, estimator)
+
+        assert portal.network.connect() == 1
@@ -4,7 +4,11 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.game_snapshot import GameSnapshot
 from src.network_manager import NetworkManager
+from src.outbound_journal import OutboundJournal
+from src.score_manager import ScoreManager
+from src.sync_manager import SYNC_RETRY_BASE_DELAY
 
 
 class TestScoreManager:
@@ -157,7 +161,7 @@ class TestScoreManagerPendingSync:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             success = await score_manager.try_sync_scores()
@@ -178,7 +182,7 @@ class TestScoreManagerPendingSync:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             changed = await score_manager.update_scores_from_network()
@@ -202,7 +206,7 @@ class TestScoreManagerPendingSync:
 
     @pytest.mark.asyncio
     async def test_concurrent_local_and_network_updates(
-        self, score_manager, fake_matrix_portal, network_manager
+        self, score_manager, fake_matrix_portal, network_manager, sync_clock
     ):
         """Test behavior when local changes are made while network has different values."""
         fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 5)
@@ -215,13 +219,15 @@ class TestScoreManagerPendingSync:
 
         with patch.object(
             network_manager,
-            "set_left_team_score",
+            "set_feed_values",
             side_effect=Exception("Network error"),
         ):
             changed = await score_manager.update_scores_from_network()
             assert not changed
             assert score_manager.left_score == 2
 
+        # Wait out the retry backoff
+        sync_clock.return_value += SYNC_RETRY_BASE_DELAY
         success = await score_manager.try_sync_scores()
         assert success
         assert not score_manager.has_pending_changes()
@@ -231,11 +237,255 @@ class TestScoreManagerPendingSync:
         """Test that try_sync_scores only syncs scores that have changed."""
         score_manager.increment_left_score()
 
-        with (
-            patch.object(network_manager, "set_left_team_score") as mock_left,
-            patch.object(network_manager, "set_right_team_score") as mock_right,
-        ):
+        with patch.object(network_manager, "set_feed_values") as mock_set:
             await score_manager.try_sync_scores()
 
-            mock_left.assert_called_once_with(1)
-            mock_right.assert_not_called()
+            mock_set.assert_called_once_with({NetworkManager.SCORES_LEFT_TEAM_FEED: 1})
+
+    @pytest.mark.asyncio
+    async def test_both_scores_pushed_in_one_request(
+        self, score_manager, fake_matrix_portal
+    ):
+        """Test that both dirty scores are sent in a single group write."""
+        score_manager.increment_left_score()
+        score_manager.increment_right_score()
+
+        await score_manager.try_sync_scores()
+
+        io_client = fake_matrix_portal.network.io_client
+        assert len(io_client.group_data_calls) == 1
+        group_key, feeds_and_data = io_client.group_data_calls[0]
+        assert group_key == NetworkManager.SCORES_GROUP
+        assert {feed["key"]: feed["value"] for feed in feeds_and_data} == {
+            "left-team-score-feed": 1,
+            "right-team-score-feed": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_change_during_push_stays_pending(
+        self, score_manager, network_manager
+    ):
+        """Test that a press landing while a push is in flight is not lost."""
+        original_set_feed_values = network_manager.set_feed_values
+
+        async def press_during_push(values):
+            score_manager.increment_left_score()
+            await original_set_feed_values(values)
+
+        score_manager.increment_left_score()
+        with patch.object(network_manager, "set_feed_values", press_during_push):
+            success = await score_manager.try_sync_scores()
+
+        assert success
+        assert score_manager.left_score == 2
+        assert score_manager.has_pending_changes()
+
+class TestScoreManagerSnapshot:
+    """Test ScoreManager updates from an already-fetched group snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_update_scores_from_snapshot(self, score_manager, network_manager):
+        """Test that a passed-in snapshot is applied without another fetch."""
+        snapshot = GameSnapshot(6, 4, "AWAY", "HOME", "WMP")
+
+        with patch.object(network_manager, "get_group_snapshot") as mock_fetch:
+            changed = await score_manager.update_scores_from_network(snapshot)
+
+        mock_fetch.assert_not_called()
+        assert changed
+        assert score_manager.left_score == 6
+        assert score_manager.right_score == 4
+
+    @pytest.mark.asyncio
+    async def test_snapshot_discarded_after_syncing_pending_changes(
+        self, score_manager
+    ):
+        """Test that a snapshot fetched before a pending sync does not overwrite it."""
+        score_manager.increment_left_score()
+        snapshot = GameSnapshot(0, 0, "AWAY", "HOME", "WMP")
+
+        changed = await score_manager.update_scores_from_network(snapshot)
+
+        assert not changed
+        assert score_manager.left_score == 1
+        assert not score_manager.has_pending_changes()
+
+
+class TestScoreManagerCounters:
+    """Test counting scores per board with PN-counters."""
+
+    LEFT_COUNTER = NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED
+
+    @pytest.fixture
+    def make_board(self, fake_matrix_portal, display_manager, request_budget):
+        """Create a counting ScoreManager on its own NetworkManager, sharing the feeds."""
+
+        def make(replica_id, journal=None):
+            network_manager = NetworkManager(
+                fake_matrix_portal, display_manager, request_budget=request_budget
+            )
+            return ScoreManager(network_manager, journal, replica_id=replica_id)
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_concurrent_increments_both_count(self, make_board, fake_matrix_portal):
+        """Test that two boards scoring at once both keep their point after one exchange."""
+        board_a = make_board("a")
+        board_b = make_board("b")
+        await board_a.update_scores_from_network()
+        await board_b.update_scores_from_network()
+
+        board_a.increment_left_score()
+        board_b.increment_left_score()
+        assert await board_a.try_sync_scores()
+        assert await board_b.try_sync_scores()
+
+        # Board b's write replaced a's counter, so a pushes the merged counter
+        assert await board_a.update_scores_from_network()
+        assert await board_a.try_sync_scores()
+        await board_b.update_scores_from_network()
+
+        assert board_a.left_score == board_b.left_score == 2
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED) == 2
+        assert fake_matrix_portal.get_pushed_value(self.LEFT_COUNTER) == "PN1;a:1:0,b:1:0"
+
+    @pytest.mark.asyncio
+    async def test_merges_while_changes_pending(self, make_board, fake_matrix_portal):
+        """Test that network counters are merged even with local changes pending."""
+        board = make_board("a")
+        await board.update_scores_from_network()
+        board.increment_left_score()
+        fake_matrix_portal.set_feed_value(self.LEFT_COUNTER, "PN1;b:3:0")
+
+        assert await board.update_scores_from_network()
+
+        assert board.left_score == 4
+        assert board.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_no_push_before_network_merged(self, make_board, fake_matrix_portal):
+        """Test that counters aren't pushed until the network's have been merged."""
+        board = make_board("a")
+        board.increment_left_score()
+
+        assert not await board.try_sync_scores()
+        assert fake_matrix_portal.network.io_client.group_data_calls == []
+
+    @pytest.mark.asyncio
+    async def test_plain_score_kept_as_legacy_count(self, make_board, fake_matrix_portal):
+        """Test that a score written before counting carries over into the counter."""
+        fake_matrix_portal.set_feed_value(NetworkManager.SCORES_LEFT_TEAM_FEED, 5)
+        board = make_board("a")
+        await board.update_scores_from_network()
+
+        board.increment_left_score()
+        assert await board.try_sync_scores()
+
+        assert board.left_score == 6
+        assert fake_matrix_portal.get_pushed_value(self.LEFT_COUNTER) == "PN1;a:1:0,legacy:5:0"
+
+    @pytest.mark.asyncio
+    async def test_pushed_counter_merged(self, make_board):
+        """Test that a counter pushed over MQTT or LAN is merged, a plain score ignored."""
+        board = make_board("a")
+
+        assert board.apply_feed_update(self.LEFT_COUNTER, "PN1;b:2:0")
+        assert not board.apply_feed_update(NetworkManager.SCORES_LEFT_TEAM_FEED, "9")
+        assert board.left_score == 2
+
+    @pytest.mark.asyncio
+    async def test_own_count_restored_after_reset(self, make_board):
+        """Test that this board's unsynced count survives a reset and the rest is merged."""
+        nvm = bytearray(64)
+        board = make_board("a", OutboundJournal(nvm))
+        await board.update_scores_from_network()
+        board.increment_left_score()
+        board.increment_left_score()
+        with patch.object(
+            board._network_manager, "set_feed_values", side_effect=Exception("Offline")
+        ):
+            assert not await board.try_sync_scores()
+
+        rebooted = make_board("a", OutboundJournal(nvm))
+
+        assert rebooted.restore_from_journal()
+        assert rebooted.left_score == 2
+        assert rebooted.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_offline_boot_count_restored_after_reset(self, make_board):
+        """Test that presses on a board that never reached the network survive a reset."""
+        nvm = bytearray(64)
+        board = make_board("a", OutboundJournal(nvm, min_flush_interval=0.0))
+        board.increment_left_score()
+        board.increment_left_score()
+
+        rebooted = make_board("a", OutboundJournal(nvm))
+
+        assert rebooted.restore_from_journal()
+        assert rebooted.left_score == 2
+
+    @pytest.mark.asyncio
+    async def test_dashboard_reset_wins(self, make_board, fake_matrix_portal):
+        """Test that a score written over the counter feed resets every board's count."""
+        board_a = make_board("a")
+        board_b = make_board("b")
+        await board_a.update_scores_from_network()
+        await board_b.update_scores_from_network()
+        board_a.increment_left_score()
+        assert await board_a.try_sync_scores()
+        await board_b.update_scores_from_network()
+        fake_matrix_portal.set_feed_value(self.LEFT_COUNTER, "0")
+
+        assert await board_a.update_scores_from_network()
+        assert await board_a.try_sync_scores()
+        # Board b pushes a press counted before it saw the reset
+        board_b.increment_left_score()
+        assert await board_b.try_sync_scores()
+        await board_a.update_scores_from_network()
+        assert await board_a.try_sync_scores()
+        assert await board_b.update_scores_from_network()
+
+        assert board_a.left_score == board_b.left_score == 0
+        assert fake_matrix_portal.get_pushed_value(self.LEFT_COUNTER) == "PN1@1;"
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED) == 0
+
+    @pytest.mark.asyncio
+    async def test_reset_read_twice_resets_once(self, make_board, fake_matrix_portal):
+        """Test that reading the same reset again before pushing it doesn't reset again."""
+        board = make_board("a")
+        fake_matrix_portal.set_feed_value(self.LEFT_COUNTER, "3")
+        await board.update_scores_from_network()
+        board.increment_left_score()
+
+        await board.update_scores_from_network()
+        assert await board.try_sync_scores()
+
+        assert board.left_score == 4
+        assert fake_matrix_portal.get_pushed_value(self.LEFT_COUNTER) == "PN1@1;a:1:0,legacy:3:0"
+
+    @pytest.mark.asyncio
+    async def test_count_after_reset_restored_in_its_epoch(self, make_board, fake_matrix_portal):
+        """Test that a count journaled after a reset is restored into the reset counter."""
+        fake_matrix_portal.set_feed_value(self.LEFT_COUNTER, "PN1@2;b:1:0")
+        nvm = bytearray(64)
+        board = make_board("a", OutboundJournal(nvm, min_flush_interval=0.0))
+        await board.update_scores_from_network()
+        with patch.object(
+            board._network_manager, "set_feed_values", side_effect=Exception("Offline")
+        ):
+            board.increment_left_score()
+            assert not await board.try_sync_scores()
+
+        rebooted = make_board("a", OutboundJournal(nvm))
+        rebooted.restore_from_journal()
+        await rebooted.update_scores_from_network()
+
+        assert rebooted.left_score == 2
+        assert rebooted.has_pending_changes()
+
+    def test_invalid_replica_id_rejected(self, network_manager):
+        """Test that a replica id that can't be encoded is rejected."""
+        with pytest.raises(ValueError):
+            ScoreManager(network_manager, replica_id="a:b")
@@ -0,0 +1,98 @@
+"""Tests for SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from src.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test sharing of concurrent calls with the same key."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that concurrent callers for one key get the first call's result."""
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append("fetch")
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        results = await asyncio.gather(
+            *(single_flight.do("feed", fetch) for _ in range(3))
+        )
+
+        assert results == [1, 1, 1]
+        assert calls == ["fetch"]
+        assert single_flight.coalesced == 2
+        assert not single_flight.is_in_flight("feed")
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_shared(self):
+        """Test that calls for different keys run separately."""
+        single_flight = SingleFlight()
+
+        async def fetch(key):
+            await asyncio.sleep(0)
+            return key
+
+        results = await asyncio.gather(
+            single_flight.do("a", lambda: fetch("a")),
+            single_flight.do("b", lambda: fetch("b")),
+        )
+
+        assert results == ["a", "b"]
+        assert single_flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_error_shared_with_waiters(self):
+        """Test that every caller sharing a call sees its error."""
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise OSError("Network error")
+
+        results = await asyncio.gather(
+            single_flight.do("feed", fail),
+            single_flight.do("feed", fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, OSError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_shared(self):
+        """Test that a call made after the previous one finished runs again."""
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append("fetch")
+            return len(calls)
+
+        assert await single_flight.do("feed", fetch) == 1
+        assert await single_flight.do("feed", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_forget_starts_new_call(self):
+        """Test that callers arriving after forget() don't join the older call."""
+        single_flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append("fetch")
+            result = len(calls)
+            await asyncio.sleep(0.01)
+            return result
+
+        first = asyncio.create_task(single_flight.do("feed", fetch))
+        await asyncio.sleep(0)
+        single_flight.forget("feed")
+        second = await single_flight.do("feed", fetch)
+
+        assert await first == 1
+        assert second == 2
@@ -0,0 +1,303 @@
+"""Tests for batched syncing across SyncManager subclasses."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.gender_manager import GenderManager
+from src.network_manager import NetworkManager
+from src.outbound_journal import OutboundJournal
+from src.score_manager import ScoreManager
+from src.sync_manager import SYNC_RETRY_MAX_DELAY, sync_pending_changes
+
+
+class TestSyncPendingChanges:
+    """Test flushing several managers through one batched write."""
+
+    @pytest.mark.asyncio
+    async def test_scores_and_gender_pushed_in_one_request(
+        self, score_manager, gender_manager, fake_matrix_portal
+    ):
+        """Test that every dirty field across managers goes out in a single request."""
+        score_manager.increment_left_score()
+        score_manager.increment_right_score()
+        gender_manager.toggle_first_point_gender()
+
+        success = await sync_pending_changes([score_manager, gender_manager])
+
+        assert success
+        assert len(fake_matrix_portal.network.io_client.group_data_calls) == 1
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED) == 1
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_RIGHT_TEAM_FEED) == 1
+        assert (
+            fake_matrix_portal.get_pushed_value(NetworkManager.FIRST_POINT_GENDER_FEED)
+            == GenderManager.GENDER_MMP
+        )
+        assert not score_manager.has_pending_changes()
+        assert not gender_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_every_manager_pending(
+        self, score_manager, gender_manager, network_manager
+    ):
+        """Test that a failed batched write leaves all managers pending."""
+        score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+
+        with patch.object(
+            network_manager, "set_feed_values", side_effect=Exception("Offline")
+        ):
+            success = await sync_pending_changes([score_manager, gender_manager])
+
+        assert not success
+        assert score_manager.has_pending_changes()
+        assert gender_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_nothing_pending_sends_nothing(
+        self, score_manager, gender_manager, fake_matrix_portal
+    ):
+        """Test that no request is made when no manager has pending changes."""
+        success = await sync_pending_changes([score_manager, gender_manager])
+
+        assert success
+        assert fake_matrix_portal.network.io_client.group_data_calls == []
+
+
+class TestSyncJournal:
+    """Test keeping unsynced changes in the journal across a reset."""
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_restored_after_reset(self, network_manager):
+        """Test that changes pending when the board resets are restored and still pending."""
+        nvm = bytearray(64)
+        journal = OutboundJournal(nvm)
+        score_manager = ScoreManager(network_manager, journal)
+        gender_manager = GenderManager(network_manager, journal)
+        score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+        with patch.object(network_manager, "set_feed_values", side_effect=Exception("Offline")):
+            await sync_pending_changes([score_manager, gender_manager])
+
+        journal = OutboundJournal(nvm)
+        restored_scores = ScoreManager(network_manager, journal)
+        restored_gender = GenderManager(network_manager, journal)
+
+        assert restored_scores.restore_from_journal()
+        assert restored_gender.restore_from_journal()
+        assert restored_scores.left_score == 1
+        assert restored_gender.get_first_point_gender() == GenderManager.GENDER_MMP
+        assert restored_scores.has_pending_changes()
+        assert restored_gender.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_successful_sync_leaves_nothing_to_restore(self, network_manager):
+        """Test that synced changes are not restored after a reset."""
+        nvm = bytearray(64)
+        score_manager = ScoreManager(network_manager, OutboundJournal(nvm))
+        score_manager.increment_left_score()
+
+        await sync_pending_changes([score_manager])
+
+        assert not ScoreManager(network_manager, OutboundJournal(nvm)).restore_from_journal()
+
+    @pytest.mark.asyncio
+    async def test_changes_during_backoff_journaled(self, network_manager, sync_clock):
+        """Test that a change made while syncs are failing is on flash before the next attempt."""
+        nvm = bytearray(64)
+        journal = OutboundJournal(nvm, min_flush_interval=0.0, clock=sync_clock)
+        score_manager = ScoreManager(network_manager, journal, clock=sync_clock)
+        score_manager.increment_left_score()
+        with patch.object(network_manager, "set_feed_values", side_effect=Exception("Offline")):
+            await score_manager.try_sync_scores()
+        score_manager.increment_left_score()
+
+        restored = ScoreManager(network_manager, OutboundJournal(nvm))
+
+        assert restored.restore_from_journal()
+        assert restored.left_score == 2
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_flush_done_by_queue(self, network_manager, sync_clock):
+        """Test that a flush put off by the rate limit is done once its interval passes."""
+        nvm = bytearray(64)
+        journal = OutboundJournal(nvm, clock=sync_clock)
+        score_manager = ScoreManager(network_manager, journal, clock=sync_clock)
+        score_manager.increment_left_score()
+        with patch.object(network_manager, "set_feed_values", side_effect=Exception("Offline")):
+            await score_manager.try_sync_scores()
+            score_manager.increment_left_score()
+            await network_manager.get_sync_queue().drain()
+            assert OutboundJournal(nvm).pending_values()[NetworkManager.SCORES_LEFT_TEAM_FEED] == 1
+
+            sync_clock.return_value += 5.0
+            await network_manager.get_sync_queue().drain()
+
+        assert OutboundJournal(nvm).pending_values()[NetworkManager.SCORES_LEFT_TEAM_FEED] == 2
+
+
+class TestSyncCoalescing:
+    """Test holding back bursts of changes so only the final value is pushed."""
+
+    @pytest.fixture
+    def clock(self):
+        """Clock whose time only moves when the test sets it."""
+        return MagicMock(return_value=100.0)
+
+    @pytest.fixture
+    def coalescing_score_manager(self, network_manager, clock):
+        """Create a ScoreManager with a 0.3 s window and 1 s maximum delay."""
+        return ScoreManager(
+            network_manager, coalesce_window=0.3, coalesce_max_delay=1.0, clock=clock
+        )
+
+    @pytest.mark.asyncio
+    async def test_burst_pushes_final_value_once(
+        self, coalescing_score_manager, fake_matrix_portal, clock
+    ):
+        """Test that presses in quick succession go out as one write of the last value."""
+        for now in (100.0, 100.125, 100.25):
+            clock.return_value = now
+            coalescing_score_manager.increment_left_score()
+            assert await sync_pending_changes([coalescing_score_manager])
+
+        assert fake_matrix_portal.network.io_client.group_data_calls == []
+
+        clock.return_value = 100.625
+        await sync_pending_changes([coalescing_score_manager])
+
+        assert len(fake_matrix_portal.network.io_client.group_data_calls) == 1
+        assert fake_matrix_portal.get_pushed_value(NetworkManager.SCORES_LEFT_TEAM_FEED) == 3
+        assert coalescing_score_manager.counters == {"writes": 1, "writes_saved": 2}
+
+    @pytest.mark.asyncio
+    async def test_max_delay_bounds_hold_back(self, coalescing_score_manager, clock):
+        """Test that changes that keep coming are pushed once the oldest waited the maximum."""
+        coalescing_score_manager.increment_left_score()
+        for now in (100.25, 100.5, 100.75):
+            clock.return_value = now
+            coalescing_score_manager.increment_left_score()
+            assert not coalescing_score_manager.is_sync_due()
+
+        clock.return_value = 101.0
+
+        assert coalescing_score_manager.is_sync_due()
+
+    @pytest.mark.asyncio
+    async def test_network_update_does_not_push_inside_window(
+        self, coalescing_score_manager, fake_matrix_portal
+    ):
+        """Test that a network update doesn't push an intermediate value on its own."""
+        coalescing_score_manager.increment_left_score()
+
+        assert not await coalescing_score_manager.update_scores_from_network()
+        assert fake_matrix_portal.network.io_client.group_data_calls == []
+        assert coalescing_score_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_due_manager_takes_others_along(self, network_manager, clock):
+        """Test that once one manager is due, every pending manager's changes go out."""
+        score_manager = ScoreManager(network_manager, coalesce_window=0.3, clock=clock)
+        gender_manager = GenderManager(network_manager, coalesce_window=0.3, clock=clock)
+        score_manager.increment_left_score()
+        clock.return_value = 100.25
+        gender_manager.toggle_first_point_gender()
+        clock.return_value = 100.375
+
+        await sync_pending_changes([score_manager, gender_manager])
+
+        assert not score_manager.has_pending_changes()
+        assert not gender_manager.has_pending_changes()
+
+
+class TestSyncRetryBackoff:
+    """Test backing off exponentially between retries of a failed sync."""
+
+    @pytest.fixture
+    def offline(self, network_manager):
+        """Make every push fail."""
+        with patch.object(
+            network_manager, "set_feed_values", side_effect=Exception("Offline")
+        ) as mock_set:
+            yield mock_set
+
+    @pytest.fixture
+    def backoff_score_manager(self, network_manager, sync_clock):
+        """Create a ScoreManager whose retry backoff has no jitter."""
+        return ScoreManager(
+            network_manager, clock=sync_clock, random_source=lambda: 0.0
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_retry_until_backoff_passes(
+        self, backoff_score_manager, offline, sync_clock
+    ):
+        """Test that a failed sync isn't retried before its backoff has passed."""
+        backoff_score_manager.increment_left_score()
+        assert not await backoff_score_manager.try_sync_scores()
+
+        sync_clock.return_value = 100.5
+        assert not backoff_score_manager.is_sync_due()
+        assert not await backoff_score_manager.try_sync_scores()
+        assert offline.call_count == 1
+
+        sync_clock.return_value = 101.0
+        assert backoff_score_manager.is_sync_due()
+        assert backoff_score_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_up_to_cap(
+        self, network_manager, offline, sync_clock
+    ):
+        """Test that each consecutive failure doubles the wait until it hits the cap."""
+        score_manager = ScoreManager(network_manager, clock=sync_clock, random_source=lambda: 0.0)
+        score_manager.increment_left_score()
+
+        waits = []
+        for _ in range(7):
+            await score_manager.try_sync_scores()
+            waits.append(score_manager.get_retry_stats()["retry_in"])
+            sync_clock.return_value += waits[-1]
+
+        assert waits == [1.0, 2.0, 4.0, 8.0, 16.0, SYNC_RETRY_MAX_DELAY, SYNC_RETRY_MAX_DELAY]
+        assert score_manager.get_retry_stats()["failures"] == 7
+
+    @pytest.mark.asyncio
+    async def test_jitter_shortens_wait(self, network_manager, offline, sync_clock):
+        """Test that jitter takes up to a quarter off the wait."""
+        score_manager = ScoreManager(network_manager, clock=sync_clock, random_source=lambda: 0.5)
+        score_manager.increment_left_score()
+
+        await score_manager.try_sync_scores()
+
+        assert score_manager.get_retry_stats()["retry_in"] == 0.875
+
+    @pytest.mark.asyncio
+    async def test_success_resets_backoff(
+        self, backoff_score_manager, network_manager, sync_clock
+    ):
+        """Test that the first successful sync resets the backoff for later failures."""
+        backoff_score_manager.increment_left_score()
+        with patch.object(network_manager, "set_feed_values", side_effect=Exception("Offline")):
+            await backoff_score_manager.try_sync_scores()
+            sync_clock.return_value = 101.0
+            await backoff_score_manager.try_sync_scores()
+        sync_clock.return_value = 103.0
+
+        assert await backoff_score_manager.try_sync_scores()
+        assert backoff_score_manager.get_retry_stats() == {"failures": 0, "retry_in": None}
+
+        backoff_score_manager.increment_left_score()
+        assert backoff_score_manager.is_sync_due()
+
+    @pytest.mark.asyncio
+    async def test_batched_sync_waits_for_backoff(
+        self, backoff_score_manager, gender_manager, offline, sync_clock
+    ):
+        """Test that sync_pending_changes sends nothing while every manager backs off."""
+        backoff_score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+        assert not await sync_pending_changes([backoff_score_manager, gender_manager])
+
+        assert await sync_pending_changes([backoff_score_manager, gender_manager])
+        assert offline.call_count == 1
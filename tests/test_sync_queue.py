@@ -0,0 +1,150 @@
+"""Tests for the priority queue of the synced managers' network work."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.gender_manager import GenderManager
+from src.network_manager import NetworkManager
+from src.request_budget import RequestBudget
+from src.score_manager import ScoreManager
+from src.sync_queue import PRIORITY_READ, SyncQueue
+
+
+class TestSyncQueueRegistration:
+    """Test that managers register themselves, ordered by priority."""
+
+    def test_managers_register_by_priority(self, network_manager, gender_manager, score_manager):
+        """Test that scores come before gender whatever order they were created in."""
+        assert network_manager.get_sync_queue().managers == [score_manager, gender_manager]
+
+    def test_local_feed_values_merged(self, network_manager, score_manager, gender_manager):
+        """Test that the queue reports the local values of every registered manager."""
+        score_manager.increment_left_score()
+
+        assert network_manager.get_sync_queue().get_local_feed_values() == {
+            NetworkManager.SCORES_LEFT_TEAM_FEED: 1,
+            NetworkManager.SCORES_RIGHT_TEAM_FEED: 0,
+            NetworkManager.FIRST_POINT_GENDER_FEED: gender_manager.get_first_point_gender(),
+        }
+
+    def test_pending_changes_tracked(self, network_manager, gender_manager):
+        """Test that a change makes the queue report a due write."""
+        sync_queue = network_manager.get_sync_queue()
+        assert not sync_queue.has_pending_changes()
+
+        gender_manager.toggle_first_point_gender()
+
+        assert sync_queue.has_pending_changes()
+        assert sync_queue.is_sync_due()
+
+
+class TestSyncQueueDrain:
+    """Test running the queued writes and actions."""
+
+    @pytest.mark.asyncio
+    async def test_writes_batched_into_one_request(
+        self, network_manager, score_manager, gender_manager, fake_matrix_portal
+    ):
+        """Test that the pending writes of all managers go out in one request."""
+        score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+
+        assert await network_manager.get_sync_queue().drain()
+
+        assert len(fake_matrix_portal.network.io_client.group_data_calls) == 1
+        assert not score_manager.has_pending_changes()
+        assert not gender_manager.has_pending_changes()
+
+    @pytest.mark.asyncio
+    async def test_actions_run_by_priority_after_writes(self, network_manager, score_manager):
+        """Test that actions run lowest priority first, after the writes."""
+        sync_queue = network_manager.get_sync_queue()
+        order = []
+
+        async def read():
+            order.append(("read", score_manager.has_pending_changes()))
+
+        async def urgent():
+            order.append(("urgent", score_manager.has_pending_changes()))
+
+        score_manager.increment_left_score()
+        sync_queue.submit(PRIORITY_READ, read)
+        sync_queue.submit(PRIORITY_READ - 1, urgent)
+
+        await sync_queue.drain()
+
+        assert order == [("urgent", False), ("read", False)]
+
+    @pytest.mark.asyncio
+    async def test_expired_action_dropped(self, network_manager):
+        """Test that an action whose deadline passed before it could run is dropped."""
+        clock = MagicMock(return_value=100.0)
+        sync_queue = SyncQueue(network_manager, clock)
+        action = MagicMock()
+        sync_queue.submit(PRIORITY_READ, action, timeout=1.0)
+        clock.return_value = 101.5
+
+        await sync_queue.drain()
+
+        action.assert_not_called()
+        assert sync_queue.counters["expired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scores_go_first_when_budget_is_short(
+        self, fake_matrix_portal, display_manager
+    ):
+        """Test that gender waits for a later write when the budget only covers scores."""
+        # Two tokens that never refill: enough for both scores, not gender as well
+        request_budget = RequestBudget(rate_per_minute=12, clock=MagicMock(return_value=0.0))
+        manager = NetworkManager(
+            fake_matrix_portal, display_manager, request_budget=request_budget
+        )
+        gender_manager = GenderManager(manager)
+        score_manager = ScoreManager(manager)
+        score_manager.increment_left_score()
+        score_manager.increment_right_score()
+        gender_manager.toggle_first_point_gender()
+
+        assert await manager.get_sync_queue().drain()
+
+        assert not score_manager.has_pending_changes()
+        assert gender_manager.has_pending_changes()
+        assert manager.get_sync_queue().counters["deferred"] == 1
+
+    @pytest.mark.asyncio
+    async def test_packed_write_cost_includes_packed_feed(
+        self, fake_matrix_portal, display_manager
+    ):
+        """Test that the packed feed counts toward the budget along with the mirrored feeds."""
+        # Two tokens that never refill: the packed feed plus the left score use both
+        request_budget = RequestBudget(rate_per_minute=12, clock=MagicMock(return_value=0.0))
+        manager = NetworkManager(
+            fake_matrix_portal, display_manager, request_budget=request_budget, packed_state=True
+        )
+        score_manager = ScoreManager(manager)
+        gender_manager = GenderManager(manager)
+        score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+
+        assert await manager.get_sync_queue().drain()
+
+        assert not score_manager.has_pending_changes()
+        assert gender_manager.has_pending_changes()
+        assert request_budget.counters["rejected"] == 0
+
+    @pytest.mark.asyncio
+    async def test_held_scores_left_out_of_due_write(
+        self, network_manager, gender_manager, fake_matrix_portal
+    ):
+        """Test that a due gender write doesn't take along counters not merged yet."""
+        score_manager = ScoreManager(network_manager, replica_id="a")
+        score_manager.increment_left_score()
+        gender_manager.toggle_first_point_gender()
+
+        assert await network_manager.get_sync_queue().drain()
+
+        assert not gender_manager.has_pending_changes()
+        assert score_manager.has_pending_changes()
+        counter_feed = NetworkManager.SCORES_LEFT_TEAM_COUNTER_FEED
+        assert fake_matrix_portal.get_pushed_value(counter_feed) is None
@@ -0,0 +1,185 @@
+"""Conformance tests run against every transport.
+
+Each transport is paired with a peer, a second board sharing the same feeds,
+so the tests can check that writes from one board reach the other.
+"""
+
+import asyncio
+import socket
+import time
+
+import pytest
+
+from fakes import FakeMatrixPortal, FakeMQTTBroker, FakeMQTTClient
+from src.network_manager import NetworkManager
+from src.transports.adafruit_io import AdafruitIOTransport
+from src.transports.lan import LanTransport
+from src.transports.memory import FeedStore, FileTransport, MemoryTransport
+from src.transports.mqtt import MqttTransport
+
+FEEDS = NetworkManager.SCORES_GROUP_FEEDS
+LEFT = NetworkManager.SCORES_LEFT_TEAM_FEED
+GENDER = NetworkManager.FIRST_POINT_GENDER_FEED
+
+
+def _free_port() -> int:
+    """Get a UDP port that is free right now."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _aio_pair(tmp_path):
+    portal = FakeMatrixPortal()
+    return AdafruitIOTransport(portal), AdafruitIOTransport(portal)
+
+
+def _memory_pair(tmp_path):
+    store = FeedStore()
+    return MemoryTransport(store), MemoryTransport(store)
+
+
+def _file_pair(tmp_path):
+    path = str(tmp_path / "feeds.json")
+    return FileTransport(path), FileTransport(path)
+
+
+def _mqtt_pair(tmp_path):
+    broker = FakeMQTTBroker()
+    return (
+        MqttTransport(FakeMQTTClient(broker), "user"),
+        MqttTransport(FakeMQTTClient(broker), "user"),
+    )
+
+
+def _lan_pair(tmp_path):
+    port = _free_port()
+    board = LanTransport(socket, board_id="board-a", port=port, interface="127.0.0.1")
+    peer = LanTransport(socket, board_id="board-b", port=port, interface="127.0.0.1")
+    try:
+        board._ensure_open()
+        peer._ensure_open()
+    except ConnectionError:
+        pytest.skip("UDP multicast is not available on loopback")
+    return board, peer
+
+
+@pytest.fixture(params=[_aio_pair, _memory_pair, _file_pair, _mqtt_pair, _lan_pair])
+def transports(request, tmp_path):
+    """Create a transport and a peer transport sharing the same feeds."""
+    pair = request.param(tmp_path)
+    yield pair
+    for transport in pair:
+        if isinstance(transport, LanTransport):
+            transport.close()
+
+
+async def _read_until(transport, condition, timeout=1.0):
+    """Read the feeds until condition(values) holds or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    values = await transport.read_many(FEEDS)
+    while not condition(values) and time.monotonic() < deadline:
+        await asyncio.sleep(0.001)
+        values = await transport.read_many(FEEDS)
+    return values
+
+
+class Recorder:
+    """Async feed update callback that records what it is called with."""
+
+    def __init__(self):
+        self.updates = []
+
+    async def __call__(self, feed_key, value):
+        self.updates.append((feed_key, value))
+
+
+class TestTransportConformance:
+    """Test the behavior every transport must share."""
+
+    @pytest.mark.asyncio
+    async def test_unwritten_feeds_read_as_none(self, transports):
+        """Test that every requested feed is in the result, None when never written."""
+        transport, _ = transports
+
+        values = await transport.read_many(FEEDS)
+
+        assert values == dict.fromkeys(FEEDS)
+
+    @pytest.mark.asyncio
+    async def test_reads_back_own_writes(self, transports):
+        """Test that values written are read back by the same board."""
+        transport, _ = transports
+
+        await transport.write_many({LEFT: 3, GENDER: "MMP"})
+        values = await transport.read_many((LEFT, GENDER))
+
+        assert {key: str(value) for key, value in values.items()} == {LEFT: "3", GENDER: "MMP"}
+
+    @pytest.mark.asyncio
+    async def test_peer_reads_writes(self, transports):
+        """Test that values written by one board reach its peer."""
+        transport, peer = transports
+
+        await peer.write_many({LEFT: 5})
+        values = await _read_until(transport, lambda values: values[LEFT] is not None)
+
+        assert str(values[LEFT]) == "5"
+
+    @pytest.mark.asyncio
+    async def test_version_changes_only_on_writes(self, transports):
+        """Test that a version, where the transport has one, moves only when a feed is written."""
+        transport, peer = transports
+        await peer.write_many({LEFT: 1})
+        await _read_until(transport, lambda values: values[LEFT] is not None)
+        first = transport.get_version(FEEDS)
+        await transport.read_many(FEEDS)
+        second = transport.get_version(FEEDS)
+
+        await peer.write_many({LEFT: 2})
+        await _read_until(transport, lambda values: str(values[LEFT]) == "2")
+        third = transport.get_version(FEEDS)
+
+        if first is None:
+            assert second is None and third is None
+        else:
+            assert second == first
+            assert third != first
+
+    @pytest.mark.asyncio
+    async def test_subscribers_get_peer_writes(self, transports):
+        """Test that a transport that pushes updates delivers a peer's writes."""
+        transport, peer = transports
+        recorder = Recorder()
+        if not transport.subscribe(recorder):
+            pytest.skip(f"{transport.name} transport is polled")
+
+        await peer.write_many({LEFT: 7})
+        await _read_until(transport, lambda values: bool(recorder.updates))
+
+        assert (LEFT, "7") in recorder.updates
+
+
+class TestNetworkManagerOverTransports:
+    """Test that NetworkManager runs the same over any transport."""
+
+    @pytest.mark.asyncio
+    async def test_batched_write_reaches_peer_snapshot(
+        self, transports, display_manager, request_budget
+    ):
+        """Test that a batched write on one board shows up in the peer's snapshot."""
+        transport, peer = transports
+        writer = NetworkManager(
+            FakeMatrixPortal(), display_manager, request_budget=request_budget, transport=peer
+        )
+        reader = NetworkManager(
+            FakeMatrixPortal(), display_manager, request_budget=request_budget, transport=transport
+        )
+
+        await writer.set_feed_values({LEFT: 4, GENDER: "MMP"})
+        await _read_until(transport, lambda values: values[LEFT] is not None)
+        snapshot = await reader.get_group_snapshot()
+
+        assert snapshot is not None
+        assert snapshot.left_score == 4
+        assert snapshot.first_point_gender == "MMP"
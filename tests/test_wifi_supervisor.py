@@ -0,0 +1,210 @@
+"""Tests for WifiSupervisor."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.wifi_supervisor import WifiSupervisor
+
+
+class FakeClock:
+    """Clock whose time only moves when advanced."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeRadio:
+    """Wi-Fi radio whose connect attempts fail until told otherwise."""
+
+    def __init__(self):
+        self.connected = False
+        self.reachable = True
+        self.connect_calls = 0
+
+    def connect(self):
+        self.connect_calls += 1
+        if not self.reachable:
+            raise ConnectionError("No access point")
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock for the supervisor's backoff."""
+    return FakeClock()
+
+
+@pytest.fixture
+def radio():
+    """Create a fake radio."""
+    return FakeRadio()
+
+
+@pytest.fixture
+def link_changes():
+    """Collect the link states the supervisor reports."""
+    return []
+
+
+@pytest.fixture
+def prewarms():
+    """Collect the pre-warm calls the supervisor makes."""
+    return []
+
+
+@pytest.fixture
+def supervisor(radio, clock, link_changes, prewarms):
+    """Create a WifiSupervisor with a 1 s base delay, 8 s cap and no jitter."""
+
+    async def prewarm():
+        prewarms.append(clock())
+
+    return WifiSupervisor(
+        radio.connect,
+        radio.is_connected,
+        on_link_change=link_changes.append,
+        prewarm=prewarm,
+        base_delay=1.0,
+        max_delay=8.0,
+        clock=clock,
+        random_source=lambda: 0.0,
+    )
+
+
+class TestWifiSupervisorConnect:
+    """Test connecting and reporting the link state."""
+
+    @pytest.mark.asyncio
+    async def test_connects_and_reports_link_up(self, supervisor, radio, link_changes):
+        """Test that the first check connects and reports the link up once."""
+        assert await supervisor.check()
+        assert await supervisor.check()
+
+        assert radio.connect_calls == 1
+        assert link_changes == [True]
+        assert supervisor.link_up
+
+    @pytest.mark.asyncio
+    async def test_prewarms_each_time_link_comes_up(
+        self, supervisor, radio, prewarms, link_changes
+    ):
+        """Test that a drop is reported and pre-warmed again even if reconnecting is instant."""
+        await supervisor.check()
+        await supervisor.check()
+        radio.connected = False
+        await supervisor.check()
+
+        assert len(prewarms) == 2
+        assert link_changes == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_reports_link_lost(self, supervisor, radio, link_changes):
+        """Test that a dropped link is reported down when reconnecting fails."""
+        await supervisor.check()
+        radio.connected = False
+        radio.reachable = False
+
+        assert not await supervisor.check()
+
+        assert link_changes == [True, False]
+        assert supervisor.counters["drops"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failure_keeps_link_up(self, radio, link_changes):
+        """Test that a failed pre-warm is logged, not treated as a link failure."""
+
+        async def prewarm():
+            raise OSError("DNS lookup failed")
+
+        supervisor = WifiSupervisor(
+            radio.connect, radio.is_connected, on_link_change=link_changes.append, prewarm=prewarm
+        )
+
+        assert await supervisor.check()
+        assert link_changes == [True]
+
+
+class TestWifiSupervisorBackoff:
+    """Test that reconnect attempts back off."""
+
+    @pytest.mark.asyncio
+    async def test_retries_back_off_exponentially(self, supervisor, radio, clock):
+        """Test that failed attempts double the wait before the next one."""
+        radio.reachable = False
+
+        attempt_times = []
+        for _ in range(16):
+            calls = radio.connect_calls
+            await supervisor.check()
+            if radio.connect_calls > calls:
+                attempt_times.append(clock.now)
+            clock.advance(1.0)
+
+        assert attempt_times == [100.0, 101.0, 103.0, 107.0, 115.0]
+
+    @pytest.mark.asyncio
+    async def test_success_resets_backoff(self, supervisor, radio, clock):
+        """Test that after reconnecting, the next drop is retried without the old delay."""
+        radio.reachable = False
+        for _ in range(3):
+            await supervisor.check()
+            clock.advance(4.0)
+        radio.reachable = True
+        await supervisor.check()
+
+        radio.connected = False
+        radio.reachable = False
+        await supervisor.check()
+        calls = radio.connect_calls
+        clock.advance(1.0)
+        await supervisor.check()
+
+        assert radio.connect_calls == calls + 1
+
+
+class TestWifiSupervisorWait:
+    """Test waiting for the link at boot."""
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_once_link_up(self, supervisor):
+        """Test that a waiter is released when a check brings the link up."""
+        await supervisor.check()
+
+        assert await supervisor.wait_for_link(0.1)
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_while_link_down(self, supervisor, radio):
+        """Test that waiting gives up after the timeout if the link stays down."""
+        radio.reachable = False
+        await supervisor.check()
+
+        assert not await supervisor.wait_for_link(0.01)
+
+    @pytest.mark.asyncio
+    async def test_wait_handles_circuitpython_timeout(self, supervisor, radio):
+        """Test that a wait_for timeout that isn't the builtin TimeoutError is caught."""
+
+        class CoreTimeoutError(Exception):
+            """Stand-in for CircuitPython's asyncio.core.TimeoutError."""
+
+        async def wait_for(awaitable, timeout):
+            awaitable.close()
+            raise CoreTimeoutError
+
+        radio.reachable = False
+        await supervisor.check()
+        with (
+            patch("src.wifi_supervisor.AsyncTimeoutError", CoreTimeoutError),
+            patch("src.wifi_supervisor.asyncio.wait_for", wait_for),
+        ):
+            assert not await supervisor.wait_for_link(0.01)